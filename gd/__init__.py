@@ -70,11 +70,13 @@ from gd.enums import (
     MiscType,
     OrbType,
     Orientation,
+    OverflowPolicy,
     PadType,
     Permissions,
     Platform,
     PlayerColor,
     PortalType,
+    ProxyStrategy,
     PulsatingObjectType,
     PulseMode,
     PulseTargetType,
@@ -84,6 +86,7 @@ from gd.enums import (
     RateFilter,
     RateType,
     RelationshipType,
+    RequestPriority,
     ResponseType,
     RewardItemType,
     RewardType,
@@ -121,6 +124,7 @@ from gd.errors import (
     LoginRequired,
     MissingAccess,
     NothingFound,
+    ReplayMissing,
     SongRestricted,
 )
 from gd.filters import Filters
@@ -301,6 +305,9 @@ __all__ = (
     "Platform",
     "Orientation",
     "ResponseType",
+    "RequestPriority",
+    "ProxyStrategy",
+    "OverflowPolicy",
     "CollectedCoins",
     "Quality",
     "Permissions",
@@ -309,6 +316,7 @@ __all__ = (
     "HTTPError",
     "HTTPErrorWithOrigin",
     "HTTPStatusError",
+    "ReplayMissing",
     "ClientError",
     "MissingAccess",
     "SongRestricted",
@@ -6,7 +6,7 @@ from attrs import define, field
 from iters.iters import iter
 from typing_extensions import TypeGuard
 
-from gd.api.hsv import HSV
+from gd.api.hsv import DEFAULT_HSV, HSV
 from gd.color import Color
 from gd.constants import BYTE
 from gd.enums import PlayerColor, SpecialColorChannelID
@@ -261,7 +261,7 @@ class CopiedColorChannel(BaseColorChannel):
 
     copied_id: int = field()
 
-    hsv: HSV = field(factory=HSV)
+    hsv: HSV = field(default=DEFAULT_HSV)
 
     opacity: Optional[float] = field(default=None)
 
@@ -278,7 +278,7 @@ class CopiedColorChannel(BaseColorChannel):
             view.get_option(COPIED_ID).map(int).extract()
         )
 
-        hsv = view.get_option(COLOR_HSV).map(HSV.from_robtop).unwrap_or_else(HSV)
+        hsv = view.get_option(COLOR_HSV).map(HSV.from_robtop).unwrap_or(DEFAULT_HSV)
 
         copy_opacity = view.get_option(COPY_OPACITY).map(int_bool).unwrap_or(DEFAULT_COPY_OPACITY)
 
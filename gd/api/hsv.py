@@ -1,4 +1,4 @@
-from attrs import define, field
+from attrs import field, frozen
 from iters.iters import iter
 from typing_aliases import Unary
 from typing_extensions import Self
@@ -7,7 +7,7 @@ from gd.models_constants import HSV_SEPARATOR
 from gd.models_utils import bool_str, concat_hsv, float_str, int_bool, split_hsv
 from gd.robtop import RobTop
 
-__all__ = ("HSV",)
+__all__ = ("DEFAULT_HSV", "HSV")
 
 S_MIN = 0.0
 V_MIN = 0.0
@@ -67,7 +67,7 @@ def round_float(string: str) -> int:
     return round(float(string))
 
 
-@define()
+@frozen()
 class HSV(RobTop):
     h: int = field(default=H_INITIAL)
     s: float = field(default=S_INITIAL)
@@ -120,3 +120,7 @@ class HSV(RobTop):
     @classmethod
     def can_be_in(cls, string: str) -> bool:
         return HSV_SEPARATOR in string
+
+
+DEFAULT_HSV = HSV()
+"""The default HSV, shared between instances since HSV values are immutable."""
@@ -35,7 +35,7 @@ from gd.api.color_channels import (
     OBJECT_COLOR_CHANNEL_ID,
     SECONDARY_GROUND_COLOR_CHANNEL_ID,
 )
-from gd.api.hsv import HSV
+from gd.api.hsv import DEFAULT_HSV, HSV
 from gd.color import Color
 from gd.constants import BYTE, DEFAULT_ID, EMPTY
 from gd.encoding import decode_base64_string_url_safe, encode_base64_string_url_safe
@@ -319,8 +319,8 @@ class Object(RobTop):
     base_color_channel_id: int = field(default=DEFAULT_ID)
     detail_color_channel_id: int = field(default=DEFAULT_ID)
 
-    base_hsv: HSV = field(factory=HSV)
-    detail_hsv: HSV = field(factory=HSV)
+    base_hsv: HSV = field(default=DEFAULT_HSV)
+    detail_hsv: HSV = field(default=DEFAULT_HSV)
 
     group_ids: GroupIDs = field(factory=GroupIDs)
 
@@ -390,8 +390,8 @@ class Object(RobTop):
                 view.get_option(DETAIL_COLOR_CHANNEL_ID).map(int).unwrap_or(DEFAULT_ID)
             )
 
-        base_hsv = view.get_option(BASE_HSV).map(HSV.from_robtop).unwrap_or_else(HSV)
-        detail_hsv = view.get_option(DETAIL_HSV).map(HSV.from_robtop).unwrap_or_else(HSV)
+        base_hsv = view.get_option(BASE_HSV).map(HSV.from_robtop).unwrap_or(DEFAULT_HSV)
+        detail_hsv = view.get_option(DETAIL_HSV).map(HSV.from_robtop).unwrap_or(DEFAULT_HSV)
 
         single_group_id = view.get_option(SINGLE_GROUP_ID).map(int).unwrap_or(DEFAULT_ID)
 
@@ -1394,7 +1394,7 @@ class CopiedColorTrigger(BaseColorTrigger):
     blending: bool = field(default=DEFAULT_BLENDING)
 
     copied_color_channel_id: int = field(default=DEFAULT_ID)
-    copied_hsv: HSV = field(factory=HSV)
+    copied_hsv: HSV = field(default=DEFAULT_HSV)
 
     opacity: Optional[float] = field(default=None)
 
@@ -1426,7 +1426,7 @@ class CopiedColorTrigger(BaseColorTrigger):
             view.get_option(COPIED_COLOR_CHANNEL_ID).map(int).unwrap_or(DEFAULT_ID)
         )
 
-        copied_hsv = view.get_option(COPIED_HSV).map(HSV.from_robtop).unwrap_or_else(HSV)
+        copied_hsv = view.get_option(COPIED_HSV).map(HSV.from_robtop).unwrap_or(DEFAULT_HSV)
 
         copy_opacity = view.get_option(COPY_OPACITY).map(int_bool).unwrap_or(DEFAULT_COPY_OPACITY)
 
@@ -1475,6 +1475,8 @@ ColorTrigger = Union[PlayerColorTrigger, NormalColorTrigger, CopiedColorTrigger]
 
 @runtime_checkable
 class Compatibility(Protocol):
+    __slots__ = ()
+
     @required
     def migrate(self) -> Object:
         ...
@@ -1660,7 +1662,7 @@ class NormalCompatibilityColorTrigger(BaseCompatibilityColorTrigger):
 @define()
 class CopiedCompatibilityColorTrigger(BaseCompatibilityColorTrigger):
     copied_color_channel_id: int = field(default=DEFAULT_ID)
-    copied_hsv: HSV = field(factory=HSV)
+    copied_hsv: HSV = field(default=DEFAULT_HSV)
 
     opacity: Optional[float] = field(default=None)
 
@@ -1689,7 +1691,7 @@ class CopiedCompatibilityColorTrigger(BaseCompatibilityColorTrigger):
             view.get_option(COPIED_COLOR_CHANNEL_ID).map(int).unwrap_or(DEFAULT_ID)
         )
 
-        copied_hsv = view.get_option(COPIED_HSV).map(HSV.from_robtop).unwrap_or_else(HSV)
+        copied_hsv = view.get_option(COPIED_HSV).map(HSV.from_robtop).unwrap_or(DEFAULT_HSV)
 
         copy_opacity = view.get_option(COPY_OPACITY).map(int_bool).unwrap_or(DEFAULT_COPY_OPACITY)
 
@@ -2115,7 +2117,7 @@ class PulseColorTrigger(BasePulseTrigger):
 @define()
 class PulseHSVTrigger(BasePulseTrigger):
     copied_color_channel_id: int = field(default=DEFAULT_ID)
-    copied_hsv: HSV = field(factory=HSV)
+    copied_hsv: HSV = field(default=DEFAULT_HSV)
 
     @classmethod
     def from_robtop_view(cls, view: RobTopView[int, str]) -> Self:
@@ -2124,7 +2126,7 @@ class PulseHSVTrigger(BasePulseTrigger):
         copied_color_channel_id = (
             view.get_option(COPIED_COLOR_CHANNEL_ID).map(int).unwrap_or(DEFAULT_ID)
         )
-        copied_hsv = view.get_option(COPIED_HSV).map(HSV.from_robtop).unwrap_or_else(HSV)
+        copied_hsv = view.get_option(COPIED_HSV).map(HSV.from_robtop).unwrap_or(DEFAULT_HSV)
 
         pulse_hsv_trigger.copied_color_channel_id = copied_color_channel_id
         pulse_hsv_trigger.copied_hsv = copied_hsv
@@ -9,6 +9,8 @@ __all__ = ("FromBinary", "ToBinary", "Binary")
 
 @runtime_checkable
 class FromBinary(Protocol):
+    __slots__ = ()
+
     @classmethod
     @required
     def from_binary(cls, binary: BufferedReader) -> Self:
@@ -32,6 +34,8 @@ class FromBinary(Protocol):
 
 @runtime_checkable
 class ToBinary(Protocol):
+    __slots__ = ()
+
     @required
     def to_binary(self, binary: BufferedWriter) -> None:
         ...
@@ -51,4 +55,4 @@ class ToBinary(Protocol):
 
 @runtime_checkable
 class Binary(FromBinary, ToBinary, Protocol):
-    pass
+    __slots__ = ()
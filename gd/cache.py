@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, TypeVar
+from collections import OrderedDict
+from time import monotonic as clock
+from typing import TYPE_CHECKING, Generic, Iterator, Optional, Tuple, TypeVar
 
 from attrs import define, field
 
+from gd.time import Clock
+
 if TYPE_CHECKING:
     from gd.artist import Artist
     from gd.comments import LevelComment, UserComment
@@ -17,10 +21,23 @@ if TYPE_CHECKING:
 __all__ = ("CacheSettings", "Cache", "CachePart")
 
 DEFAULT_SIZE = 0
+"""The default size of cache parts, which means caching is disabled."""
+
+DEFAULT_TTL = None
+"""The default time-to-live of cache parts, which means items never expire."""
 
 
 @define()
 class CacheSettings:
+    """Represents cache settings.
+
+    Sizes limit the number of items stored in each part, evicting the least recently used
+    items first; setting the size to `0` disables the part altogether.
+
+    Time-to-live values (in seconds) bound how long items are considered fresh;
+    `None` means that items never expire.
+    """
+
     artist_size: int = DEFAULT_SIZE
     user_comment_size: int = DEFAULT_SIZE
     level_comment_size: int = DEFAULT_SIZE
@@ -32,23 +49,232 @@ class CacheSettings:
     song_size: int = DEFAULT_SIZE
     user_size: int = DEFAULT_SIZE
 
+    artist_ttl: Optional[float] = DEFAULT_TTL
+    user_comment_ttl: Optional[float] = DEFAULT_TTL
+    level_comment_ttl: Optional[float] = DEFAULT_TTL
+    friend_request_ttl: Optional[float] = DEFAULT_TTL
+    gauntlet_ttl: Optional[float] = DEFAULT_TTL
+    map_pack_ttl: Optional[float] = DEFAULT_TTL
+    level_ttl: Optional[float] = DEFAULT_TTL
+    message_ttl: Optional[float] = DEFAULT_TTL
+    song_ttl: Optional[float] = DEFAULT_TTL
+    user_ttl: Optional[float] = DEFAULT_TTL
+
 
 T = TypeVar("T")
 
-CachePart = Dict[int, T]
+Entry = Tuple[T, float]
+
+
+@define()
+class CachePart(Generic[T]):
+    """Represents bounded *least recently used* caches of items keyed by their IDs."""
+
+    size: int = field(default=DEFAULT_SIZE)
+    ttl: Optional[float] = field(default=DEFAULT_TTL)
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    _clock: Clock = field(default=clock, repr=False)
+
+    _entries: OrderedDict[int, Entry[T]] = field(factory=OrderedDict, init=False, repr=False)
+
+    def is_enabled(self) -> bool:
+        return self.size > 0
+
+    def is_expired(self, created_at: float) -> bool:
+        ttl = self.ttl
+
+        if ttl is None:
+            return False
+
+        return self._clock() - created_at > ttl
+
+    def peek(self, id: int) -> Optional[T]:
+        """Fetches the item by `id` without affecting its recency or the statistics.
+
+        Arguments:
+            id: The ID of the item.
+
+        Returns:
+            The item, if present and not expired, otherwise `None`.
+        """
+        entry = self._entries.get(id)
+
+        if entry is None:
+            return None
+
+        item, created_at = entry
+
+        if self.is_expired(created_at):
+            return None
+
+        return item
+
+    def get(self, id: int) -> Optional[T]:
+        """Fetches the item by `id`, marking it as the most recently used one.
+
+        Arguments:
+            id: The ID of the item.
+
+        Returns:
+            The item, if present and not expired, otherwise `None`.
+        """
+        entries = self._entries
+
+        entry = entries.get(id)
+
+        if entry is None:
+            self.misses += 1
+
+            return None
+
+        item, created_at = entry
+
+        if self.is_expired(created_at):
+            del entries[id]
+
+            self.misses += 1
+
+            return None
+
+        entries.move_to_end(id)
+
+        self.hits += 1
+
+        return item
+
+    def put(self, id: int, item: T) -> None:
+        """Stores the `item` by `id`, evicting the least recently used items if needed.
+
+        Arguments:
+            id: The ID of the item.
+            item: The item to store.
+        """
+        size = self.size
+
+        if size <= 0:
+            return
+
+        entries = self._entries
+
+        entries[id] = (item, self._clock())
+
+        entries.move_to_end(id)
+
+        while len(entries) > size:
+            entries.popitem(last=False)
+
+    def remove(self, id: int) -> Optional[T]:
+        entry = self._entries.pop(id, None)
+
+        if entry is None:
+            return None
+
+        item, _ = entry
+
+        return item
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, id: int) -> bool:
+        return self.peek(id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._entries)
 
 
 @define()
 class Cache:
     settings: CacheSettings = field(factory=CacheSettings)
 
-    artists: CachePart[Artist] = field(factory=dict)
-    user_comments: CachePart[UserComment] = field(factory=dict)
-    level_comments: CachePart[LevelComment] = field(factory=dict)
-    friend_requests: CachePart[FriendRequest] = field(factory=dict)
-    gauntlets: CachePart[Gauntlet] = field(factory=dict)
-    map_packs: CachePart[MapPack] = field(factory=dict)
-    levels: CachePart[Level] = field(factory=dict)
-    messages: CachePart[Message] = field(factory=dict)
-    songs: CachePart[Song] = field(factory=dict)
-    users: CachePart[User] = field(factory=dict)
+    artists: CachePart[Artist] = field(init=False)
+    user_comments: CachePart[UserComment] = field(init=False)
+    level_comments: CachePart[LevelComment] = field(init=False)
+    friend_requests: CachePart[FriendRequest] = field(init=False)
+    gauntlets: CachePart[Gauntlet] = field(init=False)
+    map_packs: CachePart[MapPack] = field(init=False)
+    levels: CachePart[Level] = field(init=False)
+    messages: CachePart[Message] = field(init=False)
+    songs: CachePart[Song] = field(init=False)
+    users: CachePart[User] = field(init=False)
+
+    @artists.default
+    def default_artists(self) -> CachePart[Artist]:
+        settings = self.settings
+
+        return CachePart(settings.artist_size, settings.artist_ttl)
+
+    @user_comments.default
+    def default_user_comments(self) -> CachePart[UserComment]:
+        settings = self.settings
+
+        return CachePart(settings.user_comment_size, settings.user_comment_ttl)
+
+    @level_comments.default
+    def default_level_comments(self) -> CachePart[LevelComment]:
+        settings = self.settings
+
+        return CachePart(settings.level_comment_size, settings.level_comment_ttl)
+
+    @friend_requests.default
+    def default_friend_requests(self) -> CachePart[FriendRequest]:
+        settings = self.settings
+
+        return CachePart(settings.friend_request_size, settings.friend_request_ttl)
+
+    @gauntlets.default
+    def default_gauntlets(self) -> CachePart[Gauntlet]:
+        settings = self.settings
+
+        return CachePart(settings.gauntlet_size, settings.gauntlet_ttl)
+
+    @map_packs.default
+    def default_map_packs(self) -> CachePart[MapPack]:
+        settings = self.settings
+
+        return CachePart(settings.map_pack_size, settings.map_pack_ttl)
+
+    @levels.default
+    def default_levels(self) -> CachePart[Level]:
+        settings = self.settings
+
+        return CachePart(settings.level_size, settings.level_ttl)
+
+    @messages.default
+    def default_messages(self) -> CachePart[Message]:
+        settings = self.settings
+
+        return CachePart(settings.message_size, settings.message_ttl)
+
+    @songs.default
+    def default_songs(self) -> CachePart[Song]:
+        settings = self.settings
+
+        return CachePart(settings.song_size, settings.song_ttl)
+
+    @users.default
+    def default_users(self) -> CachePart[User]:
+        settings = self.settings
+
+        return CachePart(settings.user_size, settings.user_ttl)
+
+    def clear(self) -> None:
+        self.artists.clear()
+        self.user_comments.clear()
+        self.level_comments.clear()
+        self.friend_requests.clear()
+        self.gauntlets.clear()
+        self.map_packs.clear()
+        self.levels.clear()
+        self.messages.clear()
+        self.songs.clear()
+        self.users.clear()
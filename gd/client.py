@@ -1,20 +1,24 @@
 from __future__ import annotations
 
-from asyncio import run
+from asyncio import Semaphore, gather, run
 from builtins import setattr as set_attribute
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
     Awaitable,
+    Dict,
     Generator,
     Generic,
     Iterable,
     Iterator,
+    List,
     Optional,
     Tuple,
     Type,
     TypeVar,
+    Union,
 )
 
 from attrs import define, field, frozen
@@ -36,6 +40,7 @@ from gd.constants import (
     COMMENT_PAGE_SIZE,
     DEFAULT_CHEST_COUNT,
     DEFAULT_COINS,
+    DEFAULT_CONCURRENCY,
     DEFAULT_COUNT,
     DEFAULT_DELAY,
     DEFAULT_FRIEND_STATE,
@@ -56,6 +61,7 @@ from gd.constants import (
     DEFAULT_USE_CLIENT,
     DEFAULT_VERSION,
     EMPTY,
+    SEARCH_MANY_PAGE_SIZE,
     UNNAMED,
 )
 from gd.credentials import Credentials
@@ -95,14 +101,15 @@ from gd.events.listeners import (
     WeeklyCommentListener,
     WeeklyListener,
 )
+from gd.events.sharding import ShardedController
 from gd.filters import Filters
 from gd.friend_requests import FriendRequest, FriendRequestReference
 from gd.level_packs import Gauntlet, MapPack
 from gd.levels import Level, LevelReference
 from gd.messages import Message, MessageReference
-from gd.queries import EMPTY_QUERY, query
+from gd.queries import EMPTY_QUERY, query, query_parts
 from gd.rewards import Chest, Quest
-from gd.run_iterables import run_iterables
+from gd.run_iterables import Page, crawl_pages, stream_iterables
 from gd.session import Session
 from gd.songs import Song, SongReference
 from gd.users import User, UserReference
@@ -118,7 +125,7 @@ if TYPE_CHECKING:
     from gd.api.recording import Recording
     from gd.capacity import Capacity
     from gd.http import HTTPClient
-    from gd.models import LevelModel, SearchLevelsResponseModel
+    from gd.models import LevelModel, SearchLevelsResponseModel, SongModel, TimelyInfoModel
     from gd.password import Password
     from gd.queries import Query
     from gd.typing import URLString
@@ -160,12 +167,16 @@ def by_id(id: int) -> Predicate[Comment]:
 
 CONTROLLER_ALREADY_CREATED = "controller was already created"
 
+CONTROLLER = "_controller"
+
 NO_DATABASE = "`database` not attached to the client"
 
 DEFAULT_LOAD_AFTER_POST = True
 
 C = TypeVar("C", bound="Client")
 
+AnyController = Union[Controller, ShardedController]
+
 
 @define(slots=False)
 class Client:
@@ -185,7 +196,15 @@ class Client:
     """Whether to load items after posting them."""
 
     _listeners: DynamicTuple[Listener] = field(default=(), repr=False, init=False)
-    _controller: Optional[Controller] = field(default=None, repr=False, init=False)
+    _controller: Optional[AnyController] = field(default=None, repr=False, init=False)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # controllers hold event loops and threads, which can not be sent between processes
+        state = vars(self).copy()
+
+        state[CONTROLLER] = None
+
+        return state
 
     def apply_items(
         self,
@@ -531,6 +550,14 @@ class Client:
         Returns:
             The [`User`][gd.user.User] fetched.
         """
+        users = self.cache.users
+
+        if not friend_state:  # friend state depends on the client, so it is never cached
+            user = users.get(account_id)
+
+            if user is not None:
+                return user
+
         if friend_state:  # if we need to fetch friend state
             check_client_login(self)
 
@@ -548,10 +575,15 @@ class Client:
 
         search_model = await self.session.search_user(query(profile_model.id))  # search by ID
 
-        return User.from_search_user_and_profile_models(search_model, profile_model).attach_client(
+        user = User.from_search_user_and_profile_models(search_model, profile_model).attach_client(
             self
         )
 
+        if not friend_state:  # only complete users are cached
+            users.put(account_id, user)
+
+        return user
+
     async def search_user(
         self,
         query: Query,
@@ -581,26 +613,41 @@ class Client:
             search_user_model, profile_model
         ).attach_client(self)
 
+    async def search_users_with_page(self, query: Query, page: int = DEFAULT_PAGE) -> Page[User]:
+        search_users_response_model = await self.session.search_users_on_page(
+            query=query, page=page
+        )
+
+        users = [
+            User.from_search_user_model(search_user_model).attach_client(self)
+            for search_user_model in search_users_response_model.users
+        ]
+
+        return Page(users, search_users_response_model.page)
+
     @wrap_async_iter
     async def search_users_on_page(
         self, query: Query, page: int = DEFAULT_PAGE
     ) -> AsyncIterator[User]:
-        search_users_response_model = await self.session.search_users_on_page(
-            query=query, page=page
-        )
+        users_page = await self.search_users_with_page(query=query, page=page)
 
-        for search_user_model in search_users_response_model.users:
-            yield User.from_search_user_model(search_user_model).attach_client(self)
+        for user in users_page.items:
+            yield user
 
     @wrap_async_iter
     def search_users(
         self,
         query: Query,
-        pages: Iterable[int] = DEFAULT_PAGES,
+        pages: Optional[Iterable[int]] = DEFAULT_PAGES,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> AsyncIterator[User]:
-        return run_iterables(
+        if pages is None:
+            return crawl_pages(partial(self.search_users_with_page, query))
+
+        return stream_iterables(
             (self.search_users_on_page(query=query, page=page).unwrap() for page in pages),
             ClientError,
+            concurrency=concurrency,
         )
 
     @wrap_async_iter
@@ -682,11 +729,48 @@ class Client:
         return await self.get_timely(TimelyType.EVENT, use_client=use_client)
 
     async def get_timely(self, type: TimelyType, use_client: bool = DEFAULT_USE_CLIENT) -> Level:
-        timely_model = await self.session.get_timely_info(type=type)
+        timely_info = await self.get_timely_info(type)
+
+        return await self.get_timely_level(timely_info, use_client=use_client)
+
+    async def get_daily_info(self) -> TimelyInfoModel:
+        return await self.get_timely_info(TimelyType.DAILY)
+
+    async def get_weekly_info(self) -> TimelyInfoModel:
+        return await self.get_timely_info(TimelyType.WEEKLY)
 
-        level = await self.get_level(type.into_timely_id().value, use_client=use_client)
+    async def get_event_info(self) -> TimelyInfoModel:
+        return await self.get_timely_info(TimelyType.EVENT)
 
-        return level.update_with_timely_model(timely_model)
+    async def get_timely_info(self, type: TimelyType) -> TimelyInfoModel:
+        """Fetches the timely information, that is, the timely ID and the time left,
+        without downloading the level itself.
+
+        This is a single lightweight request, which makes it suitable for polling.
+
+        Arguments:
+            type: The type of the timely level.
+
+        Returns:
+            The timely information.
+        """
+        return await self.session.get_timely_info(type=type)
+
+    async def get_timely_level(
+        self, timely_info: TimelyInfoModel, use_client: bool = DEFAULT_USE_CLIENT
+    ) -> Level:
+        """Downloads the timely level described by `timely_info`.
+
+        Arguments:
+            timely_info: The timely information, as returned by
+                [`get_timely_info`][gd.client.Client.get_timely_info].
+
+        Returns:
+            The timely level.
+        """
+        level = await self.get_level(timely_info.type.into_timely_id().value, use_client=use_client)
+
+        return level.update_with_timely_model(timely_info)
 
     async def get_level(
         self,
@@ -696,6 +780,12 @@ class Client:
     ) -> Level:
         get_data = get_data or level_id < 0
 
+        if level_id > 0:  # timely levels are fetched using negative IDs, which are not cached
+            level = self.cache.levels.get(level_id)
+
+            if level is not None and (level.has_data() or not get_data):
+                return level
+
         if get_data:
             if use_client:
                 check_client_login(self)
@@ -719,53 +809,209 @@ class Client:
             raise InternalError  # TODO: message?
 
         if get_data:
-            return Level.from_model(model, level.creator, level.song).attach_client(self)
+            level = Level.from_model(model, level.creator, level.song).attach_client(self)
+
+            self.cache_level(level)
 
         return level
 
-    @wrap_async_iter
-    async def search_levels_on_page(
+    async def get_levels(
+        self,
+        level_ids: Iterable[int],
+        get_data: bool = DEFAULT_GET_DATA,
+        use_client: bool = DEFAULT_USE_CLIENT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> List[Level]:
+        """Fetches levels by their IDs in bulk.
+
+        Metadata (including creators and songs) is resolved by searching for
+        `SEARCH_MANY_PAGE_SIZE` IDs (one page of results) per request,
+        instead of one search per level; each search is crawled until exhausted,
+        in case the server returns fewer levels per page.
+        If `get_data` is set, level data is then downloaded concurrently.
+
+        Arguments:
+            level_ids: The IDs of the levels to fetch.
+            get_data: Whether to download level data.
+            use_client: Whether to use the client account when downloading level data.
+            concurrency: The maximum number of concurrent requests.
+
+        Returns:
+            The levels found, in the order of `level_ids`; missing levels are skipped.
+        """
+        if use_client and get_data:
+            check_client_login(self)
+
+        ids = list(dict.fromkeys(level_ids))
+
+        levels_cache = self.cache.levels
+
+        found: Dict[int, Level] = {}
+
+        for level_id in ids:
+            level = levels_cache.get(level_id)
+
+            if level is not None and (level.has_data() or not get_data):
+                found[level_id] = level
+
+        missing = [level_id for level_id in ids if level_id not in found]
+
+        semaphore = Semaphore(concurrency)
+
+        filters = Filters.search_many()
+
+        async def search_chunk(chunk: List[int]) -> List[Level]:
+            async with semaphore:
+                return await self.search_levels(
+                    query_parts(tuple(chunk)), pages=None, filters=filters
+                ).list()
+
+        chunks = (
+            missing[index : index + SEARCH_MANY_PAGE_SIZE]
+            for index in range(0, len(missing), SEARCH_MANY_PAGE_SIZE)
+        )
+
+        for levels in await gather(*map(search_chunk, chunks)):
+            for level in levels:
+                found[level.id] = level
+
+        if get_data:
+
+            async def download(level: Level) -> None:
+                async with semaphore:
+                    if use_client:
+                        response_model = await self.session.get_level(
+                            level_id=level.id,
+                            account_id=self.account_id,
+                            hashed_password=self.hashed_password,
+                        )
+
+                    else:
+                        response_model = await self.session.get_level(level.id)
+
+                level = Level.from_model(
+                    response_model.level, level.creator, level.song
+                ).attach_client(self)
+
+                self.cache_level(level)
+
+                found[level.id] = level
+
+            await gather(*(download(level) for level in found.values() if not level.has_data()))
+
+        return [found[level_id] for level_id in ids if level_id in found]
+
+    def cache_level(self, level: Level) -> None:
+        """Stores the `level` in the [`cache`][gd.client.Client.cache].
+
+        If the `level` has no data, while the cached level of the same version has it,
+        the data is carried over instead of being discarded.
+
+        Arguments:
+            level: The level to cache.
+        """
+        levels = self.cache.levels
+
+        if not levels.is_enabled():
+            return
+
+        if not level.has_data():
+            cached = levels.peek(level.id)
+
+            if cached is not None and cached.has_data() and cached.version == level.version:
+                level.unprocessed_data = cached.unprocessed_data
+
+        levels.put(level.id, level)
+
+    def cache_song_models(self, models: Iterable[SongModel]) -> None:
+        songs = self.cache.songs
+
+        if not songs.is_enabled():
+            return
+
+        for model in models:
+            songs.put(model.id, Song.from_model(model).attach_client(self))
+
+    async def search_levels_with_page(
         self,
         query: Query = EMPTY_QUERY,
         page: int = DEFAULT_PAGE,
         filters: Optional[Filters] = None,
         user: Optional[UserReference] = None,
         gauntlet: Optional[int] = None,
-    ) -> AsyncIterator[Level]:
+    ) -> Page[Level]:
         if user is None:
             user_id = None
 
         else:
             user_id = user.id
 
+        response_model = await self.session.search_levels_on_page(
+            query=query,
+            page=page,
+            filters=filters,
+            user_id=user_id,
+            gauntlet=gauntlet,
+            client_account_id=self.account_id,
+            client_user_id=self.id,
+            hashed_password=self.hashed_password,
+        )
+
+        self.cache_song_models(response_model.songs)
+
+        levels = []
+
+        for model, creator, song in self.level_models_from_model(response_model):
+            level = Level.from_model(model, creator, song).attach_client(self)
+
+            self.cache_level(level)
+
+            levels.append(level)
+
+        return Page(levels, response_model.page)
+
+    @wrap_async_iter
+    async def search_levels_on_page(
+        self,
+        query: Query = EMPTY_QUERY,
+        page: int = DEFAULT_PAGE,
+        filters: Optional[Filters] = None,
+        user: Optional[UserReference] = None,
+        gauntlet: Optional[int] = None,
+    ) -> AsyncIterator[Level]:
         try:
-            response_model = await self.session.search_levels_on_page(
-                query=query,
-                page=page,
-                filters=filters,
-                user_id=user_id,
-                gauntlet=gauntlet,
-                client_account_id=self.account_id,
-                client_user_id=self.id,
-                hashed_password=self.hashed_password,
+            levels_page = await self.search_levels_with_page(
+                query=query, page=page, filters=filters, user=user, gauntlet=gauntlet
             )
 
         except NothingFound:
             return
 
-        for model, creator, song in self.level_models_from_model(response_model):
-            yield Level.from_model(model, creator, song).attach_client(self)
+        for level in levels_page.items:
+            yield level
 
     @wrap_async_iter
     def search_levels(
         self,
         query: Query = EMPTY_QUERY,
-        pages: Iterable[int] = DEFAULT_PAGES,
+        pages: Optional[Iterable[int]] = DEFAULT_PAGES,
         filters: Optional[Filters] = None,
         user: Optional[UserReference] = None,
         gauntlet: Optional[int] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> AsyncIterator[Level]:
-        return run_iterables(
+        if pages is None:
+            return crawl_pages(
+                partial(
+                    self.search_levels_with_page,
+                    query,
+                    filters=filters,
+                    user=user,
+                    gauntlet=gauntlet,
+                )
+            )
+
+        return stream_iterables(
             (
                 self.search_levels_on_page(
                     query=query,
@@ -777,6 +1023,7 @@ class Client:
                 for page in pages
             ),
             ClientError,
+            concurrency=concurrency,
         )
 
     @check_login
@@ -988,35 +1235,52 @@ class Client:
             hashed_password=self.hashed_password,
         )
 
+    @check_login
+    async def get_messages_with_page(
+        self, type: MessageType = MessageType.DEFAULT, page: int = DEFAULT_PAGE
+    ) -> Page[Message]:
+        response_model = await self.session.get_messages_on_page(
+            type=type,
+            page=page,
+            account_id=self.account_id,
+            hashed_password=self.hashed_password,
+        )
+
+        messages = [
+            Message.from_model(model).attach_client(self) for model in response_model.messages
+        ]
+
+        return Page(messages, response_model.page)
+
     @wrap_async_iter
     @check_login
     async def get_messages_on_page(
         self, type: MessageType = MessageType.DEFAULT, page: int = DEFAULT_PAGE
     ) -> AsyncIterator[Message]:
         try:
-            response_model = await self.session.get_messages_on_page(
-                type=type,
-                page=page,
-                account_id=self.account_id,
-                hashed_password=self.hashed_password,
-            )
+            messages_page = await self.get_messages_with_page(type=type, page=page)
 
         except NothingFound:
             return
 
-        for model in response_model.messages:
-            yield Message.from_model(model).attach_client(self)
+        for message in messages_page.items:
+            yield message
 
     @wrap_async_iter
     @check_login
     def get_messages(
         self,
         type: MessageType = MessageType.DEFAULT,
-        pages: Iterable[int] = DEFAULT_PAGES,
+        pages: Optional[Iterable[int]] = DEFAULT_PAGES,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> AsyncIterator[Message]:
-        return run_iterables(
+        if pages is None:
+            return crawl_pages(partial(self.get_messages_with_page, type))
+
+        return stream_iterables(
             (self.get_messages_on_page(type=type, page=page).unwrap() for page in pages),
             ClientError,
+            concurrency=concurrency,
         )
 
     @check_login
@@ -1091,10 +1355,12 @@ class Client:
         self,
         type: FriendRequestType = FriendRequestType.DEFAULT,
         pages: Iterable[int] = DEFAULT_PAGES,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> AsyncIterator[FriendRequest]:
-        return run_iterables(
+        return stream_iterables(
             (self.get_friend_requests_on_page(type=type, page=page).unwrap() for page in pages),
             ClientError,
+            concurrency=concurrency,
         )
 
     @check_login
@@ -1230,10 +1496,12 @@ class Client:
         self,
         user: UserReference,
         pages: Iterable[int] = DEFAULT_PAGES,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> AsyncIterator[UserComment]:
-        return run_iterables(
+        return stream_iterables(
             (self.get_user_comments_on_page(user=user, page=page).unwrap() for page in pages),
             ClientError,
+            concurrency=concurrency,
         )
 
     @wrap_async_iter
@@ -1265,15 +1533,38 @@ class Client:
         count: int = COMMENT_PAGE_SIZE,
         pages: Iterable[int] = DEFAULT_PAGES,
         strategy: CommentStrategy = CommentStrategy.DEFAULT,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> AsyncIterator[LevelComment]:
-        return run_iterables(
+        return stream_iterables(
             (
                 self.get_user_level_comments_on_page(user=user, count=count, page=page).unwrap()
                 for page in pages
             ),
             ClientError,
+            concurrency=concurrency,
         )
 
+    async def get_level_comments_with_page(
+        self,
+        level: LevelReference,
+        count: int = COMMENT_PAGE_SIZE,
+        page: int = DEFAULT_PAGE,
+        strategy: CommentStrategy = CommentStrategy.DEFAULT,
+    ) -> Page[LevelComment]:
+        response_model = await self.session.get_level_comments_on_page(
+            level_id=level.id,
+            count=count,
+            page=page,
+            strategy=strategy,
+        )
+
+        comments = [
+            LevelComment.from_model(model, name=level.name).attach_client(self)
+            for model in response_model.comments
+        ]
+
+        return Page(comments, response_model.page)
+
     @wrap_async_iter
     async def get_level_comments_on_page(
         self,
@@ -1283,19 +1574,14 @@ class Client:
         strategy: CommentStrategy = CommentStrategy.DEFAULT,
     ) -> AsyncIterator[LevelComment]:
         try:
-            response_model = await self.session.get_level_comments_on_page(
-                level_id=level.id,
-                count=count,
-                page=page,
-                strategy=strategy,
+            comments_page = await self.get_level_comments_with_page(
+                level=level, count=count, page=page, strategy=strategy
             )
 
         except NothingFound:
             return
 
-        for model in response_model.comments:
-            comment = LevelComment.from_model(model, name=level.name).attach_client(self)
-
+        for comment in comments_page.items:
             yield comment
 
     @wrap_async_iter
@@ -1303,10 +1589,16 @@ class Client:
         self,
         level: LevelReference,
         count: int = COMMENT_PAGE_SIZE,
-        pages: Iterable[int] = DEFAULT_PAGES,
+        pages: Optional[Iterable[int]] = DEFAULT_PAGES,
         strategy: CommentStrategy = CommentStrategy.DEFAULT,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> AsyncIterator[LevelComment]:
-        return run_iterables(
+        if pages is None:
+            return crawl_pages(
+                partial(self.get_level_comments_with_page, level, count, strategy=strategy)
+            )
+
+        return stream_iterables(
             (
                 self.get_level_comments_on_page(
                     level=level, count=count, page=page, strategy=strategy
@@ -1314,6 +1606,7 @@ class Client:
                 for page in pages
             ),
             ClientError,
+            concurrency=concurrency,
         )
 
     @wrap_async_iter
@@ -1331,10 +1624,13 @@ class Client:
             yield MapPack.from_model(model).attach_client(self)
 
     @wrap_async_iter
-    def get_map_packs(self, pages: Iterable[int] = DEFAULT_PAGES) -> AsyncIterator[MapPack]:
-        return run_iterables(
+    def get_map_packs(
+        self, pages: Iterable[int] = DEFAULT_PAGES, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> AsyncIterator[MapPack]:
+        return stream_iterables(
             (self.get_map_packs_on_page(page=page).unwrap() for page in pages),
             ClientError,
+            concurrency=concurrency,
         )
 
     @wrap_async_iter
@@ -1380,16 +1676,30 @@ class Client:
             yield Artist.from_model(model).attach_client(self)
 
     @wrap_async_iter
-    def get_artists(self, pages: Iterable[int] = DEFAULT_PAGES) -> AsyncIterator[Artist]:
-        return run_iterables(
+    def get_artists(
+        self, pages: Iterable[int] = DEFAULT_PAGES, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> AsyncIterator[Artist]:
+        return stream_iterables(
             (self.get_artists_on_page(page=page).unwrap() for page in pages),
             ClientError,
+            concurrency=concurrency,
         )
 
     async def get_song(self, song_id: int) -> Song:
+        songs = self.cache.songs
+
+        song = songs.get(song_id)
+
+        if song is not None:
+            return song
+
         model = await self.session.get_song(song_id=song_id)
 
-        return Song.from_model(model).attach_client(self)
+        song = Song.from_model(model).attach_client(self)
+
+        songs.put(song_id, song)
+
+        return song
 
     async def get_newgrounds_song(self, song_id: int) -> Song:
         model = await self.session.get_newgrounds_song(song_id=song_id)
@@ -1407,11 +1717,15 @@ class Client:
 
     @wrap_async_iter
     def search_newgrounds_songs(
-        self, query: str, pages: Iterable[int] = DEFAULT_PAGES
+        self,
+        query: str,
+        pages: Iterable[int] = DEFAULT_PAGES,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> AsyncIterator[Song]:
-        return run_iterables(
+        return stream_iterables(
             (self.search_newgrounds_songs_on_page(query=query, page=page) for page in pages),
             ClientError,
+            concurrency=concurrency,
         )
 
     @wrap_async_iter
@@ -1425,11 +1739,15 @@ class Client:
 
     @wrap_async_iter
     def search_newgrounds_artists(
-        self, query: str, pages: Iterable[int] = DEFAULT_PAGES
+        self,
+        query: str,
+        pages: Iterable[int] = DEFAULT_PAGES,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> AsyncIterator[Artist]:
-        return run_iterables(
+        return stream_iterables(
             (self.search_newgrounds_artists_on_page(query=query, page=page) for page in pages),
             ClientError,
+            concurrency=concurrency,
         )
 
     @wrap_async_iter
@@ -1445,14 +1763,18 @@ class Client:
 
     @wrap_async_iter
     def get_newgrounds_artist_songs(
-        self, artist: Artist, pages: Iterable[int] = DEFAULT_PAGES
+        self,
+        artist: Artist,
+        pages: Iterable[int] = DEFAULT_PAGES,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> AsyncIterator[Song]:
-        return run_iterables(
+        return stream_iterables(
             (
                 self.get_newgrounds_artist_songs_on_page(artist=artist, page=page).unwrap()
                 for page in pages
             ),
             ClientError,
+            concurrency=concurrency,
         )
 
     # handlers
@@ -1907,6 +2229,28 @@ class Client:
 
         return controller
 
+    def create_sharded_controller(self, shards: Optional[int] = None) -> ShardedController:
+        """Creates the [`ShardedController`][gd.events.sharding.ShardedController],
+        which partitions the listeners of the client across `shards` worker processes.
+
+        Arguments:
+            shards: The number of worker processes to use, defaulting to the CPU count.
+
+        Returns:
+            The sharded controller created.
+        """
+        self.check_controller()
+
+        if shards is None:
+            controller = ShardedController(self._listeners)
+
+        else:
+            controller = ShardedController(self._listeners, shards)
+
+        self._controller = controller
+
+        return controller
+
 
 E = TypeVar("E", bound=AnyError)
 
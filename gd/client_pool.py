@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+from asyncio import Semaphore, create_task, gather
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from attrs import define, field
+from typing_aliases import Unary
+from typing_extensions import Concatenate, ParamSpec
+
+from gd.cache import Cache
+from gd.client import Client
+from gd.credentials import Credentials
+from gd.rate_limiter import RateLimit, RateLimiter
+from gd.session import Session
+
+__all__ = ("ClientPool", "PooledClient")
+
+P = ParamSpec("P")
+T = TypeVar("T")
+U = TypeVar("U")
+
+ClientFunction = Callable[[Client, U], Awaitable[T]]
+
+DEFAULT_CONCURRENCY_PER_ACCOUNT = 1
+"""The default number of operations each account runs at once."""
+
+EXPECTED_LOGGED_IN = "expected the client to be logged in"
+EXPECTED_POSITIVE_CONCURRENCY = "expected `concurrency` to be positive"
+EXPECTED_POSITIVE_CONCURRENCY_PER_ACCOUNT = "expected `concurrency_per_account` to be positive"
+NO_CLIENTS = "the pool has no clients"
+
+
+@define()
+class PooledClient:
+    """Represents clients within [`ClientPool`][gd.client_pool.ClientPool],
+    along with their scheduling state.
+    """
+
+    client: Client = field()
+    semaphore: Semaphore = field(repr=False)
+
+    in_flight: int = field(default=0)
+    completed: int = field(default=0)
+
+    @property
+    def account_id(self) -> int:
+        return self.client.account_id
+
+
+@define()
+class ClientPool:
+    """Represents pools of logged-in clients, scheduling authenticated work across them.
+
+    All clients share one [`Session`][gd.session.Session] (and therefore one
+    [`HTTPClient`][gd.http.HTTPClient] along with its connection pool)
+    and one [`Cache`][gd.cache.Cache].
+
+    Each account runs at most `concurrency_per_account` operations at once,
+    and if `account_limit` is given, the requests of each account are additionally
+    throttled by the rate limiter of the shared HTTP client.
+
+    Example:
+        ```python
+        pool = ClientPool(account_limit=RateLimit.per_minute(30))
+
+        for name, hashed_password in accounts:
+            await pool.login(name, hashed_password)
+
+        pages = await pool.broadcast(Client.get_messages_with_page)
+        ```
+    """
+
+    session: Session = field(factory=Session)
+    """The session shared by the clients."""
+
+    cache: Cache = field(factory=Cache, repr=False)
+    """The cache shared by the clients."""
+
+    concurrency_per_account: int = field(default=DEFAULT_CONCURRENCY_PER_ACCOUNT)
+    """The maximum number of operations each account runs at once."""
+
+    account_limit: Optional[RateLimit] = field(default=None)
+    """The rate limit applied to each account."""
+
+    _clients: Dict[int, PooledClient] = field(factory=dict, init=False, repr=False)
+
+    @concurrency_per_account.validator
+    def check_concurrency_per_account(self, attribute: object, value: int) -> None:
+        if value < 1:
+            raise ValueError(EXPECTED_POSITIVE_CONCURRENCY_PER_ACCOUNT)
+
+    def __attrs_post_init__(self) -> None:
+        account_limit = self.account_limit
+
+        if account_limit is None:
+            return
+
+        http = self.session.http
+
+        rate_limiter = http.rate_limiter
+
+        if rate_limiter is None:
+            http.rate_limiter = RateLimiter(account_limit=account_limit)
+
+        else:
+            rate_limiter.account_limit = account_limit
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @property
+    def clients(self) -> List[Client]:
+        """The clients in the pool."""
+        return [pooled.client for pooled in self._clients.values()]
+
+    @property
+    def pooled(self) -> List[PooledClient]:
+        """The clients in the pool, along with their scheduling state."""
+        return list(self._clients.values())
+
+    def create_client(self, credentials: Optional[Credentials] = None) -> Client:
+        client = Client(session=self.session, cache=self.cache)
+
+        if credentials is not None:
+            client.apply_items(credentials)
+
+        return client
+
+    def add(self, client: Client) -> Client:
+        """Adds the logged-in `client` to the pool.
+
+        The client is made to use the session and the cache of the pool.
+
+        Arguments:
+            client: The client to add.
+
+        Raises:
+            ValueError: The client is not logged in.
+
+        Returns:
+            The client added.
+        """
+        if not client.is_logged_in():
+            raise ValueError(EXPECTED_LOGGED_IN)
+
+        client.session = self.session
+        client.cache = self.cache
+
+        self._clients[client.account_id] = PooledClient(
+            client, Semaphore(self.concurrency_per_account)
+        )
+
+        return client
+
+    def add_credentials(self, credentials: Credentials) -> Client:
+        """Adds the client with the given `credentials` to the pool, without confirming them.
+
+        Arguments:
+            credentials: The credentials of the client.
+
+        Returns:
+            The client added.
+        """
+        return self.add(self.create_client(credentials))
+
+    async def login(self, name: str, hashed_password: str) -> Client:
+        """Logs into the account and adds the client to the pool.
+
+        Arguments:
+            name: The name of the account.
+            hashed_password: The hashed password of the account.
+
+        Returns:
+            The client added.
+        """
+        client = self.create_client()
+
+        await client.try_login(name, hashed_password)
+
+        return self.add(client)
+
+    def remove(self, account_id: int) -> Optional[Client]:
+        """Removes the client of the account with the given `account_id` from the pool.
+
+        Arguments:
+            account_id: The ID of the account.
+
+        Returns:
+            The client removed, if it was in the pool.
+        """
+        pooled = self._clients.pop(account_id, None)
+
+        if pooled is None:
+            return None
+
+        return pooled.client
+
+    def get(self, account_id: int) -> Optional[Client]:
+        pooled = self._clients.get(account_id)
+
+        if pooled is None:
+            return None
+
+        return pooled.client
+
+    def select(self) -> PooledClient:
+        """Selects the least busy client, preferring the ones that completed less work.
+
+        Raises:
+            ValueError: The pool has no clients.
+
+        Returns:
+            The client selected.
+        """
+        clients = self._clients
+
+        if not clients:
+            raise ValueError(NO_CLIENTS)
+
+        return min(clients.values(), key=pooled_load)
+
+    async def run_with(
+        self,
+        pooled: PooledClient,
+        function: Callable[Concatenate[Client, P], Awaitable[T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        pooled.in_flight += 1
+
+        try:
+            async with pooled.semaphore:
+                return await function(pooled.client, *args, **kwargs)
+
+        finally:
+            pooled.in_flight -= 1
+            pooled.completed += 1
+
+    async def run(
+        self,
+        function: Callable[Concatenate[Client, P], Awaitable[T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Runs the `function` with the least busy client as the first argument.
+
+        Arguments:
+            function: The function to run.
+            *args: The positional arguments to pass.
+            **kwargs: The keyword arguments to pass.
+
+        Returns:
+            The result of the function.
+        """
+        pooled = self.select()
+
+        return await self.run_with(pooled, function, *args, **kwargs)
+
+    async def run_as(
+        self,
+        account_id: int,
+        function: Callable[Concatenate[Client, P], Awaitable[T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Runs the `function` with the client of the account with the given `account_id`.
+
+        Arguments:
+            account_id: The ID of the account.
+            function: The function to run.
+            *args: The positional arguments to pass.
+            **kwargs: The keyword arguments to pass.
+
+        Raises:
+            KeyError: The account is not in the pool.
+
+        Returns:
+            The result of the function.
+        """
+        pooled = self._clients[account_id]
+
+        return await self.run_with(pooled, function, *args, **kwargs)
+
+    async def broadcast(self, function: Unary[Client, Awaitable[T]]) -> List[T]:
+        """Runs the `function` once with each client in the pool.
+
+        Arguments:
+            function: The function to run.
+
+        Returns:
+            The results, in the order of clients.
+        """
+        return list(
+            await gather(*(self.run_as(account_id, function) for account_id in list(self._clients)))
+        )
+
+    def total_concurrency(self) -> int:
+        return len(self._clients) * self.concurrency_per_account
+
+    async def map(
+        self,
+        function: ClientFunction[U, T],
+        items: Iterable[U],
+        concurrency: Optional[int] = None,
+    ) -> List[T]:
+        """Runs the `function` for each of the `items`, spreading the work across the clients.
+
+        The `items` are consumed lazily by a bounded set of workers,
+        so large job lists do not create all the coroutines up front.
+
+        Arguments:
+            function: The function to run, taking the client and the item.
+            items: The items to process.
+            concurrency: The number of workers; defaults to the total concurrency of clients.
+
+        Raises:
+            ValueError: `concurrency` is not positive, or the pool has no clients.
+
+        Returns:
+            The results, in the order of `items`.
+        """
+        if concurrency is None:
+            concurrency = max(self.total_concurrency(), 1)
+
+        if concurrency < 1:
+            raise ValueError(EXPECTED_POSITIVE_CONCURRENCY)
+
+        jobs = enumerate(items)
+
+        results: Dict[int, T] = {}
+
+        async def work() -> None:
+            for index, item in jobs:
+                results[index] = await self.run(function, item)
+
+        workers = [create_task(work()) for _ in range(concurrency)]
+
+        try:
+            await gather(*workers)
+
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        return [results[index] for index in range(len(results))]
+
+
+def pooled_load(pooled: PooledClient) -> Tuple[int, int]:
+    return (pooled.in_flight, pooled.completed)
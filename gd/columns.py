@@ -0,0 +1,451 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from itertools import compress
+from operator import attrgetter as attribute_getter
+from statistics import fmean
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterable, List, Tuple
+
+from attrs import define, field
+from typing_aliases import Predicate, Unary
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from pendulum import DateTime
+
+    from gd.models import (
+        LeaderboardResponseModel,
+        LevelCommentModel,
+        LevelCommentsResponseModel,
+        LevelModel,
+        SearchLevelsResponseModel,
+    )
+
+try:
+    import numpy
+
+except ImportError:
+    NUMPY = False
+
+else:
+    NUMPY = True
+
+__all__ = ("Columns", "LevelColumns", "LevelCommentColumns", "LeaderboardUserColumns")
+
+INT = "q"
+"""The type code of 64-bit signed integers."""
+
+SMALL = "h"
+"""The type code of 16-bit signed integers, used for enum values."""
+
+BOOL = "B"
+"""The type code of 8-bit unsigned integers, used for booleans."""
+
+FLOAT = "d"
+"""The type code of 64-bit floats, used for timestamps."""
+
+NUMPY_REQUIRED = "`numpy` is required to convert columns to arrays"
+
+UNKNOWN_COLUMN = "unknown column `{}`"
+MISMATCHED_LENGTH = "expected the mask of length {}, got {}"
+
+Column = Tuple[str, Unary[Any, Any]]
+"""Column specifications, that is, the type code and the function to extract values with."""
+
+
+def timestamp(date_time: DateTime) -> float:
+    return date_time.timestamp()
+
+
+@define()
+class Columns:
+    """Represents column-oriented batches of models.
+
+    Each column is stored as the typed [`array`][array.array], so that large batches
+    do not keep millions of Python objects around. Filters and aggregations run
+    over entire columns at once, and [`to_numpy`][gd.columns.Columns.to_numpy]
+    exposes the columns to NumPy (and therefore to dataframes) without copying.
+
+    Subclasses define `COLUMNS`, mapping column names to their specifications.
+    """
+
+    COLUMNS: ClassVar[Dict[str, Column]] = {}
+    """The column specifications, by column names."""
+
+    columns: Dict[str, array[Any]] = field()
+    """The columns, by names."""
+
+    @columns.default
+    def default_columns(self) -> Dict[str, array[Any]]:
+        return {name: array(type_code) for name, (type_code, _) in self.COLUMNS.items()}
+
+    @classmethod
+    def from_models(cls, models: Iterable[Any]) -> Self:
+        """Creates the batch from the `models`.
+
+        Lazy models (see [`gd.models_lazy`][gd.models_lazy]) only decode the columns needed.
+
+        Arguments:
+            models: The models to create the batch from.
+
+        Returns:
+            The created batch.
+        """
+        models = list(models)
+
+        return cls(
+            {
+                name: array(type_code, map(extract, models))
+                for name, (type_code, extract) in cls.COLUMNS.items()
+            }
+        )
+
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+
+        return 0
+
+    def __getitem__(self, name: str) -> array[Any]:
+        return self.column(name)
+
+    def column(self, name: str) -> array[Any]:
+        """Returns the column named `name`.
+
+        Arguments:
+            name: The name of the column.
+
+        Raises:
+            KeyError: The column is not defined.
+
+        Returns:
+            The column.
+        """
+        columns = self.columns
+
+        if name not in columns:
+            raise KeyError(UNKNOWN_COLUMN.format(name))
+
+        return columns[name]
+
+    def extend(self, other: Self) -> Self:
+        """Appends the rows of the `other` batch to this one, in place.
+
+        This is useful for accumulating crawled pages.
+
+        Arguments:
+            other: The batch to append.
+
+        Returns:
+            This batch.
+        """
+        for name, column in self.columns.items():
+            column.extend(other.column(name))
+
+        return self
+
+    def mask(self, name: str, predicate: Predicate[Any]) -> List[bool]:
+        """Computes the mask of rows where the value in the column named `name`
+        satisfies the `predicate`.
+
+        Masks can be combined and passed to [`select`][gd.columns.Columns.select].
+
+        Arguments:
+            name: The name of the column.
+            predicate: The predicate to check.
+
+        Returns:
+            The mask of rows.
+        """
+        return list(map(predicate, self.column(name)))
+
+    def select(self, mask: Iterable[bool]) -> Self:
+        """Selects the rows according to the `mask`.
+
+        Arguments:
+            mask: The mask of rows to select.
+
+        Raises:
+            ValueError: The length of the mask does not match the length of the batch.
+
+        Returns:
+            The batch of selected rows.
+        """
+        mask = list(mask)
+
+        length = len(self)
+
+        if len(mask) != length:
+            raise ValueError(MISMATCHED_LENGTH.format(length, len(mask)))
+
+        return type(self)(
+            {
+                name: array(column.typecode, compress(column, mask))
+                for name, column in self.columns.items()
+            }
+        )
+
+    def where(self, name: str, predicate: Predicate[Any]) -> Self:
+        """Selects the rows where the value in the column named `name`
+        satisfies the `predicate`.
+
+        Example:
+            ```python
+            popular = columns.where("downloads", lambda downloads: downloads >= 1_000_000)
+            ```
+
+        Arguments:
+            name: The name of the column.
+            predicate: The predicate to check.
+
+        Returns:
+            The batch of selected rows.
+        """
+        return self.select(self.mask(name, predicate))
+
+    def take(self, indices: Iterable[int]) -> Self:
+        """Selects the rows at the given `indices`, in the given order.
+
+        Arguments:
+            indices: The indices of rows to select.
+
+        Returns:
+            The batch of selected rows.
+        """
+        indices = list(indices)
+
+        return type(self)(
+            {
+                name: array(column.typecode, map(column.__getitem__, indices))
+                for name, column in self.columns.items()
+            }
+        )
+
+    def sort_by(self, name: str, reverse: bool = False) -> Self:
+        """Sorts the rows by the values in the column named `name`.
+
+        Arguments:
+            name: The name of the column.
+            reverse: Whether to sort in the descending order.
+
+        Returns:
+            The batch of sorted rows.
+        """
+        column = self.column(name)
+
+        return self.take(sorted(range(len(column)), key=column.__getitem__, reverse=reverse))
+
+    def sum(self, name: str) -> float:
+        total: float = sum(self.column(name))
+
+        return total
+
+    def mean(self, name: str) -> float:
+        """Computes the mean of the column named `name`.
+
+        Arguments:
+            name: The name of the column.
+
+        Raises:
+            StatisticsError: The batch is empty.
+
+        Returns:
+            The mean of the column.
+        """
+        return fmean(self.column(name))
+
+    def min(self, name: str) -> float:
+        minimum: float = min(self.column(name))
+
+        return minimum
+
+    def max(self, name: str) -> float:
+        maximum: float = max(self.column(name))
+
+        return maximum
+
+    def counts(self, name: str) -> Counter[Any]:
+        """Counts the occurrences of each value in the column named `name`.
+
+        Arguments:
+            name: The name of the column.
+
+        Returns:
+            The counter of values.
+        """
+        return Counter(self.column(name))
+
+    def group_sum(self, by: str, name: str) -> Dict[Any, float]:
+        """Sums the values in the column named `name`, grouping them by
+        the values in the column named `by`.
+
+        Example:
+            ```python
+            downloads_by_difficulty = columns.group_sum("difficulty", "downloads")
+            ```
+
+        Arguments:
+            by: The name of the column to group by.
+            name: The name of the column to sum.
+
+        Returns:
+            The sums, by the values of the `by` column.
+        """
+        sums: Dict[Any, float] = {}
+
+        for key, value in zip(self.column(by), self.column(name)):
+            sums[key] = sums.get(key, 0) + value
+
+        return sums
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        return {name: column.tolist() for name, column in self.columns.items()}
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Converts the columns to NumPy arrays, without copying.
+
+        Since the arrays share memory with the columns,
+        the batch can not be extended while they are alive.
+
+        Raises:
+            ImportError: `numpy` is not installed.
+
+        Returns:
+            The NumPy arrays, by column names.
+        """
+        if not NUMPY:
+            raise ImportError(NUMPY_REQUIRED)
+
+        return {
+            name: numpy.frombuffer(column, dtype=column.typecode)
+            for name, column in self.columns.items()
+        }
+
+
+def level_stars(level: LevelModel) -> int:
+    return level.reward.count
+
+
+def level_difficulty(level: LevelModel) -> int:
+    return level.difficulty.value
+
+
+def level_length(level: LevelModel) -> int:
+    return level.length.value
+
+
+def level_created_at(level: LevelModel) -> float:
+    return timestamp(level.created_at)
+
+
+def level_updated_at(level: LevelModel) -> float:
+    return timestamp(level.updated_at)
+
+
+@define()
+class LevelColumns(Columns):
+    """Represents column-oriented batches of levels."""
+
+    COLUMNS = {
+        "id": (INT, attribute_getter("id")),
+        "creator_id": (INT, attribute_getter("creator_id")),
+        "downloads": (INT, attribute_getter("downloads")),
+        "rating": (INT, attribute_getter("rating")),
+        "stars": (INT, level_stars),
+        "coins": (INT, attribute_getter("coins")),
+        "difficulty": (SMALL, level_difficulty),
+        "length": (SMALL, level_length),
+        "created_at": (FLOAT, level_created_at),
+        "updated_at": (FLOAT, level_updated_at),
+    }
+
+    @classmethod
+    def from_response(cls, response: SearchLevelsResponseModel) -> Self:
+        return cls.from_models(response.levels)
+
+    @classmethod
+    def from_responses(cls, responses: Iterable[SearchLevelsResponseModel]) -> Self:
+        return cls.from_models(level for response in responses for level in response.levels)
+
+
+def comment_level_id(comment: LevelCommentModel) -> int:
+    return comment.inner.level_id
+
+
+def comment_id(comment: LevelCommentModel) -> int:
+    return comment.inner.id
+
+
+def comment_user_id(comment: LevelCommentModel) -> int:
+    return comment.inner.user_id
+
+
+def comment_account_id(comment: LevelCommentModel) -> int:
+    return comment.user.account_id
+
+
+def comment_rating(comment: LevelCommentModel) -> int:
+    return comment.inner.rating
+
+
+def comment_record(comment: LevelCommentModel) -> int:
+    return comment.inner.record
+
+
+def comment_spam(comment: LevelCommentModel) -> bool:
+    return comment.inner.spam
+
+
+def comment_created_at(comment: LevelCommentModel) -> float:
+    return timestamp(comment.inner.created_at)
+
+
+@define()
+class LevelCommentColumns(Columns):
+    """Represents column-oriented batches of level comments."""
+
+    COLUMNS = {
+        "id": (INT, comment_id),
+        "level_id": (INT, comment_level_id),
+        "user_id": (INT, comment_user_id),
+        "account_id": (INT, comment_account_id),
+        "rating": (INT, comment_rating),
+        "record": (INT, comment_record),
+        "spam": (BOOL, comment_spam),
+        "created_at": (FLOAT, comment_created_at),
+    }
+
+    @classmethod
+    def from_response(cls, response: LevelCommentsResponseModel) -> Self:
+        return cls.from_models(response.comments)
+
+    @classmethod
+    def from_responses(cls, responses: Iterable[LevelCommentsResponseModel]) -> Self:
+        return cls.from_models(comment for response in responses for comment in response.comments)
+
+
+@define()
+class LeaderboardUserColumns(Columns):
+    """Represents column-oriented batches of leaderboard users."""
+
+    COLUMNS = {
+        "id": (INT, attribute_getter("id")),
+        "account_id": (INT, attribute_getter("account_id")),
+        "place": (INT, attribute_getter("place")),
+        "stars": (INT, attribute_getter("stars")),
+        "moons": (INT, attribute_getter("moons")),
+        "demons": (INT, attribute_getter("demons")),
+        "diamonds": (INT, attribute_getter("diamonds")),
+        "creator_points": (INT, attribute_getter("creator_points")),
+        "user_coins": (INT, attribute_getter("user_coins")),
+        "secret_coins": (INT, attribute_getter("secret_coins")),
+    }
+
+    @classmethod
+    def from_response(cls, response: LeaderboardResponseModel) -> Self:
+        return cls.from_models(response.users)
+
+    @classmethod
+    def from_responses(cls, responses: Iterable[LeaderboardResponseModel]) -> Self:
+        return cls.from_models(user for response in responses for user in response.users)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, get_running_loop
+from typing import Awaitable, Dict, Optional, Tuple
+
+from aiohttp import ClientSession, TCPConnector
+from attrs import define, field, frozen
+from typing_aliases import Nullary
+
+__all__ = ("ConnectionSettings", "SessionKey", "acquire_session", "release_session")
+
+DEFAULT_LIMIT = 100
+"""The default total number of simultaneous connections."""
+
+DEFAULT_LIMIT_PER_HOST = 0
+"""The default number of simultaneous connections to the same host, `0` meaning no limit."""
+
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+"""The default time (in seconds) to keep idle connections alive for reuse."""
+
+DEFAULT_DNS_CACHE_TTL = 60
+"""The default time (in seconds) to cache resolved DNS entries for."""
+
+
+@frozen()
+class ConnectionSettings:
+    """Represents connection pool settings used by [`HTTPClient`][gd.http.HTTPClient]."""
+
+    limit: int = field(default=DEFAULT_LIMIT)
+    """The total number of simultaneous connections, `0` meaning no limit."""
+
+    limit_per_host: int = field(default=DEFAULT_LIMIT_PER_HOST)
+    """The number of simultaneous connections to the same host, `0` meaning no limit."""
+
+    keepalive_timeout: float = field(default=DEFAULT_KEEPALIVE_TIMEOUT)
+    """The time (in seconds) to keep idle connections alive for reuse."""
+
+    dns_cache_ttl: Optional[int] = field(default=DEFAULT_DNS_CACHE_TTL)
+    """The time (in seconds) to cache resolved DNS entries for, `None` meaning forever."""
+
+    def create_connector(self) -> TCPConnector:
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+
+
+SessionKey = Tuple[str, ConnectionSettings]
+"""The key of shared sessions, that is, the origin and the connection settings."""
+
+
+@define()
+class SharedSession:
+    session: ClientSession = field()
+    loop: AbstractEventLoop = field()
+    references: int = field(default=0)
+
+
+SHARED_SESSIONS: Dict[Tuple[SessionKey, AbstractEventLoop], SharedSession] = {}
+"""The shared sessions, by keys and event loops they were created in."""
+
+ACQUIRED_SESSIONS: Dict[int, SharedSession] = {}
+"""The shared sessions, by IDs of sessions."""
+
+
+async def acquire_session(
+    key: SessionKey, create_session: Nullary[Awaitable[ClientSession]]
+) -> ClientSession:
+    """Acquires the session shared by `key`, creating it if needed.
+
+    Sessions (and therefore their connection pools) are shared between clients
+    that point to the same origin with the same connection settings,
+    within the running event loop.
+
+    Arguments:
+        key: The key of the session.
+        create_session: The function to create the session with.
+
+    Returns:
+        The shared session.
+    """
+    loop = get_running_loop()
+
+    loop_key = (key, loop)
+
+    shared = SHARED_SESSIONS.get(loop_key)
+
+    if shared is None or shared.session.closed:
+        shared = SharedSession(await create_session(), loop)
+
+        SHARED_SESSIONS[loop_key] = shared
+
+        ACQUIRED_SESSIONS[id(shared.session)] = shared
+
+    shared.references += 1
+
+    return shared.session
+
+
+async def release_session(key: SessionKey, session: ClientSession) -> None:
+    """Releases the `session` acquired by `key`, closing it if it is no longer used.
+
+    Arguments:
+        key: The key of the session.
+        session: The session to release.
+    """
+    shared = ACQUIRED_SESSIONS.get(id(session))
+
+    if shared is None or shared.session is not session:
+        await session.close()  # the session was not acquired, so nobody else can use it
+
+        return
+
+    shared.references -= 1
+
+    if shared.references <= 0:
+        del ACQUIRED_SESSIONS[id(session)]
+
+        loop_key = (key, shared.loop)
+
+        if SHARED_SESSIONS.get(loop_key) is shared:  # the session might have been replaced
+            del SHARED_SESSIONS[loop_key]
+
+        await session.close()
@@ -186,6 +186,10 @@ ZERO_PAGE = range(1)
 
 COMMENT_PAGE_SIZE = 20
 
+SEARCH_MANY_PAGE_SIZE = 10
+
+DEFAULT_CONCURRENCY = 10
+
 DEFAULT_LOAD_AFTER_POST = True
 
 DEFAULT_GET_DATA = True
@@ -7,6 +7,8 @@ __all__ = ("Default", "default")
 
 @runtime_checkable
 class Default(Protocol):
+    __slots__ = ()
+
     @classmethod
     def default(cls) -> Self:
         ...
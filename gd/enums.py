@@ -84,6 +84,9 @@ __all__ = (
     "Platform",
     "Orientation",
     "ResponseType",
+    "RequestPriority",
+    "ProxyStrategy",
+    "OverflowPolicy",
     "CollectedCoins",
     "Quality",
     "Permissions",
@@ -1730,6 +1733,63 @@ class ResponseType(Enum):
     DEFAULT = TEXT
 
 
+class RequestPriority(Enum):
+    """Represents request priorities, lower values being served first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+    DEFAULT = NORMAL
+
+    def is_interactive(self) -> bool:
+        return self is type(self).INTERACTIVE
+
+    def is_normal(self) -> bool:
+        return self is type(self).NORMAL
+
+    def is_background(self) -> bool:
+        return self is type(self).BACKGROUND
+
+
+class ProxyStrategy(Enum):
+    """Represents proxy selection strategies."""
+
+    ROUND_ROBIN = 0
+    LEAST_LOADED = 1
+    STICKY = 2
+
+    DEFAULT = ROUND_ROBIN
+
+    def is_round_robin(self) -> bool:
+        return self is type(self).ROUND_ROBIN
+
+    def is_least_loaded(self) -> bool:
+        return self is type(self).LEAST_LOADED
+
+    def is_sticky(self) -> bool:
+        return self is type(self).STICKY
+
+
+class OverflowPolicy(Enum):
+    """Represents policies applied when dispatch queues are full."""
+
+    BLOCK = 0
+    DROP_NEWEST = 1
+    DROP_OLDEST = 2
+
+    DEFAULT = BLOCK
+
+    def is_block(self) -> bool:
+        return self is type(self).BLOCK
+
+    def is_drop_newest(self) -> bool:
+        return self is type(self).DROP_NEWEST
+
+    def is_drop_oldest(self) -> bool:
+        return self is type(self).DROP_OLDEST
+
+
 class CollectedCoins(Flag):
     """Represents collected coins."""
 
@@ -14,6 +14,7 @@ __all__ = (
     "HTTPError",
     "HTTPErrorWithOrigin",
     "HTTPStatusError",
+    "ReplayMissing",
     "ClientError",
     "MissingAccess",
     "SongRestricted",
@@ -72,6 +73,26 @@ class HTTPStatusError(HTTPError):
         return self._status
 
 
+REPLAY_MISSING = "no recorded response for `{} {}`"
+replay_missing = REPLAY_MISSING.format
+
+
+class ReplayMissing(HTTPError):
+    def __init__(self, method: str, url: str) -> None:
+        super().__init__(replay_missing(method, url))
+
+        self._method = method
+        self._url = url
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+
 class ClientError(GDError):
     pass
 
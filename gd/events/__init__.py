@@ -1,4 +1,6 @@
 from gd.events.controller import Controller
+from gd.events.dispatcher import DispatchQueue
+from gd.events.hub import SubscriptionHub
 from gd.events.listeners import (
     DailyCommentListener,
     DailyListener,
@@ -8,15 +10,25 @@ from gd.events.listeners import (
     Listener,
     MessageListener,
     RateListener,
+    TimelyListener,
     UserCommentListener,
     UserLevelListener,
     WeeklyCommentListener,
     WeeklyListener,
 )
+from gd.events.scheduler import PollScheduler
+from gd.events.sharding import ShardedController
+from gd.events.watermarks import WatermarkStore
 
 __all__ = (
     "Controller",
+    "ShardedController",
+    "DispatchQueue",
+    "PollScheduler",
+    "SubscriptionHub",
+    "WatermarkStore",
     "Listener",
+    "TimelyListener",
     "DailyListener",
     "WeeklyListener",
     "LevelListener",
@@ -7,6 +7,8 @@ from attrs import define, field
 from typing_aliases import DynamicTuple, NormalError
 
 from gd.asyncio import shutdown_loop
+from gd.events.dispatcher import DispatchQueue
+from gd.events.hub import SubscriptionHub
 from gd.events.listeners import Listener
 
 CONTROLLER_NOT_RUNNING = "the controller is not running"
@@ -26,6 +28,15 @@ class Controller:
 
     loop: AbstractEventLoop = field(factory=new_event_loop)
 
+    hub: SubscriptionHub = field(factory=SubscriptionHub)
+    """The hub shared by the listeners without their own one."""
+
+    dispatcher: Optional[DispatchQueue] = field(default=None)
+    """The dispatch queue shared by the listeners without their own one.
+
+    If not given, events are dispatched right away, without any bounds.
+    """
+
     _thread: Optional[Thread] = field(default=None, init=False)
 
     def run(self) -> None:
@@ -40,7 +51,16 @@ class Controller:
 
         set_event_loop(loop)
 
+        hub = self.hub
+        dispatcher = self.dispatcher
+
         for listener in self.listeners:
+            if listener.hub is None:
+                listener.hub = hub
+
+            if listener.dispatcher is None:
+                listener.dispatcher = dispatcher
+
             listener.start()
 
         try:
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from asyncio import Condition, Task, get_running_loop
+from collections import Counter
+from heapq import heapify, heappop, heappush
+from inspect import iscoroutine as is_coroutine
+from itertools import count
+from time import perf_counter
+from traceback import print_exception as print_error
+from typing import Any, Awaitable, Dict, Final, Iterator, List, Mapping, Optional, Tuple
+
+from attrs import define, field
+from typing_aliases import NormalError, Unary
+
+from gd.enums import OverflowPolicy
+
+__all__ = ("DispatchMetrics", "DispatchQueue")
+
+DEFAULT_CONCURRENCY = 4
+"""The default number of handlers running at once."""
+
+DEFAULT_MAX_SIZE = 1000
+"""The default maximum number of events waiting to be handled."""
+
+DEFAULT_PRIORITY = 0
+"""The default priority of events; events with lower priorities are handled first."""
+
+DEFAULT_EVENT = "event"
+
+EXPECTED_POSITIVE_CONCURRENCY = "expected `concurrency` to be positive"
+EXPECTED_POSITIVE_MAX_SIZE = "expected `max_size` to be positive"
+
+Item = Tuple[int, int, str, float, Awaitable[Any]]
+"""Queued items, that is, the priority, the sequence number, the event name,
+the time of enqueueing and the awaitable to run.
+"""
+
+SEQUENCE: Final = 1
+
+
+def discard(awaitable: Awaitable[Any]) -> None:
+    if is_coroutine(awaitable):
+        awaitable.close()  # avoid warnings about coroutines that were never awaited
+
+
+@define()
+class DispatchMetrics:
+    """Represents metrics of [`DispatchQueue`][gd.events.dispatcher.DispatchQueue]."""
+
+    enqueued: int = field(default=0)
+    handled: int = field(default=0)
+    failed: int = field(default=0)
+    dropped: int = field(default=0)
+
+    depth: int = field(default=0)
+    max_depth: int = field(default=0)
+
+    wait_time: float = field(default=0.0)
+    """The total time (in seconds) events spent in the queue."""
+
+    handler_time: float = field(default=0.0)
+    """The total time (in seconds) spent in handlers."""
+
+    max_handler_time: float = field(default=0.0)
+
+    events: Counter[str] = field(factory=Counter)
+    """The number of events handled, by event names."""
+
+    def observe_depth(self, depth: int) -> None:
+        self.depth = depth
+
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def observe_handler_time(self, elapsed: float) -> None:
+        self.handler_time += elapsed
+
+        if elapsed > self.max_handler_time:
+            self.max_handler_time = elapsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(
+            enqueued=self.enqueued,
+            handled=self.handled,
+            failed=self.failed,
+            dropped=self.dropped,
+            depth=self.depth,
+            max_depth=self.max_depth,
+            wait_time=self.wait_time,
+            handler_time=self.handler_time,
+            max_handler_time=self.max_handler_time,
+            events=dict(self.events),
+        )
+
+
+def print_handler_error(error: NormalError) -> None:
+    print_error(error)
+
+
+@define()
+class DispatchQueue:
+    """Represents bounded queues of event handlers, run by at most `concurrency` workers.
+
+    Events are handled in the order of their priorities (see `priorities`),
+    and then in the order of arrival. When the queue is full, the `overflow` policy applies:
+
+    - [`BLOCK`][gd.enums.OverflowPolicy.BLOCK] waits for free space,
+      applying backpressure to listeners;
+    - [`DROP_NEWEST`][gd.enums.OverflowPolicy.DROP_NEWEST] drops the incoming event;
+    - [`DROP_OLDEST`][gd.enums.OverflowPolicy.DROP_OLDEST] drops the oldest queued event.
+
+    Workers are started lazily, on the running event loop.
+    """
+
+    concurrency: int = field(default=DEFAULT_CONCURRENCY)
+    max_size: int = field(default=DEFAULT_MAX_SIZE)
+    overflow: OverflowPolicy = field(default=OverflowPolicy.DEFAULT)
+
+    priorities: Mapping[str, int] = field(factory=dict)
+    """The priorities of events, by event names."""
+
+    on_error: Unary[NormalError, None] = field(default=print_handler_error, repr=False)
+
+    metrics: DispatchMetrics = field(factory=DispatchMetrics, init=False)
+
+    _heap: List[Item] = field(factory=list, init=False, repr=False)
+    _active: int = field(default=0, init=False, repr=False)
+    _counter: Iterator[int] = field(factory=count, init=False, repr=False)
+
+    _condition: Optional[Condition] = field(default=None, init=False, repr=False)
+    _workers: List[Task[None]] = field(factory=list, init=False, repr=False)
+
+    @concurrency.validator
+    def check_concurrency(self, attribute: object, concurrency: int) -> None:
+        if concurrency < 1:
+            raise ValueError(EXPECTED_POSITIVE_CONCURRENCY)
+
+    @max_size.validator
+    def check_max_size(self, attribute: object, max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError(EXPECTED_POSITIVE_MAX_SIZE)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def priority_for(self, event: str) -> int:
+        return self.priorities.get(event, DEFAULT_PRIORITY)
+
+    def ensure_started(self) -> Condition:
+        condition = self._condition
+
+        if condition is None:
+            self._condition = condition = Condition()
+
+            loop = get_running_loop()
+
+            self._workers.extend(loop.create_task(self.work()) for _ in range(self.concurrency))
+
+        return condition
+
+    def drop_oldest(self) -> None:
+        heap = self._heap
+
+        index = min(range(len(heap)), key=lambda index: heap[index][SEQUENCE])
+
+        item = heap.pop(index)
+
+        heapify(heap)
+
+        discard(item[-1])
+
+        self.metrics.dropped += 1
+
+    async def put(self, awaitable: Awaitable[Any], event: str = DEFAULT_EVENT) -> bool:
+        """Puts the `awaitable` handling the `event` into the queue.
+
+        Arguments:
+            awaitable: The awaitable to run.
+            event: The name of the event, used to determine its priority.
+
+        Returns:
+            Whether the event was queued, that is, not dropped.
+        """
+        condition = self.ensure_started()
+
+        heap = self._heap
+        metrics = self.metrics
+
+        async with condition:
+            while len(heap) >= self.max_size:
+                overflow = self.overflow
+
+                if overflow.is_drop_newest():
+                    discard(awaitable)
+
+                    metrics.dropped += 1
+
+                    return False
+
+                if overflow.is_drop_oldest():
+                    self.drop_oldest()
+
+                    break
+
+                await condition.wait()
+
+            item = (self.priority_for(event), next(self._counter), event, perf_counter(), awaitable)
+
+            heappush(heap, item)
+
+            metrics.enqueued += 1
+            metrics.observe_depth(len(heap))
+
+            condition.notify_all()
+
+        return True
+
+    async def work(self) -> None:
+        condition = self.ensure_started()
+
+        heap = self._heap
+        metrics = self.metrics
+
+        while True:
+            async with condition:
+                while not heap:
+                    await condition.wait()
+
+                _, _, event, enqueued_at, awaitable = heappop(heap)
+
+                metrics.observe_depth(len(heap))
+
+                self._active += 1
+
+                condition.notify_all()
+
+            started_at = perf_counter()
+
+            metrics.wait_time += started_at - enqueued_at
+
+            try:
+                await awaitable
+
+            except NormalError as error:
+                metrics.failed += 1
+
+                self.on_error(error)
+
+            finally:
+                metrics.observe_handler_time(perf_counter() - started_at)
+
+                metrics.handled += 1
+                metrics.events[event] += 1
+
+                async with condition:
+                    self._active -= 1
+
+                    condition.notify_all()
+
+    async def join(self) -> None:
+        """Waits until all queued events are handled."""
+        condition = self.ensure_started()
+
+        async with condition:
+            while self._heap or self._active:
+                await condition.wait()
+
+    def close(self) -> None:
+        """Cancels the workers, discarding the queued events."""
+        for worker in self._workers:
+            worker.cancel()
+
+        self._workers.clear()
+
+        heap = self._heap
+
+        for item in heap:
+            discard(item[-1])
+
+        heap.clear()
+
+        self.metrics.observe_depth(0)
+
+        self._condition = None
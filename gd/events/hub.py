@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from asyncio import Future, ensure_future, shield
+from time import monotonic as clock
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, Hashable, Tuple, TypeVar
+
+from attrs import define, field
+from typing_aliases import Nullary
+
+from gd.constants import DEFAULT_DELAY
+
+if TYPE_CHECKING:
+    from gd.time import Clock
+
+__all__ = ("SubscriptionHub",)
+
+T = TypeVar("T")
+
+Entry = Tuple[float, "Future[Any]"]
+
+
+@define()
+class SubscriptionHub:
+    """Represents hubs that share fetches between listeners watching the same resources.
+
+    Within each `tick`, the resource identified by some key is fetched at most once,
+    and the result is fanned out to every listener asking for it during the tick.
+    Failed fetches are not shared beyond the listeners already waiting on them.
+
+    [`Controller`][gd.events.controller.Controller] attaches its hub to all of its listeners.
+    """
+
+    tick: float = field(default=DEFAULT_DELAY)
+    """The time (in seconds) for which fetched resources are shared."""
+
+    _clock: Clock = field(default=clock, repr=False)
+
+    _entries: Dict[Hashable, Entry] = field(factory=dict, init=False, repr=False)
+
+    fetches: int = field(default=0, init=False)
+    """The number of fetches actually performed."""
+
+    shared: int = field(default=0, init=False)
+    """The number of fetches served by sharing."""
+
+    def purge(self) -> None:
+        """Removes the entries that have expired."""
+        now = self._clock()
+
+        entries = self._entries
+
+        for key, (expires_at, future) in list(entries.items()):
+            if future.done() and expires_at <= now:
+                del entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def fetch(self, key: Hashable, function: Nullary[Awaitable[T]]) -> T:
+        """Fetches the resource identified by the `key`, sharing the result within the tick.
+
+        Arguments:
+            key: The key of the resource.
+            function: The function to fetch the resource with.
+
+        Returns:
+            The resource fetched.
+        """
+        now = self._clock()
+
+        entries = self._entries
+
+        entry = entries.get(key)
+
+        if entry is not None:
+            expires_at, future = entry
+
+            if not future.done() or expires_at > now:
+                self.shared += 1
+
+                return await shield(future)
+
+        self.purge()
+
+        self.fetches += 1
+
+        future = ensure_future(function())
+
+        entries[key] = (now + self.tick, future)
+
+        def remove_failed(future: Future[T]) -> None:
+            if future.cancelled() or future.exception() is not None:
+                if entries.get(key, (None, None))[1] is future:
+                    del entries[key]
+
+        future.add_done_callback(remove_failed)
+
+        return await shield(future)
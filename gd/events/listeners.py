@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from abc import abstractmethod as required
-from asyncio import get_running_loop
+from asyncio import get_running_loop, sleep
 from traceback import print_exception as print_error
+from warnings import warn
 from typing import (
     TYPE_CHECKING,
     Any,
     Awaitable,
+    ClassVar,
     Hashable,
     Iterable,
     List,
@@ -18,8 +20,7 @@ from typing import (
 
 from attrs import define, field
 from funcs.functions import awaiting
-from iters.iters import Iter, iter
-from typing_aliases import NormalError, Nullary, Predicate
+from typing_aliases import NormalError, Nullary
 
 from gd.constants import (
     DEFAULT_COUNT,
@@ -29,13 +30,20 @@ from gd.constants import (
     DEFAULT_RECONNECT,
     DEFAULT_UPDATE,
 )
-from gd.enums import SearchStrategy, TimelyID
+from gd.enums import SearchStrategy, TimelyID, TimelyType
+from gd.events.dispatcher import DispatchQueue
+from gd.events.hub import SubscriptionHub
+from gd.events.scheduler import PollScheduler
+from gd.events.watermarks import HasID, WatermarkStore
 from gd.filters import Filters
 from gd.queries import query
+from gd.response_cache import cache_key
+from gd.single_flight import canonicalize
 from gd.tasks import Loop
 
 __all__ = (
     "Listener",
+    "TimelyListener",
     "DailyListener",
     "WeeklyListener",
     "LevelListener",
@@ -56,38 +64,49 @@ if TYPE_CHECKING:
     from gd.friend_requests import FriendRequest
     from gd.levels import Level
     from gd.messages import Message
+    from gd.models import TimelyInfoModel
     from gd.users import User
 
 
-Q = TypeVar("Q", bound=Hashable)
+T = TypeVar("T")
+I = TypeVar("I", bound=HasID)
 
+LISTENER_ALREADY_RUNNING = "listener is already running"
 
-def not_in_before_set(before: Iterable[Q]) -> Predicate[Q]:
-    before_set = set(before)
-
-    def predicate(item: Q) -> bool:
-        return item not in before_set
-
-    return predicate
-
+DEFAULT_EVENT = "event"
 
-def differ_iterator(before: Iterable[Q], after: Iterable[Q]) -> Iter[Q]:
-    return iter(after).take_while(not_in_before_set(before))
+STREAM = "{}:{}"
 
+TIMELY = "timely"
+LEVEL = "level"
+LEVELS = "levels"
+MESSAGES = "messages"
+FRIEND_REQUESTS = "friend_requests"
+LEVEL_COMMENTS = "level_comments"
+USER = "user"
+USER_COMMENTS = "user_comments"
+USER_LEVEL_COMMENTS = "user_level_comments"
+USER_LEVELS = "user_levels"
 
-def differ(before: Iterable[Q], after: Iterable[Q]) -> List[Q]:
-    return differ_iterator(before, after).list()
 
-
-LISTENER_ALREADY_RUNNING = "listener is already running"
+def stream(kind: str, key: Any) -> str:
+    return STREAM.format(kind, key)
 
 
 @runtime_checkable
 class ListenerProtocol(Protocol):
+    EVENT: ClassVar[str] = DEFAULT_EVENT
+
     delay: float
     reconnect: bool
+    scheduler: Optional[PollScheduler]
+    hub: Optional[SubscriptionHub]
+    dispatcher: Optional[DispatchQueue]
+    watermarks: WatermarkStore
     _running: bool
     _loop: Optional[Loop[[]]]
+    _dispatched: int
+    _observed: List[Any]
 
     @required
     async def step(self) -> None:
@@ -97,21 +116,122 @@ class ListenerProtocol(Protocol):
         print_error(error)
 
     async def schedule(self, awaitable: Awaitable[Any]) -> None:
-        get_running_loop().create_task(awaiting(awaitable))
+        """Schedules the `awaitable` dispatching the event of the listener.
+
+        If the [`DispatchQueue`][gd.events.dispatcher.DispatchQueue] is configured,
+        the awaitable is put into it (which may wait for free space);
+        otherwise, the task is created right away.
+
+        Arguments:
+            awaitable: The awaitable to schedule.
+        """
+        self._dispatched += 1
+
+        dispatcher = self.dispatcher
+
+        if dispatcher is None:
+            get_running_loop().create_task(awaiting(awaitable))
+
+        else:
+            await dispatcher.put(awaitable, self.EVENT)
+
+    async def fetch(self, key: Hashable, function: Nullary[Awaitable[T]]) -> T:
+        """Fetches the resource identified by the `key`, sharing the fetch
+        with other listeners via the [`SubscriptionHub`][gd.events.hub.SubscriptionHub],
+        if the hub is configured.
+
+        Arguments:
+            key: The key of the resource.
+            function: The function to fetch the resource with.
+
+        Returns:
+            The resource fetched.
+        """
+        hub = self.hub
+
+        if hub is None:
+            return await function()
+
+        return await hub.fetch(key, function)
+
+    async def observe(self, stream: str, items: Iterable[I], ordered: bool = True) -> List[I]:
+        """Observes the `items` of the `stream`, returning the new ones
+        according to the [`WatermarkStore`][gd.events.watermarks.WatermarkStore].
+
+        Nothing is returned when the stream is observed for the first time.
+
+        Arguments:
+            stream: The name of the stream.
+            items: The items to observe.
+            ordered: Whether new items of the stream always have higher IDs.
+
+        Returns:
+            The new items.
+        """
+        self._observed = items = list(items)
+
+        new = await self.watermarks.observe(stream, items, ordered)
+
+        if new is None:
+            return []
+
+        return new
+
+    def set_next_delay(self, delay: float) -> None:
+        """Changes the delay before the next step of the listener.
+
+        Arguments:
+            delay: The delay to use.
+        """
+        loop = self._loop
+
+        if loop is not None:
+            loop.delay = delay
+
+    def next_delay(self, changed: bool) -> float:
+        """Computes the delay before the next step of the listener.
+
+        If the [`PollScheduler`][gd.events.scheduler.PollScheduler] is configured,
+        the delay adapts to how often changes are seen; otherwise, `delay` is used.
+
+        Arguments:
+            changed: Whether the last step saw any changes.
+
+        Returns:
+            The delay before the next step.
+        """
+        scheduler = self.scheduler
+
+        if scheduler is None:
+            return self.delay
+
+        return scheduler.next_delay(changed)
 
     async def main(self) -> None:
+        dispatched = self._dispatched
+
         try:
             await self.step()
 
         except NormalError as error:
             await self.on_error(error)
 
+        self.set_next_delay(self.next_delay(self._dispatched > dispatched))
+
+    async def stagger(self) -> None:
+        scheduler = self.scheduler
+
+        if scheduler is not None:
+            await sleep(scheduler.initial_delay())
+
     def start(self) -> None:
         if self._running:
             raise RuntimeError(LISTENER_ALREADY_RUNNING)
 
         loop = Loop(function=self.main, delay=self.delay, reconnect=self.reconnect)
 
+        loop.before_loop(self.stagger)
+
         self._loop = loop
 
         loop.start()
@@ -125,87 +245,203 @@ class Listener(ListenerProtocol):
 
     delay: float = field(default=DEFAULT_DELAY)
     reconnect: bool = field(default=DEFAULT_RECONNECT)
+    scheduler: Optional[PollScheduler] = field(default=None, repr=False)
+    hub: Optional[SubscriptionHub] = field(default=None, repr=False)
+    dispatcher: Optional[DispatchQueue] = field(default=None, repr=False)
+    watermarks: WatermarkStore = field(factory=WatermarkStore, repr=False)
 
     _running: bool = field(default=False, init=False, repr=False)
 
     _loop: Optional[Loop[[]]] = field(default=None, init=False, repr=False)
 
+    _dispatched: int = field(default=0, init=False, repr=False)
+
+    _observed: List[Any] = field(factory=list, init=False, repr=False)
+
     async def step(self) -> None:
         pass
 
 
+DAILY_CACHE = "daily_cache"
+WEEKLY_CACHE = "weekly_cache"
+
+CACHE_DEPRECATED = "`{}` is deprecated; use `level_cache` instead"
+
+
+def warn_cache_deprecated(name: str) -> None:
+    warn(CACHE_DEPRECATED.format(name), DeprecationWarning, stacklevel=3)
+
+
+LEVELS_CACHE = "levels_cache"
+MESSAGES_CACHE = "messages_cache"
+FRIEND_REQUESTS_CACHE = "friend_requests_cache"
+LEVEL_COMMENTS_CACHE = "level_comments_cache"
+USER_COMMENTS_CACHE = "user_comments_cache"
+USER_LEVEL_COMMENTS_CACHE = "user_level_comments_cache"
+USER_LEVELS_CACHE = "user_levels_cache"
+
+OBSERVED_DEPRECATED = "`{}` is deprecated; new items are tracked by `watermarks` instead"
+
+
+def warn_observed_deprecated(name: str) -> None:
+    warn(OBSERVED_DEPRECATED.format(name), DeprecationWarning, stacklevel=3)
+
+
+DEFAULT_TIMELY_MARGIN = 5.0
+"""The default margin (in seconds) to wait for after the timely level is expected to change."""
+
+DEFAULT_TIMELY_MAX_DELAY = 3600.0
+"""The default maximum delay (in seconds) between timely probes."""
+
+
 @define()
-class DailyListener(Listener):
-    daily_cache: Optional[Level] = field(default=None, init=False)
+class TimelyListener(Listener):
+    """Represents listeners of timely levels.
+
+    Only the lightweight timely information is polled, and the level itself
+    is downloaded solely when the timely ID increases. The next probe is scheduled
+    once the time left runs out (plus the `margin`), though never sooner than `delay`
+    and never later than `max_delay`; if the scheduler is configured, the probe is
+    additionally postponed by its jitter.
+    """
+
+    EVENT: ClassVar[str] = "timely"
+
+    TYPE: ClassVar[TimelyType] = TimelyType.DEFAULT
+
+    margin: float = field(default=DEFAULT_TIMELY_MARGIN)
+    max_delay: float = field(default=DEFAULT_TIMELY_MAX_DELAY)
+
+    timely_info_cache: Optional[TimelyInfoModel] = field(default=None, init=False)
+    level_cache: Optional[Level] = field(default=None, init=False)
+
+    def compute_delay(self, timely_info: TimelyInfoModel) -> float:
+        delay = timely_info.cooldown.total_seconds() + self.margin
+
+        return min(max(delay, self.delay), self.max_delay)
+
+    def next_delay(self, changed: bool) -> float:
+        timely_info = self.timely_info_cache
+
+        if timely_info is None:
+            return super().next_delay(changed)
+
+        delay = self.compute_delay(timely_info)
+
+        scheduler = self.scheduler
+
+        if scheduler is None:
+            return delay
+
+        return scheduler.align(delay)
+
+    async def dispatch_timely(self, level: Level) -> None:
+        pass
 
     async def step(self) -> None:
         client = self.client
 
-        daily = await client.get_daily()
+        type = self.TYPE
 
-        daily_cache = self.daily_cache
+        timely_info = await self.fetch((TIMELY, type), lambda: client.get_timely_info(type))
 
-        if daily_cache is None:
-            self.daily_cache = daily
+        self.timely_info_cache = timely_info
 
+        difference = await self.observe(stream(TIMELY, type.value), (timely_info,))
+
+        if not difference:
             return
 
-        self.daily_cache = daily
+        self.level_cache = level = await client.get_timely_level(timely_info)
 
-        if daily.id != daily_cache.id:
-            await self.schedule(client.dispatch_daily(daily))
+        await self.schedule(self.dispatch_timely(level))
 
 
 @define()
-class WeeklyListener(Listener):
-    weekly_cache: Optional[Level] = field(default=None, init=False)
+class DailyListener(TimelyListener):
+    EVENT: ClassVar[str] = "daily"
 
-    async def step(self) -> None:
-        client = self.client
+    TYPE: ClassVar[TimelyType] = TimelyType.DAILY
 
-        weekly = await client.get_weekly()
+    @property
+    def daily_cache(self) -> Optional[Level]:
+        """Deprecated alias of [`level_cache`][gd.events.listeners.TimelyListener.level_cache]."""
+        warn_cache_deprecated(DAILY_CACHE)
 
-        weekly_cache = self.weekly_cache
+        return self.level_cache
 
-        if weekly_cache is None:
-            self.weekly_cache = weekly
+    @daily_cache.setter
+    def daily_cache(self, level: Optional[Level]) -> None:
+        warn_cache_deprecated(DAILY_CACHE)
 
-            return
+        self.level_cache = level
 
-        self.weekly_cache = weekly
+    async def dispatch_timely(self, level: Level) -> None:
+        await self.client.dispatch_daily(level)
 
-        if weekly.id != weekly_cache.id:
-            await self.schedule(client.dispatch_weekly(weekly))
+
+@define()
+class WeeklyListener(TimelyListener):
+    EVENT: ClassVar[str] = "weekly"
+
+    TYPE: ClassVar[TimelyType] = TimelyType.WEEKLY
+
+    @property
+    def weekly_cache(self) -> Optional[Level]:
+        """Deprecated alias of [`level_cache`][gd.events.listeners.TimelyListener.level_cache]."""
+        warn_cache_deprecated(WEEKLY_CACHE)
+
+        return self.level_cache
+
+    @weekly_cache.setter
+    def weekly_cache(self, level: Optional[Level]) -> None:
+        warn_cache_deprecated(WEEKLY_CACHE)
+
+        self.level_cache = level
+
+    async def dispatch_timely(self, level: Level) -> None:
+        await self.client.dispatch_weekly(level)
 
 
 @define()
 class LevelListener(Listener):
+    EVENT: ClassVar[str] = "level"
+
     pages_count: int = field(default=DEFAULT_PAGES_COUNT)
     filters: Filters = field(factory=Filters)
 
-    levels_cache: List[Level] = field(factory=list, init=False)
+    @property
+    def levels_cache(self) -> List[Level]:
+        """Deprecated; the items observed on the last step."""
+        warn_observed_deprecated(LEVELS_CACHE)
+
+        return self._observed
+
+    def levels_stream(self) -> str:
+        return stream(LEVELS, cache_key(canonicalize(self.filters.to_robtop_filters())))
 
     async def dispatch_level(self, level: Level) -> None:
         await self.client.dispatch_level(level)
 
     async def step(self) -> None:
-        levels = await self.client.search_levels(
-            filters=self.filters, pages=range(self.pages_count)
-        ).list()
+        client = self.client
 
-        if not levels:  # abort
-            return
+        filters = self.filters
 
-        levels_cache = self.levels_cache
+        pages = range(self.pages_count)
 
-        if not levels_cache:
-            self.levels_cache = levels
+        levels = await self.fetch(
+            (LEVELS, canonicalize(filters.to_robtop_filters()), pages),
+            lambda: client.search_levels(filters=filters, pages=pages).list(),
+        )
 
+        if not levels:  # abort
             return
 
-        difference = differ(levels_cache, levels)
+        difference = await self.observe(self.levels_stream(), levels, ordered=False)
 
-        self.levels_cache = levels
+        if not difference:
+            return
 
         for level in difference:
             await self.schedule(self.dispatch_level(level))
@@ -220,6 +456,8 @@ def filters_factory(strategy: SearchStrategy) -> Nullary[Filters]:
 
 @define()
 class RateListener(LevelListener):
+    EVENT: ClassVar[str] = "rate"
+
     filters: Filters = field(factory=filters_factory(SearchStrategy.RATED))
 
     async def dispatch_level(self, level: Level) -> None:
@@ -231,64 +469,77 @@ DEFAULT_READ = True
 
 @define()
 class MessageListener(Listener):
+    EVENT: ClassVar[str] = "message"
+
     pages_count: int = field(default=DEFAULT_PAGES_COUNT)
 
-    messages_cache: List[Message] = field(factory=list, init=False)
+    @property
+    def messages_cache(self) -> List[Message]:
+        """Deprecated; the items observed on the last step."""
+        warn_observed_deprecated(MESSAGES_CACHE)
+
+        return self._observed
 
     async def step(self) -> None:
         client = self.client
 
-        messages = await client.get_messages(pages=range(self.pages_count))
+        pages = range(self.pages_count)
+
+        messages = await self.fetch(
+            (MESSAGES, client.account_id, pages), lambda: client.get_messages(pages=pages)
+        )
 
         if not messages:
             return
 
-        messages_cache = self.messages_cache
-
-        if not messages_cache:
-            self.messages_cache = messages
+        difference = await self.observe(stream(MESSAGES, client.account_id), messages)
 
+        if not difference:
             return
 
-        difference = differ(messages_cache, messages)
-
-        self.messages_cache = messages
-
         for message in difference:
             await self.schedule(client.dispatch_message(message))
 
 
 @define()
 class FriendRequestListener(Listener):
+    EVENT: ClassVar[str] = "friend_request"
+
     pages_count: int = field(default=DEFAULT_PAGES_COUNT)
 
-    friend_requests_cache: List[FriendRequest] = field(factory=list, init=False)
+    @property
+    def friend_requests_cache(self) -> List[FriendRequest]:
+        """Deprecated; the items observed on the last step."""
+        warn_observed_deprecated(FRIEND_REQUESTS_CACHE)
+
+        return self._observed
 
     async def step(self) -> None:
         client = self.client
 
-        friend_requests = await client.get_friend_requests(pages=range(self.pages_count))
+        pages = range(self.pages_count)
+
+        friend_requests = await self.fetch(
+            (FRIEND_REQUESTS, client.account_id, pages),
+            lambda: client.get_friend_requests(pages=pages),
+        )
 
         if not friend_requests:
             return
 
-        friend_requests_cache = self.friend_requests_cache
-
-        if not friend_requests_cache:
-            self.friend_requests_cache = friend_requests
+        difference = await self.observe(stream(FRIEND_REQUESTS, client.account_id), friend_requests)
 
+        if not difference:
             return
 
-        difference = differ(friend_requests_cache, friend_requests)
-
-        self.friend_requests_cache = friend_requests
-
         for friend_request in difference:
             await self.schedule(client.dispatch_friend_request(friend_request))
 
 
 @define()
 class LevelCommentListener(Listener):
+    EVENT: ClassVar[str] = "level_comment"
+
     level_id: int = field(default=DEFAULT_ID)
 
     pages_count: int = field(default=DEFAULT_PAGES_COUNT)
@@ -297,7 +548,13 @@ class LevelCommentListener(Listener):
     update: bool = field(default=DEFAULT_UPDATE)
 
     level: Optional[Level] = field(default=None, init=False)
-    level_comments_cache: List[LevelComment] = field(factory=list, init=False)
+
+    @property
+    def level_comments_cache(self) -> List[LevelComment]:
+        """Deprecated; the items observed on the last step."""
+        warn_observed_deprecated(LEVEL_COMMENTS_CACHE)
+
+        return self._observed
 
     async def get_level(self) -> Level:
         return await self.client.get_level(self.level_id)
@@ -309,25 +566,26 @@ class LevelCommentListener(Listener):
         level = self.level
 
         if level is None:
-            self.level = level = await self.client.get_level(self.level_id)
+            self.level = level = await self.fetch((LEVEL, self.level_id), self.get_level)
 
-        level_comments = await level.get_comments(count=self.count, pages=range(self.pages_count))
-
-        if not level_comments:
-            return
+        count = self.count
 
-        level_comments_cache = self.level_comments_cache
+        pages = range(self.pages_count)
 
-        if not level_comments_cache:
-            self.level_comments_cache = level_comments
+        level_comments = await self.fetch(
+            (LEVEL_COMMENTS, level.id, count, pages),
+            lambda: level.get_comments(count=count, pages=pages).list(),
+        )
 
+        if not level_comments:
             return
 
-        difference = differ(level_comments_cache, level_comments)
+        difference = await self.observe(stream(LEVEL_COMMENTS, self.level_id), level_comments)
 
-        self.level_comments_cache = level_comments
+        if not difference:
+            return
 
-        if difference and self.update:
+        if self.update:
             await level.update()
 
         for comment in difference:
@@ -336,6 +594,8 @@ class LevelCommentListener(Listener):
 
 @define()
 class DailyCommentListener(LevelCommentListener):
+    EVENT: ClassVar[str] = "daily_comment"
+
     level_id: int = TimelyID.DAILY.value
 
     async def get_level(self) -> Level:
@@ -347,6 +607,8 @@ class DailyCommentListener(LevelCommentListener):
 
 @define()
 class WeeklyCommentListener(LevelCommentListener):
+    EVENT: ClassVar[str] = "weekly_comment"
+
     level_id: int = TimelyID.WEEKLY.value
 
     async def get_level(self) -> Level:
@@ -366,6 +628,9 @@ class UserBasedListener(Listener):
     name: Optional[str] = None
 
     async def find_user(self) -> User:
+        return await self.fetch((USER, self.account_id, self.id, self.name), self.search_user)
+
+    async def search_user(self) -> User:
         client = self.client
 
         account_id = self.account_id
@@ -393,13 +658,20 @@ class UserBasedListener(Listener):
 
 @define()
 class UserCommentListener(UserBasedListener):
+    EVENT: ClassVar[str] = "user_comment"
+
     pages_count: int = field(default=DEFAULT_PAGES_COUNT)
 
     update: bool = DEFAULT_UPDATE
 
     user: Optional[User] = field(default=None, init=False)
 
-    user_comments_cache: List[UserComment] = field(factory=list, init=False)
+    @property
+    def user_comments_cache(self) -> List[UserComment]:
+        """Deprecated; the items observed on the last step."""
+        warn_observed_deprecated(USER_COMMENTS_CACHE)
+
+        return self._observed
 
     async def step(self) -> None:
         user = self.user
@@ -407,23 +679,21 @@ class UserCommentListener(UserBasedListener):
         if user is None:
             self.user = user = await self.find_user()
 
-        user_comments = await user.get_comments(pages=range(self.pages_count))
+        pages = range(self.pages_count)
+
+        user_comments = await self.fetch(
+            (USER_COMMENTS, user.account_id, pages), lambda: user.get_comments(pages=pages).list()
+        )
 
         if not user_comments:
             return
 
-        user_comments_cache = self.user_comments_cache
-
-        if not user_comments_cache:
-            self.user_comments_cache = user_comments
+        difference = await self.observe(stream(USER_COMMENTS, user.account_id), user_comments)
 
+        if not difference:
             return
 
-        difference = differ(user_comments_cache, user_comments)
-
-        self.user_comments_cache = user_comments
-
-        if difference and self.update:
+        if self.update:
             await user.update()
 
         client = self.client
@@ -434,13 +704,20 @@ class UserCommentListener(UserBasedListener):
 
 @define()
 class UserLevelCommentListener(UserBasedListener):
+    EVENT: ClassVar[str] = "user_level_comment"
+
     pages_count: int = field(default=DEFAULT_PAGES_COUNT)
 
     update: bool = DEFAULT_UPDATE
 
     user: Optional[User] = field(default=None, init=False)
 
-    user_level_comments_cache: List[LevelComment] = field(factory=list, init=False)
+    @property
+    def user_level_comments_cache(self) -> List[LevelComment]:
+        """Deprecated; the items observed on the last step."""
+        warn_observed_deprecated(USER_LEVEL_COMMENTS_CACHE)
+
+        return self._observed
 
     async def step(self) -> None:
         user = self.user
@@ -448,23 +725,24 @@ class UserLevelCommentListener(UserBasedListener):
         if user is None:
             self.user = user = await self.find_user()
 
-        user_level_comments = await user.get_level_comments(pages=range(self.pages_count))
+        pages = range(self.pages_count)
+
+        user_level_comments = await self.fetch(
+            (USER_LEVEL_COMMENTS, user.account_id, pages),
+            lambda: user.get_level_comments(pages=pages).list(),
+        )
 
         if not user_level_comments:
             return
 
-        user_level_comments_cache = self.user_level_comments_cache
-
-        if not user_level_comments_cache:
-            self.user_level_comments_cache = user_level_comments
+        difference = await self.observe(
+            stream(USER_LEVEL_COMMENTS, user.account_id), user_level_comments
+        )
 
+        if not difference:
             return
 
-        difference = differ(user_level_comments_cache, user_level_comments)
-
-        self.user_level_comments_cache = user_level_comments
-
-        if difference and self.update:
+        if self.update:
             await user.update()
 
         client = self.client
@@ -475,13 +753,20 @@ class UserLevelCommentListener(UserBasedListener):
 
 @define()
 class UserLevelListener(UserBasedListener):
+    EVENT: ClassVar[str] = "user_level"
+
     pages_count: int = field(default=DEFAULT_PAGES_COUNT)
 
     update: bool = field(default=DEFAULT_UPDATE)
 
     user: Optional[User] = field(default=None, init=False)
 
-    user_levels_cache: List[Level] = field(factory=list, init=False)
+    @property
+    def user_levels_cache(self) -> List[Level]:
+        """Deprecated; the items observed on the last step."""
+        warn_observed_deprecated(USER_LEVELS_CACHE)
+
+        return self._observed
 
     async def step(self) -> None:
         user = self.user
@@ -489,23 +774,21 @@ class UserLevelListener(UserBasedListener):
         if user is None:
             self.user = user = await self.find_user()
 
-        user_levels = await user.get_levels(pages=range(self.pages_count))
+        pages = range(self.pages_count)
+
+        user_levels = await self.fetch(
+            (USER_LEVELS, user.id, pages), lambda: user.get_levels(pages=pages).list()
+        )
 
         if not user_levels:
             return
 
-        user_levels_cache = self.user_levels_cache
-
-        if not user_levels_cache:
-            self.user_levels_cache = user_levels
+        difference = await self.observe(stream(USER_LEVELS, user.id), user_levels)
 
+        if not difference:
             return
 
-        difference = differ(user_levels_cache, user_levels)
-
-        self.user_levels_cache = user_levels
-
-        if difference and self.update:
+        if self.update:
             await user.update()
 
         client = self.client
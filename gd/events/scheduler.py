@@ -0,0 +1,124 @@
+from random import Random
+
+from attrs import define, field
+
+from gd.constants import DEFAULT_DELAY
+
+__all__ = ("PollScheduler",)
+
+DEFAULT_MAX_DELAY = 600.0
+"""The default maximum delay (in seconds) between polls."""
+
+DEFAULT_BACKOFF = 1.5
+"""The default factor to multiply the delay by after polls that saw no changes."""
+
+DEFAULT_SPEEDUP = 0.25
+"""The default factor to multiply the delay by after polls that saw changes."""
+
+DEFAULT_JITTER = 0.1
+"""The default jitter, relative to the delay."""
+
+EXPECTED_ORDERED_DELAYS = "expected `min_delay` to be at most `max_delay`"
+
+
+@define()
+class PollScheduler:
+    """Represents adaptive schedulers of listener polls.
+
+    After each poll that saw no changes, the delay is multiplied by `backoff`,
+    up to `max_delay`; once changes are seen, the delay is multiplied by `speedup`,
+    down to `min_delay`.
+
+    Each delay is randomly spread by `jitter` (relative to the delay),
+    so that many listeners do not poll in lockstep.
+    """
+
+    min_delay: float = field(default=DEFAULT_DELAY)
+    max_delay: float = field(default=DEFAULT_MAX_DELAY)
+
+    backoff: float = field(default=DEFAULT_BACKOFF)
+    speedup: float = field(default=DEFAULT_SPEEDUP)
+
+    jitter: float = field(default=DEFAULT_JITTER)
+
+    random: Random = field(factory=Random, repr=False)
+
+    delay: float = field(init=False)
+
+    @max_delay.validator
+    def check_max_delay(self, attribute: object, max_delay: float) -> None:
+        if self.min_delay > max_delay:
+            raise ValueError(EXPECTED_ORDERED_DELAYS)
+
+    @delay.default
+    def default_delay(self) -> float:
+        return self.min_delay
+
+    def reset(self) -> None:
+        """Resets the delay to `min_delay`."""
+        self.delay = self.min_delay
+
+    def observe(self, changed: bool) -> float:
+        """Records the outcome of the poll and computes the delay before the next one.
+
+        Arguments:
+            changed: Whether the poll saw any changes.
+
+        Returns:
+            The delay before the next poll, without jitter.
+        """
+        if changed:
+            delay = max(self.delay * self.speedup, self.min_delay)
+
+        else:
+            delay = min(self.delay * self.backoff, self.max_delay)
+
+        self.delay = delay
+
+        return delay
+
+    def spread(self, delay: float) -> float:
+        """Randomly spreads the `delay` by `jitter` in both directions.
+
+        Arguments:
+            delay: The delay to spread.
+
+        Returns:
+            The spread delay.
+        """
+        jitter = delay * self.jitter
+
+        return max(delay + self.random.uniform(-jitter, jitter), 0.0)
+
+    def next_delay(self, changed: bool) -> float:
+        """Same as [`observe`][gd.events.scheduler.PollScheduler.observe],
+        except the returned delay is [`spread`][gd.events.scheduler.PollScheduler.spread].
+
+        Arguments:
+            changed: Whether the poll saw any changes.
+
+        Returns:
+            The delay before the next poll.
+        """
+        return self.spread(self.observe(changed))
+
+    def align(self, delay: float) -> float:
+        """Jitters the `delay` provided by the server (e.g. the time left),
+        only ever postponing the poll so that it does not happen too early.
+
+        Arguments:
+            delay: The delay to align to.
+
+        Returns:
+            The aligned delay.
+        """
+        return delay + self.random.uniform(0.0, delay * self.jitter)
+
+    def initial_delay(self) -> float:
+        """Computes the random delay before the first poll,
+        spreading the start of many listeners over `min_delay`.
+
+        Returns:
+            The delay before the first poll.
+        """
+        return self.random.uniform(0.0, self.min_delay)
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, new_event_loop, set_event_loop
+from builtins import getattr as get_attribute
+from builtins import setattr as set_attribute
+from io import BytesIO
+from multiprocessing import get_context
+from multiprocessing.context import SpawnContext
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from os import cpu_count
+from pickle import HIGHEST_PROTOCOL, Pickler, Unpickler, UnpicklingError
+from threading import Thread
+from typing import TYPE_CHECKING, IO, AbstractSet, Any, Dict, List, Optional, Tuple
+
+from attrs import define, field
+from funcs.functions import awaiting
+from typing_aliases import DynamicTuple, NormalError
+
+from gd.asyncio import run_blocking, shutdown_loop
+from gd.events.controller import (
+    CONTROLLER_ALREADY_STARTED,
+    CONTROLLER_NOT_RUNNING,
+    Controller,
+    Listeners,
+    convert_listeners,
+)
+from gd.events.dispatcher import DispatchQueue
+from gd.events.listeners import Listener
+
+if TYPE_CHECKING:
+    from gd.client import Client
+    from gd.entity import Entity
+
+__all__ = ("ShardedController",)
+
+EVENTS = (
+    "daily",
+    "weekly",
+    "rate",
+    "level",
+    "user_level",
+    "message",
+    "friend_request",
+    "level_comment",
+    "daily_comment",
+    "weekly_comment",
+    "user_comment",
+    "user_level_comment",
+)
+"""The names of events forwarded from shards."""
+
+ON = "on_{}"
+DISPATCH = "dispatch_{}"
+
+DEFAULT_JOIN_TIMEOUT = 5.0
+
+EXPECTED_POSITIVE_SHARDS = "expected `shards` to be positive"
+
+CLIENT = "client"
+"""The persistent ID of clients, which are never sent between processes."""
+
+UNSUPPORTED_PERSISTENT_ID = "unsupported persistent ID: {!r}"
+
+IndexedListener = Tuple[int, Listener]
+
+Event = Tuple[int, str, bytes]
+"""Events sent from shards, that is, the listener index, the event name and the entities."""
+
+
+def default_shards() -> int:
+    return cpu_count() or 1
+
+
+class EntityPickler(Pickler):
+    """Pickles entities, replacing the given clients with [`CLIENT`][gd.events.sharding.CLIENT]."""
+
+    def __init__(self, file: IO[bytes], clients: AbstractSet[int]) -> None:
+        super().__init__(file, HIGHEST_PROTOCOL)
+
+        self.clients = clients
+
+    def persistent_id(self, object: Any) -> Optional[str]:
+        if id(object) in self.clients:
+            return CLIENT
+
+        return None
+
+
+class EntityUnpickler(Unpickler):
+    """Unpickles entities, attaching the given client in place of
+    [`CLIENT`][gd.events.sharding.CLIENT].
+    """
+
+    def __init__(self, file: IO[bytes], client: Client) -> None:
+        super().__init__(file)
+
+        self.client = client
+
+    def persistent_load(self, persistent_id: Any) -> Any:
+        if persistent_id == CLIENT:
+            return self.client
+
+        raise UnpicklingError(UNSUPPORTED_PERSISTENT_ID.format(persistent_id))
+
+
+def dump_entities(entities: DynamicTuple[Entity], clients: AbstractSet[int]) -> bytes:
+    """Pickles the `entities`, omitting the clients with the given IDs.
+
+    Arguments:
+        entities: The entities to pickle.
+        clients: The IDs of the clients to omit.
+
+    Returns:
+        The pickled entities.
+    """
+    file = BytesIO()
+
+    EntityPickler(file, clients).dump(entities)
+
+    return file.getvalue()
+
+
+def load_entities(data: bytes, client: Client) -> DynamicTuple[Entity]:
+    """Unpickles the entities, attaching the `client` in place of the omitted clients.
+
+    Arguments:
+        data: The pickled entities.
+        client: The client to attach.
+
+    Returns:
+        The unpickled entities.
+    """
+    return EntityUnpickler(BytesIO(data), client).load()  # type: ignore[no-any-return]
+
+
+def create_forwarder(
+    queue: Queue[Optional[Event]], index: int, name: str, clients: AbstractSet[int]
+) -> Any:
+    async def forward(*entities: Entity) -> None:
+        queue.put((index, name, dump_entities(entities, clients)))
+
+    return forward
+
+
+def forward_events(queue: Queue[Optional[Event]], listeners: List[IndexedListener]) -> None:
+    """Makes the clients of the `listeners` forward their events to the `queue`.
+
+    Entities are pickled as they are, except for their clients, which are attached
+    back in the parent process.
+
+    Arguments:
+        queue: The queue to forward events to.
+        listeners: The listeners, along with their indices.
+    """
+    clients: Dict[int, Client] = {}
+
+    for index, listener in listeners:
+        client = listener.client
+
+        if id(client) in clients:
+            continue
+
+        clients[id(client)] = client
+
+        for name in EVENTS:
+            set_attribute(
+                client, ON.format(name), create_forwarder(queue, index, name, clients.keys())
+            )
+
+
+def run_shard(queue: Queue[Optional[Event]], listeners: List[IndexedListener]) -> None:
+    """Runs the shard in the worker process, forwarding the events to the `queue`.
+
+    Arguments:
+        queue: The queue to forward events to.
+        listeners: The listeners of the shard, along with their indices.
+    """
+    forward_events(queue, listeners)
+
+    Controller(listener for _, listener in listeners).run()
+
+
+@define()
+class ShardedController:
+    """Represents controllers that partition listeners across worker processes.
+
+    Each shard runs its own [`Controller`][gd.events.controller.Controller],
+    and therefore its own event loop, HTTP session and subscription hub.
+    Events are sent back to the parent process over the queue, and dispatched
+    on the clients of the original listeners there.
+
+    Worker processes are always started with the `spawn` start method, since forking
+    the process that runs other threads (the controller itself included) is unsafe.
+    Therefore listeners (including their clients) have to be picklable.
+
+    Example:
+        ```python
+        controller = client.create_sharded_controller(shards=4)
+
+        controller.start()
+        ```
+    """
+
+    listeners: Listeners = field(default=(), converter=convert_listeners)
+
+    shards: int = field(factory=default_shards)
+    """The number of worker processes to use."""
+
+    loop: AbstractEventLoop = field(factory=new_event_loop)
+
+    dispatcher: Optional[DispatchQueue] = field(default=None)
+    """The dispatch queue used for the events received from the shards.
+
+    If not given, events are dispatched right away, without any bounds.
+    """
+
+    _context: SpawnContext = field(init=False, repr=False)
+
+    _processes: List[BaseProcess] = field(factory=list, init=False, repr=False)
+    _queue: Optional[Queue[Optional[Event]]] = field(default=None, init=False, repr=False)
+    _thread: Optional[Thread] = field(default=None, init=False, repr=False)
+
+    @shards.validator
+    def check_shards(self, attribute: object, shards: int) -> None:
+        if shards < 1:
+            raise ValueError(EXPECTED_POSITIVE_SHARDS)
+
+    @_context.default
+    def default_context(self) -> SpawnContext:
+        return get_context("spawn")
+
+    def partition(self) -> List[List[IndexedListener]]:
+        """Partitions the listeners across the shards, in a round-robin manner.
+
+        Empty shards are omitted.
+
+        Returns:
+            The list of shards, that is, lists of listeners along with their indices.
+        """
+        shards: List[List[IndexedListener]] = [[] for _ in range(self.shards)]
+
+        for index, listener in enumerate(self.listeners):
+            shards[index % self.shards].append((index, listener))
+
+        return [shard for shard in shards if shard]
+
+    async def dispatch(self, event: Event) -> None:
+        index, name, data = event
+
+        client = self.listeners[index].client
+
+        entities = [entity.attach_client(client) for entity in load_entities(data, client)]
+
+        await get_attribute(client, DISPATCH.format(name))(*entities)
+
+    async def receive(self, queue: Queue[Optional[Event]]) -> None:
+        dispatcher = self.dispatcher
+
+        while True:
+            event = await run_blocking(queue.get)
+
+            if event is None:
+                break
+
+            if dispatcher is None:
+                self.loop.create_task(awaiting(self.dispatch(event)))
+
+                continue
+
+            _, name, _ = event
+
+            await dispatcher.put(self.dispatch(event), name)
+
+        if dispatcher is not None:
+            await dispatcher.join()
+
+    def run(self) -> None:
+        loop = self.loop
+
+        set_event_loop(loop)
+
+        context = self._context
+
+        self._queue = queue = context.Queue()
+
+        processes = self._processes
+
+        for shard in self.partition():
+            process = context.Process(target=run_shard, args=(queue, shard), daemon=True)
+
+            process.start()
+
+            processes.append(process)
+
+        try:
+            loop.run_until_complete(self.receive(queue))
+
+        except KeyboardInterrupt:
+            pass
+
+        try:
+            shutdown_loop(loop)
+
+        except NormalError:
+            pass
+
+    def start(self) -> None:
+        thread = self._thread
+
+        if thread is not None:
+            raise RuntimeError(CONTROLLER_ALREADY_STARTED)
+
+        self._thread = thread = Thread(target=self.run, daemon=True)
+
+        thread.start()
+
+    def stop(self) -> None:
+        thread = self._thread
+
+        if thread is None:
+            raise RuntimeError(CONTROLLER_NOT_RUNNING)
+
+        processes = self._processes
+
+        for process in processes:
+            process.terminate()
+
+        for process in processes:
+            process.join(DEFAULT_JOIN_TIMEOUT)
+
+        processes.clear()
+
+        queue = self._queue
+
+        if queue is not None:
+            queue.put(None)
+
+        thread.join()
+
+        self._queue = None
+        self._thread = None
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from collections import deque
+from json import dumps as dump_json
+from json import loads as load_json
+from os import replace
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Protocol, Set, TypeVar
+
+from attrs import define, field
+from typing_aliases import IntoPath
+
+from gd.asyncio import run_blocking
+
+__all__ = ("SeenRing", "Watermark", "WatermarkStore")
+
+DEFAULT_RING_SIZE = 256
+"""The default number of recently seen IDs to remember per stream."""
+
+UTF_8 = "utf-8"
+
+TEMPORARY_SUFFIX = ".tmp"
+
+HIGH = "high"
+SEEN = "seen"
+
+
+class HasID(Protocol):
+    @property
+    def id(self) -> int:
+        ...
+
+
+I = TypeVar("I", bound=HasID)
+
+
+@define()
+class SeenRing:
+    """Represents bounded rings of recently seen IDs, with constant-time lookups."""
+
+    size: int = field(default=DEFAULT_RING_SIZE)
+
+    _order: Deque[int] = field(factory=deque, init=False, repr=False)
+    _set: Set[int] = field(factory=set, init=False, repr=False)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._set
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add(self, id: int) -> None:
+        if id in self._set:
+            return
+
+        order = self._order
+
+        if len(order) >= self.size:
+            self._set.discard(order.popleft())
+
+        order.append(id)
+
+        self._set.add(id)
+
+    def to_list(self) -> List[int]:
+        return list(self._order)
+
+
+@define()
+class Watermark:
+    """Represents high-water marks of streams, that is, the highest ID seen
+    along with the ring of recently seen IDs.
+
+    In *ordered* streams, where new items always have higher IDs,
+    items are new if their ID is above the high-water mark.
+    Otherwise (for instance, for rated levels) items are new if they are not in the ring,
+    which therefore has to be larger than the number of items watched.
+    """
+
+    high: int = field(default=0)
+    seen: SeenRing = field(factory=SeenRing)
+
+    def is_new(self, id: int, ordered: bool = True) -> bool:
+        if ordered:
+            return id > self.high
+
+        return id not in self.seen
+
+    def observe(self, items: Iterable[I], ordered: bool = True) -> List[I]:
+        """Observes the `items`, returning the new ones and updating the watermark.
+
+        Arguments:
+            items: The items to observe.
+            ordered: Whether new items always have higher IDs.
+
+        Returns:
+            The new items, in the original order.
+        """
+        new = [item for item in items if self.is_new(item.id, ordered)]
+
+        seen = self.seen
+
+        for item in new:
+            id = item.id
+
+            seen.add(id)
+
+            if id > self.high:
+                self.high = id
+
+        return new
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {HIGH: self.high, SEEN: self.seen.to_list()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], ring_size: int = DEFAULT_RING_SIZE) -> Watermark:
+        seen = SeenRing(ring_size)
+
+        for id in data[SEEN]:
+            seen.add(id)
+
+        return cls(data[HIGH], seen)
+
+
+def convert_path(path: Optional[IntoPath]) -> Optional[Path]:
+    if path is None:
+        return None
+
+    return Path(path)
+
+
+@define()
+class WatermarkStore:
+    """Represents stores of watermarks, keyed by stream names.
+
+    If the `path` is given, watermarks are loaded from it on first access
+    and saved back atomically whenever they change, so that listeners
+    do not dispatch the same items again after restarts.
+
+    Since observing items marks them as seen, listeners watching the same stream
+    should use separate stores.
+    """
+
+    path: Optional[Path] = field(default=None, converter=convert_path)
+    ring_size: int = field(default=DEFAULT_RING_SIZE)
+
+    _watermarks: Optional[Dict[str, Watermark]] = field(default=None, init=False, repr=False)
+
+    def read(self) -> Dict[str, Watermark]:
+        """Reads the watermarks from the `path`, if any.
+
+        Note that this method performs blocking I/O.
+
+        Returns:
+            The watermarks read, keyed by stream names.
+        """
+        watermarks: Dict[str, Watermark] = {}
+
+        path = self.path
+
+        if path is not None and path.exists():
+            ring_size = self.ring_size
+
+            data: Dict[str, Dict[str, Any]] = load_json(path.read_text(UTF_8))
+
+            for stream, watermark_data in data.items():
+                watermarks[stream] = Watermark.from_dict(watermark_data, ring_size)
+
+        return watermarks
+
+    def load(self) -> Dict[str, Watermark]:
+        watermarks = self._watermarks
+
+        if watermarks is None:
+            self._watermarks = watermarks = self.read()
+
+        return watermarks
+
+    async def load_async(self) -> Dict[str, Watermark]:
+        """Loads the watermarks, reading them in the executor on first access.
+
+        Returns:
+            The watermarks, keyed by stream names.
+        """
+        if self._watermarks is None:
+            watermarks = await run_blocking(self.read)
+
+            if self._watermarks is None:  # could have been loaded while reading
+                self._watermarks = watermarks
+
+        return self.load()
+
+    def get(self, stream: str) -> Optional[Watermark]:
+        return self.load().get(stream)
+
+    def create(self, stream: str) -> Watermark:
+        watermark = Watermark(seen=SeenRing(self.ring_size))
+
+        self.load()[stream] = watermark
+
+        return watermark
+
+    def save(self) -> None:
+        path = self.path
+
+        if path is None:
+            return
+
+        data = {stream: watermark.to_dict() for stream, watermark in self.load().items()}
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temporary = path.with_name(path.name + TEMPORARY_SUFFIX)
+
+        temporary.write_text(dump_json(data), UTF_8)
+
+        replace(temporary, path)
+
+    async def observe(
+        self, stream: str, items: Iterable[I], ordered: bool = True
+    ) -> Optional[List[I]]:
+        """Observes the `items` of the `stream`, returning the new ones.
+
+        If the stream is observed for the first time, the items are recorded as seen,
+        and `None` is returned, since there is nothing to compare them against.
+
+        Arguments:
+            stream: The name of the stream.
+            items: The items to observe.
+            ordered: Whether new items of the stream always have higher IDs.
+
+        Returns:
+            The new items, or `None` if the stream is observed for the first time.
+        """
+        watermarks = await self.load_async()
+
+        watermark = watermarks.get(stream)
+
+        if watermark is None:
+            self.create(stream).observe(items, ordered)
+
+            new = None
+
+        else:
+            new = watermark.observe(items, ordered)
+
+            if not new:
+                return new
+
+        if self.path is not None:
+            await run_blocking(self.save)
+
+        return new
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-from asyncio import Lock, get_running_loop, new_event_loop, set_event_loop, sleep
+from asyncio import CancelledError, get_running_loop, new_event_loop, set_event_loop, sleep
 from atexit import register as register_at_exit
 from builtins import getattr as get_attribute
 from builtins import setattr as set_attribute
+from functools import partial
 from io import BytesIO
 from pathlib import Path
 from random import randrange as get_random_range
+from time import perf_counter
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Awaitable,
     BinaryIO,
     ClassVar,
     Generic,
+    Hashable,
+    List,
     Literal,
     Mapping,
     Optional,
@@ -37,6 +43,7 @@ from typing_aliases import (
     IntoPath,
     Namespace,
     NormalError,
+    Nullary,
     Parameters,
     is_bytes,
     is_string,
@@ -47,6 +54,7 @@ from yarl import URL
 from gd.api.recording import Recording
 from gd.asyncio import run_blocking, shutdown_loop
 from gd.capacity import Capacity
+from gd.connections import ConnectionSettings, SessionKey, acquire_session, release_session
 from gd.constants import (
     DEFAULT_ATTEMPTS,
     DEFAULT_CHECK,
@@ -124,12 +132,19 @@ from gd.errors import (
 from gd.filters import Filters
 from gd.models import CommentBannedModel
 from gd.models_constants import OBJECT_SEPARATOR
+from gd.metrics import Hooks
 from gd.models_utils import bool_str
 from gd.password import Password
 from gd.progress import Progress
+from gd.proxies import ProxyPool, ProxyState
 from gd.queries import EMPTY_QUERY
+from gd.rate_limiter import RateLimiter
+from gd.response_cache import ResponseCache, cache_key
+from gd.retries import RETRY_AFTER, RetryPolicy
+from gd.single_flight import SingleFlight, canonicalize
 from gd.string_utils import case_fold, password_str, snake_to_camel_with_abbreviations
 from gd.time import Timer
+from gd.transport import Transport, TransportRequest, TransportResponse
 from gd.version import python_version_info, version_info
 from gd.versions import (
     CURRENT_BINARY_VERSION,
@@ -222,6 +237,115 @@ GET_SONG = "getGJSongInfo.php"
 GET_LEVEL_LISTS = "getGJLevelLists.php"
 GET_PLATFORMER_LEADERBOARD = "getGJLevelScoresPlat.php"
 
+IDEMPOTENT_ROUTES = frozenset(
+    (
+        LOGIN,
+        LOAD,
+        GET_ACCOUNT_URL,
+        GET_ROLE_ID,
+        GET_USERS,
+        GET_USER,
+        GET_RELATIONSHIPS,
+        GET_LEADERBOARD,
+        GET_LEVELS,
+        GET_TIMELY,
+        GET_LEVEL,
+        GET_LEVEL_LEADERBOARD,
+        GET_MESSAGE,
+        GET_MESSAGES,
+        GET_FRIEND_REQUESTS,
+        GET_USER_LEVEL_COMMENTS,
+        GET_USER_COMMENTS,
+        GET_LEVEL_COMMENTS,
+        GET_GAUNTLETS,
+        GET_MAP_PACKS,
+        GET_QUESTS,
+        GET_ARTISTS,
+        GET_SONG,
+        GET_LEVEL_LISTS,
+        GET_PLATFORMER_LEADERBOARD,
+    )
+)
+"""The routes that only read data and are therefore safe to retry."""
+
+
+def route_name(route: str) -> str:
+    _, _, name = route.rpartition(SLASH)
+
+    return name
+
+
+def default_retry_policy() -> RetryPolicy:
+    return RetryPolicy(idempotent=frozenset(map(route_name, IDEMPOTENT_ROUTES)))
+
+
+HOUR = 60.0 * 60.0
+DAY = 24.0 * HOUR
+
+CACHEABLE_ROUTES = frozenset(
+    map(
+        route_name,
+        (
+            GET_USERS,
+            GET_USER,
+            GET_LEADERBOARD,
+            GET_LEVELS,
+            GET_LEVEL,
+            GET_USER_LEVEL_COMMENTS,
+            GET_USER_COMMENTS,
+            GET_LEVEL_COMMENTS,
+            GET_GAUNTLETS,
+            GET_MAP_PACKS,
+            GET_ARTISTS,
+            GET_SONG,
+            GET_LEVEL_LISTS,
+        ),
+    )
+)
+"""The names of public read-only routes that responses can be persistently cached for.
+
+Responses of other routes (e.g. logging in, loading account data or reading messages)
+and of requests made with account credentials are never cached.
+"""
+
+DEFAULT_RESPONSE_CACHE_TTLS = {
+    route_name(GET_GAUNTLETS): DAY,
+    route_name(GET_MAP_PACKS): DAY,
+    route_name(GET_ARTISTS): DAY,
+    route_name(GET_SONG): DAY,
+}
+"""The suggested time-to-live values for [`ResponseCache`][gd.response_cache.ResponseCache]."""
+
+CREDENTIALS = frozenset(("gjp", "gjp2", "password"))
+"""The names of parameters that carry account credentials."""
+
+
+def is_authenticated(data: Optional[Parameters]) -> bool:
+    if data is None:
+        return False
+
+    return not CREDENTIALS.isdisjoint(data)
+
+
+ACCOUNT_ID = "accountID"
+
+
+def find_account_id(data: Optional[Parameters]) -> Optional[int]:
+    if data is None:
+        return None
+
+    account_id = data.get(ACCOUNT_ID)
+
+    if account_id is None:
+        return None
+
+    try:
+        return int(account_id)
+
+    except (TypeError, ValueError):
+        return None
+
+
 VALID_ERRORS = (OSError, ClientError)
 
 HEAD = "HEAD"
@@ -240,6 +364,13 @@ TRACE = "TRACE"
 HTTP_SUCCESS = 200
 HTTP_REDIRECT = 300
 HTTP_ERROR = 400
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_SERVER_ERROR = 500
+
+
+def is_proxy_success(status: int) -> bool:
+    return status < HTTP_SERVER_ERROR and status != HTTP_TOO_MANY_REQUESTS
+
 
 CHUNK_SIZE = 65536
 
@@ -381,6 +512,10 @@ DEFAULT_GD_WORLD = False
 
 DEFAULT_SEND_USER_AGENT = False
 
+DEFAULT_SHARE_SESSION = True
+
+DEFAULT_COALESCE = True
+
 DEFAULT_WITH_BAR = False
 
 DEFUALT_RETRIES = 2
@@ -401,6 +536,30 @@ UNIT_SCALE = True
 
 ErrorCodes = Mapping[int, AnyError]
 
+
+def check_error_code(data: AnyString, error_codes: ErrorCodes) -> None:
+    error_code = try_parse_error_code(data)
+
+    if error_code:
+        raise error_codes.get(error_code, unexpected_error_code(error_code))
+
+
+ERROR_CODE_SIZE = 16
+"""The size (in bytes) of response heads buffered when streaming, to detect error codes."""
+
+
+async def split_body(response: TransportResponse, chunk_size: int) -> AsyncIterator[bytes]:
+    status = response.status
+
+    if status >= HTTP_ERROR:
+        raise HTTPStatusError(status)
+
+    body = response.body
+
+    for index in range(0, len(body), chunk_size):
+        yield body[index : index + chunk_size]
+
+
 C = TypeVar("C", bound="HTTPClient")
 
 NAME_TOO_SHORT = "`name` is too short"
@@ -530,14 +689,28 @@ class HTTPClient:
     url: URLString = field(default=BASE)
     proxy: Optional[str] = field(default=None, repr=False)
     proxy_auth: Optional[BasicAuth] = field(default=None, repr=False)
+    proxy_pool: Optional[ProxyPool] = field(default=None, repr=False)
     timeout: float = field(default=DEFAULT_TIMEOUT)
     game_version: GameVersion = field(default=CURRENT_GAME_VERSION)
     binary_version: RobTopVersion = field(default=CURRENT_BINARY_VERSION)
     gd_world: bool = field(default=DEFAULT_GD_WORLD)
     forwarded_for: Optional[str] = field(default=None, repr=False)
     send_user_agent: bool = field(default=DEFAULT_SEND_USER_AGENT, repr=False)
+    retry_policy: RetryPolicy = field(factory=default_retry_policy, repr=False)
+    rate_limiter: Optional[RateLimiter] = field(default=None, repr=False)
+    connection_settings: ConnectionSettings = field(factory=ConnectionSettings, repr=False)
+    share_session: bool = field(default=DEFAULT_SHARE_SESSION, repr=False)
+    coalesce: bool = field(default=DEFAULT_COALESCE, repr=False)
+    response_cache: Optional[ResponseCache] = field(default=None, repr=False)
+    transport: Optional[Transport] = field(default=None, repr=False)
+    hooks: List[Hooks] = field(factory=list, repr=False)
 
     session_unchecked: Optional[ClientSession] = field(default=None, repr=False, init=False)
+    session_key: Optional[SessionKey] = field(default=None, repr=False, init=False)
+
+    single_flight: SingleFlight[Hashable, Optional[ResponseData]] = field(
+        factory=SingleFlight, repr=False, init=False
+    )
 
     def __attrs_post_init__(self) -> None:
         add_client(self)
@@ -557,10 +730,12 @@ class HTTPClient:
     @session.setter
     def session(self, session: ClientSession) -> None:
         self.session_unchecked = session
+        self.session_key = None
 
     @session.deleter
     def session(self) -> None:
         self.session_unchecked = None
+        self.session_key = None
 
     def has_session(self) -> bool:
         return self.session_unchecked is not None
@@ -575,27 +750,50 @@ class HTTPClient:
         session = self.session_unchecked
 
         if session is not None:
-            await session.close()
+            session_key = self.session_key
+
+            if session_key is None:
+                await session.close()
+
+            else:
+                await release_session(session_key, session)
 
             self.session_unchecked = None
+            self.session_key = None
+
+    def create_session_key(self) -> SessionKey:
+        return (str(URL(self.url).origin()), self.connection_settings)
 
     async def create_session(self) -> ClientSession:
-        return ClientSession(skip_auto_headers=self.SKIP_HEADERS)
+        return ClientSession(
+            connector=self.connection_settings.create_connector(),
+            skip_auto_headers=self.SKIP_HEADERS,
+        )
 
     async def ensure_session(self) -> ClientSession:
         session = self.session_unchecked
 
-        if session is None:
-            self.session_unchecked = session = await self.create_session()
+        if session is not None:
+            loop = get_running_loop()
 
-        loop = get_running_loop()
+            optional_loop = get_attribute(session, LOOP, None)
 
-        optional_loop = get_attribute(session, LOOP, None)
+            if optional_loop is loop and not session.closed:
+                return session
 
-        if optional_loop is not loop:
             await self.close()
 
-            self.session_unchecked = session = await self.create_session()
+        if self.share_session:
+            session_key = self.create_session_key()
+
+            session = await acquire_session(session_key, self.create_session)
+
+            self.session_key = session_key
+
+        else:
+            session = await self.create_session()
+
+        self.session_unchecked = session
 
         return session
 
@@ -822,90 +1020,409 @@ class HTTPClient:
         retries: int = DEFUALT_RETRIES,
         errors: str = DEFAULT_ERRORS,
     ) -> Optional[ResponseData]:
-        session = await self.ensure_session()
+        name = URL(url).name
+
+        if read and self.retry_policy.is_idempotent(method, name):
+            key = (
+                method,
+                str(url),
+                type,
+                canonicalize(data),
+                canonicalize(parameters),
+                canonicalize(headers, ()),
+                errors,
+            )
 
-        if retries < 0:
-            attempts = -1
+            function = partial(
+                self.send_request,
+                method=method,
+                url=url,
+                type=type,
+                read=read,
+                data=data,
+                parameters=parameters,
+                error_codes=error_codes,
+                headers=headers,
+                retries=retries,
+                errors=errors,
+            )
 
-        else:
-            attempts = retries + 1
+            response_cache = self.response_cache
+
+            if (
+                response_cache is not None
+                and name in CACHEABLE_ROUTES
+                and response_cache.covers(name)
+                and type is not ResponseType.JSON
+                and not is_authenticated(data)
+                and not is_authenticated(parameters)
+            ):
+                function = partial(
+                    self.send_cached_request, response_cache, cache_key(key), name, function
+                )
 
-        if headers is None:
-            headers = {}
+            if self.coalesce:
+                return await self.single_flight.run(key, function)
 
-        else:
-            headers = dict(headers)
+            return await function()
 
-        if self.send_user_agent:
-            headers.setdefault(USER_AGENT, self.USER_AGENT)
+        return await self.send_request(
+            method=method,
+            url=url,
+            type=type,
+            read=read,
+            data=data,
+            parameters=parameters,
+            error_codes=error_codes,
+            headers=headers,
+            retries=retries,
+            errors=errors,
+        )
 
-        forwarded_for = self.forwarded_for
+    async def send_cached_request(
+        self,
+        response_cache: ResponseCache,
+        key: str,
+        name: str,
+        function: Nullary[Awaitable[Optional[ResponseData]]],
+    ) -> Optional[ResponseData]:
+        cached = await run_blocking(response_cache.get, key, name)
 
-        if forwarded_for:
-            headers.setdefault(FORWARDED_FOR, forwarded_for)
+        if cached is not None:
+            return cached
+
+        response = await function()
+
+        if is_bytes(response) or is_string(response):
+            await run_blocking(response_cache.put, key, name, response)
+
+        return response
+
+    async def send_request(
+        self,
+        method: str,
+        url: URLString,
+        type: ResponseType = ResponseType.DEFAULT,
+        read: bool = DEFAULT_READ,
+        data: Optional[Parameters] = None,
+        parameters: Optional[Parameters] = None,
+        error_codes: Optional[ErrorCodes] = None,
+        headers: Optional[Headers] = None,
+        retries: int = DEFUALT_RETRIES,
+        errors: str = DEFAULT_ERRORS,
+    ) -> Optional[ResponseData]:
+        retry_policy = self.retry_policy
+
+        name = URL(url).name
+
+        attempts = retry_policy.compute_attempts(method, name, retries)
+
+        rate_limiter = self.rate_limiter
+
+        account_id = find_account_id(data)
+
+        backoff = retry_policy.create_backoff()
+
+        started_at = retry_policy.clock()
+
+        headers = self.create_headers(headers)
+
+        transport = self.transport
+
+        if transport is None:
+            transport = self
+
+        request = TransportRequest(method, str(url), data, parameters, headers, read)
+
+        hooks = self.hooks
+
+        attempt = 0
 
-        lock = Lock()
         error: Optional[AnyError] = None
 
         while attempts:
+            retry_after: Optional[str] = None
+
+            if rate_limiter is not None:
+                await rate_limiter.acquire(name, account_id)
+
+            for hook in hooks:
+                hook.on_request_start(request)
+
             try:
-                async with lock, session.request(
-                    url=url,
-                    method=method,
-                    data=data,
-                    params=parameters,
-                    proxy=self.proxy,
-                    proxy_auth=self.proxy_auth,
-                    headers=headers,
-                    timeout=self.create_timeout(),
-                ) as response:
-                    if not read:
-                        return None
+                request_started_at = perf_counter()
+
+                response = await transport.send(request)
 
-                    response_data: ResponseData
+                elapsed = perf_counter() - request_started_at
 
-                    if type is ResponseType.BYTES:
-                        response_data = await response.read()
+                for hook in hooks:
+                    hook.on_response(request, response, elapsed)
 
-                    elif type is ResponseType.TEXT:
-                        response_data = await response.text(errors=errors)
+                if not read:
+                    return None
 
-                    elif type is ResponseType.JSON:
-                        response_data = await response.json(content_type=None)
+                response_data: ResponseData = response.decode(type, errors)
 
-                    else:
-                        raise ValueError  # TODO: message?
+                status = response.status
 
-                    status = response.status
+                if HTTP_SUCCESS <= status < HTTP_REDIRECT:
+                    if error_codes:
+                        if is_bytes(response_data) or is_string(response_data):
+                            check_error_code(response_data, error_codes)
 
-                    if HTTP_SUCCESS <= status < HTTP_REDIRECT:
-                        if error_codes:
-                            if is_bytes(response_data) or is_string(response_data):
-                                error_code = try_parse_error_code(response_data)
+                    return response_data
 
-                                if error_code:
-                                    raise error_codes.get(
-                                        error_code, unexpected_error_code(error_code)
-                                    )
+                if status >= HTTP_ERROR:
+                    error = HTTPStatusError(status)
 
-                        return response_data
+                    for hook in hooks:
+                        hook.on_error(request, error)
 
-                    if status >= HTTP_ERROR:
-                        error = HTTPStatusError(status)
+                    if not retry_policy.should_retry_status(status):
+                        break
+
+                    retry_after = response.headers.get(RETRY_AFTER)
 
             except VALID_ERRORS as valid_error:
                 error = HTTPErrorWithOrigin(valid_error)
 
+                for hook in hooks:
+                    hook.on_error(request, error)
+
             finally:
                 await sleep(0)  # let underlying connections close
 
             attempts -= 1
 
+            if attempts:
+                delay = retry_policy.compute_delay(backoff, retry_after)
+
+                if not retry_policy.can_wait(started_at, delay):
+                    break
+
+                attempt += 1
+
+                for hook in hooks:
+                    hook.on_retry(request, attempt, delay)
+
+                await sleep(delay)
+
         if error:
             raise error
 
         return None
 
+    def create_headers(self, headers: Optional[Headers] = None) -> Headers:
+        if headers is None:
+            headers = {}
+
+        else:
+            headers = dict(headers)
+
+        if self.send_user_agent:
+            headers.setdefault(USER_AGENT, self.USER_AGENT)
+
+        forwarded_for = self.forwarded_for
+
+        if forwarded_for:
+            headers.setdefault(FORWARDED_FOR, forwarded_for)
+
+        return headers
+
+    async def stream_route(
+        self,
+        route: Route,
+        data: Optional[Parameters] = None,
+        parameters: Optional[Parameters] = None,
+        error_codes: Optional[ErrorCodes] = None,
+        headers: Optional[Headers] = None,
+        base: Optional[URLString] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        url = URL(self.url if base is None else base)
+
+        async for chunk in self.stream(
+            method=route.method,
+            url=url / route.route.strip(SLASH),
+            data=data,
+            parameters=parameters,
+            error_codes=error_codes,
+            headers=headers,
+            chunk_size=chunk_size,
+        ):
+            yield chunk
+
+    async def stream(
+        self,
+        method: str,
+        url: URLString,
+        data: Optional[Parameters] = None,
+        parameters: Optional[Parameters] = None,
+        error_codes: Optional[ErrorCodes] = None,
+        headers: Optional[Headers] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Streams the response body in chunks, instead of reading it whole.
+
+        Streamed requests are not retried, coalesced or cached; if the whole body
+        turns out to be an error code, the corresponding error is raised.
+
+        Arguments:
+            method: The HTTP method to use.
+            url: The URL to request.
+            data: The payload to send.
+            parameters: The query parameters to send.
+            error_codes: The mapping of error codes to errors to raise.
+            headers: The headers to send.
+            chunk_size: The size of chunks to read.
+
+        Returns:
+            The asynchronous iterator over the body chunks.
+        """
+        rate_limiter = self.rate_limiter
+
+        if rate_limiter is not None:
+            await rate_limiter.acquire(URL(url).name, find_account_id(data))
+
+        request = TransportRequest(method, str(url), data, parameters, self.create_headers(headers))
+
+        transport = self.transport
+
+        if transport is None:
+            chunks = self.send_streaming(request, chunk_size)
+
+        else:
+            chunks = split_body(await transport.send(request), chunk_size)
+
+        head: Optional[bytearray] = bytearray()
+
+        async for chunk in chunks:
+            if head is None:
+                yield chunk
+
+            else:
+                head.extend(chunk)
+
+                if len(head) > ERROR_CODE_SIZE:
+                    yield bytes(head)
+
+                    head = None
+
+        if head is not None:
+            if error_codes:
+                check_error_code(bytes(head), error_codes)
+
+            if head:
+                yield bytes(head)
+
+    async def send_streaming(
+        self, request: TransportRequest, chunk_size: int = CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        session = await self.ensure_session()
+
+        state = await self.acquire_proxy(request)
+
+        success: Optional[bool] = False
+
+        try:
+            async with session.request(
+                url=request.url,
+                method=request.method,
+                data=request.data,
+                params=request.parameters,
+                proxy=self.proxy if state is None else state.proxy.url,
+                proxy_auth=self.proxy_auth if state is None else state.proxy.auth,
+                headers=request.headers,
+                timeout=self.create_timeout(),
+            ) as response:
+                status = response.status
+
+                if status >= HTTP_ERROR:
+                    success = is_proxy_success(status)
+
+                    raise HTTPStatusError(status)
+
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    yield chunk
+
+                success = True
+
+        except (CancelledError, GeneratorExit):
+            success = None
+
+            raise
+
+        finally:
+            self.release_proxy(state, success)
+
+    async def acquire_proxy(self, request: TransportRequest) -> Optional[ProxyState]:
+        proxy_pool = self.proxy_pool
+
+        if proxy_pool is None:
+            return None
+
+        return await proxy_pool.acquire(find_account_id(request.data))
+
+    def release_proxy(self, state: Optional[ProxyState], success: Optional[bool]) -> None:
+        proxy_pool = self.proxy_pool
+
+        if proxy_pool is None or state is None:
+            return
+
+        proxy_pool.release(state, success)
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """Sends the `request` over the network, implementing the
+        [`Transport`][gd.transport.Transport] protocol.
+
+        If the [`ProxyPool`][gd.proxies.ProxyPool] is configured, the proxy is selected
+        from it for each request, and the outcome is reported back to the pool.
+
+        Arguments:
+            request: The request to send.
+
+        Returns:
+            The response received.
+        """
+        session = await self.ensure_session()
+
+        state = await self.acquire_proxy(request)
+
+        success: Optional[bool] = False
+
+        try:
+            async with session.request(
+                url=request.url,
+                method=request.method,
+                data=request.data,
+                params=request.parameters,
+                proxy=self.proxy if state is None else state.proxy.url,
+                proxy_auth=self.proxy_auth if state is None else state.proxy.auth,
+                headers=request.headers,
+                timeout=self.create_timeout(),
+            ) as response:
+                status = response.status
+
+                if not request.read:
+                    success = is_proxy_success(status)
+
+                    return TransportResponse(status, response.headers)
+
+                body = await response.read()
+
+                success = is_proxy_success(status)
+
+                return TransportResponse(status, response.headers, body, response.get_encoding())
+
+        except CancelledError:
+            success = None
+
+            raise
+
+        finally:
+            self.release_proxy(state, success)
+
     @staticmethod
     def generate_udid(
         prefix: str = UDID_PREFIX, start: int = UDID_START, stop: int = UDID_STOP
@@ -1326,11 +1843,67 @@ class HTTPClient:
     ) -> str:
         error_codes = {-1: NothingFound(LEVELS)}
 
-        if filters is None:
-            filters = Filters()
+        route = Route(POST, GET_LEVELS)
+
+        payload = self.create_search_levels_payload(
+            query=query,
+            page=page,
+            filters=filters,
+            user_id=user_id,
+            gauntlet=gauntlet,
+            client_account_id=client_account_id,
+            client_user_id=client_user_id,
+            hashed_password=hashed_password,
+        )
+
+        response = await self.request_route(route, data=payload, error_codes=error_codes)
+
+        return response
+
+    def stream_search_levels_on_page(
+        self,
+        query: Query = EMPTY_QUERY,
+        page: int = DEFAULT_PAGE,
+        filters: Optional[Filters] = None,
+        user_id: Optional[int] = None,
+        gauntlet: Optional[int] = None,
+        *,
+        client_account_id: Optional[int] = None,
+        client_user_id: Optional[int] = None,
+        hashed_password: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        error_codes = {-1: NothingFound(LEVELS)}
 
         route = Route(POST, GET_LEVELS)
 
+        payload = self.create_search_levels_payload(
+            query=query,
+            page=page,
+            filters=filters,
+            user_id=user_id,
+            gauntlet=gauntlet,
+            client_account_id=client_account_id,
+            client_user_id=client_user_id,
+            hashed_password=hashed_password,
+        )
+
+        return self.stream_route(route, data=payload, error_codes=error_codes)
+
+    def create_search_levels_payload(
+        self,
+        query: Query = EMPTY_QUERY,
+        page: int = DEFAULT_PAGE,
+        filters: Optional[Filters] = None,
+        user_id: Optional[int] = None,
+        gauntlet: Optional[int] = None,
+        *,
+        client_account_id: Optional[int] = None,
+        client_user_id: Optional[int] = None,
+        hashed_password: Optional[str] = None,
+    ) -> Payload:
+        if filters is None:
+            filters = Filters()
+
         payload = Payload(
             game_version=self.get_game_version(),
             binary_version=self.get_binary_version(),
@@ -1378,9 +1951,7 @@ class HTTPClient:
 
                 payload.update(account_id=client_account_id, gjp2=hashed_password)
 
-        response = await self.request_route(route, data=payload, error_codes=error_codes)
-
-        return response
+        return payload
 
     async def get_timely_info(self, type: TimelyType) -> str:
         error_codes = {-1: MissingAccess(CAN_NOT_FIND_TIMELY.format(case_fold(type.name)))}
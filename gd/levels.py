@@ -514,12 +514,16 @@ class Level(LevelReference):
         get_data: bool = DEFAULT_GET_DATA,
         use_client: bool = DEFAULT_USE_CLIENT,
     ) -> Optional[Level]:
+        client = self.client
+
+        client.cache.levels.remove(self.id)  # make sure we fetch the fresh level
+
         try:
             if self.is_timely():
-                level = await self.client.get_timely(self.timely_type)
+                level = await client.get_timely(self.timely_type)
 
             else:
-                level = await self.client.get_level(self.id, get_data=get_data)
+                level = await client.get_level(self.id, get_data=get_data)
 
         except MissingAccess:
             return None
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, List, Optional, Protocol, Sequence, runtime_checkable
+from urllib.parse import urlencode
+
+from attrs import define, field
+from named import get_type_name
+from typing_aliases import AnyError
+from yarl import URL
+
+from gd.transport import TransportRequest, TransportResponse
+
+__all__ = ("Hooks", "Metrics", "RouteMetrics", "DEFAULT_BUCKETS")
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+"""The default upper bounds (in seconds) of latency histogram buckets."""
+
+ERROR_CODE_SIZE = 16
+
+INFINITY = "+Inf"
+
+PREFIX = "gd_http"
+
+ROUTE = "route"
+
+
+@runtime_checkable
+class Hooks(Protocol):
+    """Represents instrumentation hooks called by [`HTTPClient`][gd.http.HTTPClient].
+
+    All hooks do nothing by default, so implementations only need
+    to override the ones they are interested in.
+    """
+
+    def on_request_start(self, request: TransportRequest) -> None:
+        pass
+
+    def on_response(
+        self, request: TransportRequest, response: TransportResponse, elapsed: float
+    ) -> None:
+        pass
+
+    def on_retry(self, request: TransportRequest, attempt: int, delay: float) -> None:
+        pass
+
+    def on_error(self, request: TransportRequest, error: AnyError) -> None:
+        pass
+
+
+def route_of(request: TransportRequest) -> str:
+    return URL(request.url).name
+
+
+def payload_size(request: TransportRequest) -> int:
+    data = request.data
+
+    if not data:
+        return 0
+
+    return len(urlencode(data))
+
+
+def find_error_code(body: bytes) -> Optional[int]:
+    if len(body) > ERROR_CODE_SIZE:
+        return None
+
+    try:
+        error_code = int(body)
+
+    except ValueError:
+        return None
+
+    if error_code < 0:
+        return error_code
+
+    return None
+
+
+@define()
+class RouteMetrics:
+    """Represents metrics collected for some route."""
+
+    buckets: Sequence[float] = field(default=DEFAULT_BUCKETS, repr=False)
+
+    requests: int = field(default=0)
+    responses: int = field(default=0)
+    retries: int = field(default=0)
+    errors: int = field(default=0)
+
+    bytes_in: int = field(default=0)
+    bytes_out: int = field(default=0)
+
+    latency_sum: float = field(default=0.0)
+    latency_counts: List[int] = field(init=False)
+
+    statuses: Counter[int] = field(factory=Counter)
+    error_codes: Counter[int] = field(factory=Counter)
+    error_types: Counter[str] = field(factory=Counter)
+
+    @latency_counts.default
+    def default_latency_counts(self) -> List[int]:
+        return [0] * (len(self.buckets) + 1)
+
+    def observe_latency(self, elapsed: float) -> None:
+        self.latency_sum += elapsed
+        self.latency_counts[bisect_left(self.buckets, elapsed)] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(
+            requests=self.requests,
+            responses=self.responses,
+            retries=self.retries,
+            errors=self.errors,
+            bytes_in=self.bytes_in,
+            bytes_out=self.bytes_out,
+            latency_sum=self.latency_sum,
+            latency_buckets=dict(zip((*map(str, self.buckets), INFINITY), self.latency_counts)),
+            statuses=dict(self.statuses),
+            error_codes=dict(self.error_codes),
+            error_types=dict(self.error_types),
+        )
+
+
+def label(route: str, **labels: Any) -> str:
+    pairs = [f'{ROUTE}="{route}"']
+
+    pairs.extend(f'{name}="{value}"' for name, value in labels.items())
+
+    return "{" + ",".join(pairs) + "}"
+
+
+@define()
+class Metrics(Hooks):
+    """Represents built-in metrics collectors.
+
+    Collected are per-route counters of requests, responses, retries and errors,
+    latency histograms, bytes sent and received, HTTP statuses, error codes and error types.
+
+    Example:
+        ```python
+        metrics = Metrics()
+
+        client.http.hooks.append(metrics)
+
+        ...
+
+        print(metrics.to_prometheus())
+        ```
+    """
+
+    buckets: Sequence[float] = field(default=DEFAULT_BUCKETS)
+
+    routes: Dict[str, RouteMetrics] = field(factory=dict, init=False)
+
+    def route_metrics(self, route: str) -> RouteMetrics:
+        routes = self.routes
+
+        metrics = routes.get(route)
+
+        if metrics is None:
+            routes[route] = metrics = RouteMetrics(self.buckets)
+
+        return metrics
+
+    def on_request_start(self, request: TransportRequest) -> None:
+        metrics = self.route_metrics(route_of(request))
+
+        metrics.requests += 1
+        metrics.bytes_out += payload_size(request)
+
+    def on_response(
+        self, request: TransportRequest, response: TransportResponse, elapsed: float
+    ) -> None:
+        metrics = self.route_metrics(route_of(request))
+
+        metrics.responses += 1
+
+        body = response.body
+
+        metrics.bytes_in += len(body)
+
+        metrics.statuses[response.status] += 1
+
+        metrics.observe_latency(elapsed)
+
+        error_code = find_error_code(body)
+
+        if error_code is not None:
+            metrics.error_codes[error_code] += 1
+
+    def on_retry(self, request: TransportRequest, attempt: int, delay: float) -> None:
+        self.route_metrics(route_of(request)).retries += 1
+
+    def on_error(self, request: TransportRequest, error: AnyError) -> None:
+        metrics = self.route_metrics(route_of(request))
+
+        metrics.errors += 1
+        metrics.error_types[get_type_name(error)] += 1
+
+    def reset(self) -> None:
+        self.routes.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Exports the metrics to a plain dictionary, keyed by route names.
+
+        Returns:
+            The exported metrics.
+        """
+        return {route: metrics.to_dict() for route, metrics in self.routes.items()}
+
+    def to_prometheus(self) -> str:
+        """Exports the metrics in the Prometheus text exposition format.
+
+        Returns:
+            The exported metrics.
+        """
+        lines: List[str] = []
+
+        def counter(name: str, help: str, values: Dict[str, int]) -> None:
+            full_name = f"{PREFIX}_{name}"
+
+            lines.append(f"# HELP {full_name} {help}")
+            lines.append(f"# TYPE {full_name} counter")
+
+            lines.extend(f"{full_name}{labels} {value}" for labels, value in values.items())
+
+        routes = self.routes
+
+        counter(
+            "requests_total",
+            "Requests sent.",
+            {label(route): metrics.requests for route, metrics in routes.items()},
+        )
+        counter(
+            "responses_total",
+            "Responses received, by HTTP status.",
+            {
+                label(route, status=status): count
+                for route, metrics in routes.items()
+                for status, count in metrics.statuses.items()
+            },
+        )
+        counter(
+            "retries_total",
+            "Requests retried.",
+            {label(route): metrics.retries for route, metrics in routes.items()},
+        )
+        counter(
+            "errors_total",
+            "Errors encountered, by type.",
+            {
+                label(route, type=type): count
+                for route, metrics in routes.items()
+                for type, count in metrics.error_types.items()
+            },
+        )
+        counter(
+            "error_codes_total",
+            "Error codes returned by the server.",
+            {
+                label(route, code=code): count
+                for route, metrics in routes.items()
+                for code, count in metrics.error_codes.items()
+            },
+        )
+        counter(
+            "received_bytes_total",
+            "Bytes received.",
+            {label(route): metrics.bytes_in for route, metrics in routes.items()},
+        )
+        counter(
+            "sent_bytes_total",
+            "Bytes sent.",
+            {label(route): metrics.bytes_out for route, metrics in routes.items()},
+        )
+
+        name = f"{PREFIX}_request_duration_seconds"
+
+        lines.append(f"# HELP {name} Request latency.")
+        lines.append(f"# TYPE {name} histogram")
+
+        for route, metrics in routes.items():
+            cumulative = 0
+
+            bounds = (*map(str, metrics.buckets), INFINITY)
+
+            for bound, count in zip(bounds, metrics.latency_counts):
+                cumulative += count
+
+                lines.append(f"{name}_bucket{label(route, le=bound)} {cumulative}")
+
+            lines.append(f"{name}_sum{label(route)} {metrics.latency_sum}")
+            lines.append(f"{name}_count{label(route)} {cumulative}")
+
+        return "\n".join(lines) + "\n"
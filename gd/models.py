@@ -1,23 +1,33 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Iterable,
     List,
+    Literal,
     Optional,
     Protocol,
     Sequence,
+    Tuple,
+    Type,
     TypeVar,
+    overload,
     runtime_checkable,
 )
 from urllib.parse import quote, unquote
 
 from attrs import define, field
+from funcs.application import partial
 from funcs.primitives import decrement, increment
 from iters.iters import iter
 from pendulum import DateTime, Duration, duration
+from typing_aliases import StringDict
 from yarl import URL
 
 from gd.api.editor import Editor
+from gd.asyncio import run_blocking
 from gd.capacity import Capacity
 from gd.color import Color
 from gd.constants import (
@@ -74,7 +84,7 @@ from gd.constants import (
     QUESTS_SLICE,
     WEEKLY_ID_ADD,
 )
-from gd.converter import dump_url
+from gd.converter import CONVERTER, dump_url
 from gd.date_time import (
     date_time_to_human,
     duration_from_seconds,
@@ -227,11 +237,7 @@ from gd.models_utils import (
     split_gauntlets_response,
     split_gauntlets_response_gauntlets,
     split_leaderboard_response_users,
-    split_leaderboard_user,
-    split_level,
     split_level_comment,
-    split_level_comment_inner,
-    split_level_comment_user,
     split_level_comments_response,
     split_level_comments_response_comments,
     split_level_ids,
@@ -256,10 +262,8 @@ from gd.models_utils import (
     split_search_levels_response_creators,
     split_search_levels_response_levels,
     split_search_levels_response_songs,
-    split_search_user,
     split_search_users_response,
     split_search_users_response_users,
-    split_song,
     split_timely_info,
     split_user_comment,
     split_user_comments_response,
@@ -267,6 +271,7 @@ from gd.models_utils import (
 )
 from gd.password import Password
 from gd.robtop import RobTop
+from gd.robtop_decoder import Decoder, DecoderField, int_into
 from gd.robtop_view import RobTopView
 from gd.string_utils import concat_empty
 from gd.versions import CURRENT_GAME_VERSION, GameVersion
@@ -299,6 +304,8 @@ __all__ = (
     "SongModel",
     "TimelyInfoModel",
     "UserCommentModel",
+    "parse_many",
+    "parse_many_async",
 )
 
 FIRST = 0
@@ -319,6 +326,8 @@ def last(sequence: Sequence[T]) -> T:
 class Model(RobTop, Protocol):
     """Represents various models."""
 
+    __slots__ = ()
+
 
 SONG_ID = 1
 SONG_NAME = 2
@@ -331,6 +340,26 @@ SONG_ARTIST_VERIFIED = 8
 SONG_URL = 10
 
 
+def unquote_url(string: str) -> URL:
+    return URL(unquote(string))
+
+
+SONG_DECODER = Decoder(
+    SONG_SEPARATOR,
+    (
+        DecoderField(SONG_ID, "id", int, DEFAULT_ID),
+        DecoderField(SONG_NAME, "name", default=EMPTY),
+        DecoderField(SONG_ARTIST_ID, "artist_id", int, DEFAULT_ID),
+        DecoderField(SONG_ARTIST_NAME, "artist_name", default=EMPTY),
+        DecoderField(SONG_SIZE, "size", float, DEFAULT_SIZE),
+        DecoderField(SONG_YOUTUBE_VIDEO_ID, "youtube_video_id", default=EMPTY),
+        DecoderField(SONG_YOUTUBE_CHANNEL_ID, "youtube_channel_id", default=EMPTY),
+        DecoderField(SONG_ARTIST_VERIFIED, "artist_verified", int_bool, DEFAULT_ARTIST_VERIFIED),
+        DecoderField(SONG_URL, "url", unquote_url, skip_empty=True),
+    ),
+)
+
+
 @define()
 class SongModel(Model):
     id: int = DEFAULT_ID
@@ -347,40 +376,7 @@ class SongModel(Model):
     def from_robtop(
         cls, string: str, encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
     ) -> Self:
-        mapping = split_song(string)
-
-        view = RobTopView(mapping)
-
-        id = view.get_option(SONG_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        name = view.get_option(SONG_NAME).unwrap_or(EMPTY)
-
-        artist_name = view.get_option(SONG_ARTIST_NAME).unwrap_or(EMPTY)
-
-        artist_id = view.get_option(SONG_ARTIST_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        size = view.get_option(SONG_SIZE).map(float).unwrap_or(DEFAULT_SIZE)
-
-        youtube_video_id = view.get_option(SONG_YOUTUBE_VIDEO_ID).unwrap_or(EMPTY)
-        youtube_channel_id = view.get_option(SONG_YOUTUBE_CHANNEL_ID).unwrap_or(EMPTY)
-
-        artist_verified = (
-            view.get_option(SONG_ARTIST_VERIFIED).map(int_bool).unwrap_or(DEFAULT_ARTIST_VERIFIED)
-        )
-
-        url = view.get_option(SONG_URL).filter(bool).map(unquote).map(URL).extract()
-
-        return cls(
-            id=id,
-            name=name,
-            artist_name=artist_name,
-            artist_id=artist_id,
-            size=size,
-            youtube_video_id=youtube_video_id,
-            youtube_channel_id=youtube_channel_id,
-            artist_verified=artist_verified,
-            url=url,
-        )
+        return cls(**SONG_DECODER.decode(string))
 
     def to_robtop(self) -> str:
         url = self.url
@@ -503,6 +499,29 @@ SEARCH_USER_DIAMONDS = 46
 SEARCH_USER_MOONS = 52
 
 
+SEARCH_USER_DECODER = Decoder(
+    SEARCH_USER_SEPARATOR,
+    (
+        DecoderField(SEARCH_USER_NAME, "name", default=EMPTY),
+        DecoderField(SEARCH_USER_ID, "id", int, DEFAULT_ID),
+        DecoderField(SEARCH_USER_STARS, "stars", int, DEFAULT_STARS),
+        DecoderField(SEARCH_USER_DEMONS, "demons", int, DEFAULT_DEMONS),
+        DecoderField(SEARCH_USER_RANK, "rank", int, DEFAULT_RANK, skip_empty=True),
+        DecoderField(SEARCH_USER_CREATOR_POINTS, "creator_points", int, DEFAULT_CREATOR_POINTS),
+        DecoderField(SEARCH_USER_ICON_ID, "icon_id", int, DEFAULT_ID),
+        DecoderField(SEARCH_USER_COLOR_1_ID, "color_1_id", int, DEFAULT_COLOR_1_ID),
+        DecoderField(SEARCH_USER_COLOR_2_ID, "color_2_id", int, DEFAULT_COLOR_2_ID),
+        DecoderField(SEARCH_USER_SECRET_COINS, "secret_coins", int, DEFAULT_SECRET_COINS),
+        DecoderField(SEARCH_USER_ICON_TYPE, "icon_type", int_into(IconType), IconType.DEFAULT),
+        DecoderField(SEARCH_USER_GLOW, "glow", int_bool, DEFAULT_GLOW),
+        DecoderField(SEARCH_USER_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+        DecoderField(SEARCH_USER_USER_COINS, "user_coins", int, DEFAULT_USER_COINS),
+        DecoderField(SEARCH_USER_DIAMONDS, "diamonds", int, DEFAULT_DIAMONDS),
+        DecoderField(SEARCH_USER_MOONS, "moons", int, DEFAULT_MOONS),
+    ),
+)
+
+
 @define()
 class SearchUserModel(Model):
     name: str = EMPTY
@@ -524,68 +543,7 @@ class SearchUserModel(Model):
 
     @classmethod
     def from_robtop(cls, string: str) -> Self:
-        mapping = split_search_user(string)
-
-        view = RobTopView(mapping)
-
-        name = view.get_option(SEARCH_USER_NAME).unwrap_or(EMPTY)
-
-        id = view.get_option(SEARCH_USER_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        stars = view.get_option(SEARCH_USER_STARS).map(int).unwrap_or(DEFAULT_STARS)
-
-        demons = view.get_option(SEARCH_USER_DEMONS).map(int).unwrap_or(DEFAULT_DEMONS)
-
-        rank = view.get_option(SEARCH_USER_RANK).filter(bool).map(int).unwrap_or(DEFAULT_RANK)
-
-        creator_points = (
-            view.get_option(SEARCH_USER_CREATOR_POINTS).map(int).unwrap_or(DEFAULT_CREATOR_POINTS)
-        )
-
-        icon_id = view.get_option(SEARCH_USER_ICON_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        color_1_id = view.get_option(SEARCH_USER_COLOR_1_ID).map(int).unwrap_or(DEFAULT_COLOR_1_ID)
-        color_2_id = view.get_option(SEARCH_USER_COLOR_2_ID).map(int).unwrap_or(DEFAULT_COLOR_2_ID)
-
-        secret_coins = (
-            view.get_option(SEARCH_USER_SECRET_COINS).map(int).unwrap_or(DEFAULT_SECRET_COINS)
-        )
-
-        icon_type = (
-            view.get_option(SEARCH_USER_ICON_TYPE)
-            .map(int)
-            .map(IconType)
-            .unwrap_or(IconType.DEFAULT)
-        )
-
-        glow = view.get_option(SEARCH_USER_GLOW).map(int_bool).unwrap_or(DEFAULT_GLOW)
-
-        account_id = view.get_option(SEARCH_USER_ACCOUNT_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        user_coins = view.get_option(SEARCH_USER_USER_COINS).map(int).unwrap_or(DEFAULT_USER_COINS)
-
-        diamonds = view.get_option(SEARCH_USER_DIAMONDS).map(int).unwrap_or(DEFAULT_DIAMONDS)
-
-        moons = view.get_option(SEARCH_USER_MOONS).map(int).unwrap_or(DEFAULT_MOONS)
-
-        return cls(
-            name=name,
-            id=id,
-            stars=stars,
-            demons=demons,
-            rank=rank,
-            creator_points=creator_points,
-            icon_id=icon_id,
-            color_1_id=color_1_id,
-            color_2_id=color_2_id,
-            secret_coins=secret_coins,
-            icon_type=icon_type,
-            glow=glow,
-            account_id=account_id,
-            user_coins=user_coins,
-            diamonds=diamonds,
-            moons=moons,
-        )
+        return cls(**SEARCH_USER_DECODER.decode(string))
 
     def to_robtop(self) -> str:
         glow = self.has_glow()
@@ -1028,6 +986,31 @@ LEADERBOARD_USER_DIAMONDS = 46
 LEADERBOARD_USER_MOONS = 52
 
 
+LEADERBOARD_USER_DECODER = Decoder(
+    LEADERBOARD_USER_SEPARATOR,
+    (
+        DecoderField(LEADERBOARD_USER_NAME, "name", default=EMPTY),
+        DecoderField(LEADERBOARD_USER_ID, "id", int, DEFAULT_ID),
+        DecoderField(LEADERBOARD_USER_STARS, "stars", int, DEFAULT_STARS),
+        DecoderField(LEADERBOARD_USER_DEMONS, "demons", int, DEFAULT_DEMONS),
+        DecoderField(LEADERBOARD_USER_PLACE, "place", int, DEFAULT_PLACE),
+        DecoderField(
+            LEADERBOARD_USER_CREATOR_POINTS, "creator_points", int, DEFAULT_CREATOR_POINTS
+        ),
+        DecoderField(LEADERBOARD_USER_ICON_ID, "icon_id", int, DEFAULT_ICON_ID),
+        DecoderField(LEADERBOARD_USER_COLOR_1_ID, "color_1_id", int, DEFAULT_COLOR_1_ID),
+        DecoderField(LEADERBOARD_USER_COLOR_2_ID, "color_2_id", int, DEFAULT_COLOR_2_ID),
+        DecoderField(LEADERBOARD_USER_SECRET_COINS, "secret_coins", int, DEFAULT_SECRET_COINS),
+        DecoderField(LEADERBOARD_USER_ICON_TYPE, "icon_type", int_into(IconType), IconType.DEFAULT),
+        DecoderField(LEADERBOARD_USER_GLOW, "glow", int_bool, DEFAULT_GLOW),
+        DecoderField(LEADERBOARD_USER_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+        DecoderField(LEADERBOARD_USER_USER_COINS, "user_coins", int, DEFAULT_USER_COINS),
+        DecoderField(LEADERBOARD_USER_DIAMONDS, "diamonds", int, DEFAULT_DIAMONDS),
+        DecoderField(LEADERBOARD_USER_MOONS, "moons", int, DEFAULT_MOONS),
+    ),
+)
+
+
 @define()
 class LeaderboardUserModel(Model):
     name: str = EMPTY
@@ -1049,76 +1032,7 @@ class LeaderboardUserModel(Model):
 
     @classmethod
     def from_robtop(cls, string: str) -> Self:
-        mapping = split_leaderboard_user(string)
-
-        view = RobTopView(mapping)
-
-        name = view.get_option(LEADERBOARD_USER_NAME).unwrap_or(EMPTY)
-
-        id = view.get_option(LEADERBOARD_USER_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        stars = view.get_option(LEADERBOARD_USER_STARS).map(int).unwrap_or(DEFAULT_STARS)
-
-        demons = view.get_option(LEADERBOARD_USER_DEMONS).map(int).unwrap_or(DEFAULT_DEMONS)
-
-        place = view.get_option(LEADERBOARD_USER_PLACE).map(int).unwrap_or(DEFAULT_PLACE)
-
-        creator_points = (
-            view.get_option(LEADERBOARD_USER_CREATOR_POINTS)
-            .map(int)
-            .unwrap_or(DEFAULT_CREATOR_POINTS)
-        )
-
-        icon_id = view.get_option(LEADERBOARD_USER_ICON_ID).map(int).unwrap_or(DEFAULT_ICON_ID)
-
-        color_1_id = (
-            view.get_option(LEADERBOARD_USER_COLOR_1_ID).map(int).unwrap_or(DEFAULT_COLOR_1_ID)
-        )
-        color_2_id = (
-            view.get_option(LEADERBOARD_USER_COLOR_2_ID).map(int).unwrap_or(DEFAULT_COLOR_2_ID)
-        )
-
-        secret_coins = (
-            view.get_option(LEADERBOARD_USER_SECRET_COINS).map(int).unwrap_or(DEFAULT_SECRET_COINS)
-        )
-
-        icon_type = (
-            view.get_option(LEADERBOARD_USER_ICON_TYPE)
-            .map(int)
-            .map(IconType)
-            .unwrap_or(IconType.DEFAULT)
-        )
-
-        glow = view.get_option(LEADERBOARD_USER_GLOW).map(int_bool).unwrap_or(DEFAULT_GLOW)
-
-        account_id = view.get_option(LEADERBOARD_USER_ACCOUNT_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        user_coins = (
-            view.get_option(LEADERBOARD_USER_USER_COINS).map(int).unwrap_or(DEFAULT_USER_COINS)
-        )
-
-        diamonds = view.get_option(LEADERBOARD_USER_DIAMONDS).map(int).unwrap_or(DEFAULT_DIAMONDS)
-
-        moons = view.get_option(LEADERBOARD_USER_MOONS).map(int).unwrap_or(DEFAULT_MOONS)
-
-        return cls(
-            name=name,
-            id=id,
-            stars=stars,
-            demons=demons,
-            place=place,
-            creator_points=creator_points,
-            icon_id=icon_id,
-            color_1_id=color_1_id,
-            color_2_id=color_2_id,
-            secret_coins=secret_coins,
-            icon_type=icon_type,
-            glow=glow,
-            account_id=account_id,
-            user_coins=user_coins,
-            diamonds=diamonds,
-            moons=moons,
-        )
+        return cls(**LEADERBOARD_USER_DECODER.decode(string))
 
     def to_robtop(self) -> str:
         glow = self.has_glow()
@@ -1464,6 +1378,98 @@ LEVEL_TIME_STEPS = 57
 UNPROCESSED_DATA = "unprocessed_data"
 
 
+def seconds_duration(string: str) -> Duration:
+    return duration_from_seconds(float(string))
+
+
+def process_unprocessed_data(unprocessed_data: str) -> str:
+    if Editor.can_be_in(unprocessed_data):
+        return zip_level_string(unprocessed_data)
+
+    return unprocessed_data
+
+
+def split_timely_id(timely_id: int) -> Tuple[int, TimelyType]:
+    if timely_id:
+        result, timely_id = divmod(timely_id, WEEKLY_ID_ADD)
+
+        if result:
+            return (timely_id, TimelyType.WEEKLY)
+
+        return (timely_id, TimelyType.DAILY)
+
+    return (timely_id, TimelyType.NOT_TIMELY)
+
+
+LEVEL_DECODER = Decoder(
+    LEVEL_SEPARATOR,
+    (
+        DecoderField(LEVEL_ID, "id", int, DEFAULT_ID),
+        DecoderField(LEVEL_NAME, "name", default=EMPTY),
+        DecoderField(LEVEL_DESCRIPTION, "description", decode_base64_string_url_safe, EMPTY),
+        DecoderField(LEVEL_UNPROCESSED_DATA, UNPROCESSED_DATA, default=EMPTY),
+        DecoderField(LEVEL_VERSION, "version", int, DEFAULT_VERSION),
+        DecoderField(LEVEL_CREATOR_ID, "creator_id", int, DEFAULT_ID),
+        DecoderField(LEVEL_DIFFICULTY_NUMERATOR, "difficulty_numerator", int, DEFAULT_NUMERATOR),
+        DecoderField(
+            LEVEL_DIFFICULTY_DENOMINATOR, "difficulty_denominator", int, DEFAULT_DENOMINATOR
+        ),
+        DecoderField(
+            LEVEL_DEMON_DIFFICULTY, "demon_difficulty_value", int, DemonDifficulty.DEFAULT.value
+        ),
+        DecoderField(LEVEL_AUTO, "auto", int_bool, DEFAULT_AUTO),
+        DecoderField(LEVEL_DEMON, "demon", int_bool, DEFAULT_DEMON),
+        DecoderField(LEVEL_DOWNLOADS, "downloads", int, DEFAULT_DOWNLOADS),
+        DecoderField(LEVEL_OFFICIAL_SONG_ID, "official_song_id", int, DEFAULT_ID),
+        DecoderField(
+            LEVEL_GAME_VERSION, "game_version", GameVersion.from_robtop, CURRENT_GAME_VERSION
+        ),
+        DecoderField(LEVEL_RATING, "rating", int, DEFAULT_RATING),
+        DecoderField(LEVEL_LENGTH, "length", int_into(LevelLength), LevelLength.DEFAULT),
+        DecoderField(LEVEL_REWARD, "reward", int, DEFAULT_COUNT),
+        DecoderField(LEVEL_SCORE, "score", int, DEFAULT_SCORE),
+        DecoderField(LEVEL_PASSWORD, "password", Password.from_robtop, factory=Password),
+        DecoderField(
+            LEVEL_CREATED_AT,
+            "created_at",
+            option_date_time_from_human,
+            factory=utc_now,
+            optional=True,
+        ),
+        DecoderField(
+            LEVEL_UPDATED_AT,
+            "updated_at",
+            option_date_time_from_human,
+            factory=utc_now,
+            optional=True,
+        ),
+        DecoderField(LEVEL_ORIGINAL_ID, "original_id", int, DEFAULT_ID),
+        DecoderField(LEVEL_TWO_PLAYER, "two_player", int_bool, DEFAULT_TWO_PLAYER),
+        DecoderField(LEVEL_CUSTOM_SONG_ID, "custom_song_id", int, DEFAULT_ID),
+        DecoderField(LEVEL_CAPACITY, "capacity", Capacity.from_robtop, factory=Capacity),
+        DecoderField(LEVEL_COINS, "coins", int, DEFAULT_COINS),
+        DecoderField(LEVEL_VERIFIED_COINS, "verified_coins", int_bool, DEFAULT_VERIFIED_COINS),
+        DecoderField(LEVEL_REQUESTED_REWARD, "requested_reward", int, DEFAULT_COUNT),
+        DecoderField(LEVEL_LOW_DETAIL, "low_detail", int_bool, DEFAULT_LOW_DETAIL),
+        DecoderField(LEVEL_TIMELY_ID, "timely_id", int, DEFAULT_ID),
+        DecoderField(
+            LEVEL_SPECIAL_RATE_TYPE,
+            "special_rate_type",
+            int_into(SpecialRateType),
+            SpecialRateType.DEFAULT,
+        ),
+        DecoderField(LEVEL_OBJECT_COUNT, "object_count", int, DEFAULT_OBJECT_COUNT),
+        DecoderField(
+            LEVEL_EDITOR_TIME, "editor_time", seconds_duration, factory=duration, skip_empty=True
+        ),
+        DecoderField(
+            LEVEL_COPIES_TIME, "copies_time", seconds_duration, factory=duration, skip_empty=True
+        ),
+        DecoderField(LEVEL_TIME_STEPS, "time_steps", option_int, DEFAULT_TIME_STEPS, optional=True),
+    ),
+)
+
+
 @define()
 class LevelModel(Model):
     id: int = field(default=DEFAULT_ID)
@@ -1502,200 +1508,30 @@ class LevelModel(Model):
 
     @classmethod
     def from_robtop(cls, string: str) -> Self:
-        mapping = split_level(string)
-
-        view = RobTopView(mapping)
-
-        id = view.get_option(LEVEL_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        name = view.get_option(LEVEL_NAME).unwrap_or(EMPTY)
-
-        description = (
-            view.get_option(LEVEL_DESCRIPTION).map(decode_base64_string_url_safe).unwrap_or(EMPTY)
-        )
+        values = LEVEL_DECODER.decode(string)
 
-        unprocessed_data = mapping.get(LEVEL_UNPROCESSED_DATA, EMPTY)
+        values[UNPROCESSED_DATA] = process_unprocessed_data(values[UNPROCESSED_DATA])
 
-        unprocessed_data = mapping.get(LEVEL_UNPROCESSED_DATA, EMPTY)
-
-        if Editor.can_be_in(unprocessed_data):
-            unprocessed_data = zip_level_string(unprocessed_data)
-
-        version = view.get_option(LEVEL_VERSION).map(int).unwrap_or(DEFAULT_VERSION)
-
-        creator_id = view.get_option(LEVEL_CREATOR_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        difficulty_numerator = (
-            view.get_option(LEVEL_DIFFICULTY_NUMERATOR).map(int).unwrap_or(DEFAULT_NUMERATOR)
-        )
-        difficulty_denominator = (
-            view.get_option(LEVEL_DIFFICULTY_DENOMINATOR).map(int).unwrap_or(DEFAULT_DENOMINATOR)
-        )
-
-        demon_difficulty_value = (
-            view.get_option(LEVEL_DEMON_DIFFICULTY)
-            .map(int)
-            .unwrap_or(DemonDifficulty.DEFAULT.value)
-        )
-
-        auto = view.get_option(LEVEL_AUTO).map(int_bool).unwrap_or(DEFAULT_AUTO)
-        demon = view.get_option(LEVEL_DEMON).map(int_bool).unwrap_or(DEFAULT_DEMON)
-
-        difficulty = DifficultyParameters(
-            difficulty_numerator=difficulty_numerator,
-            difficulty_denominator=difficulty_denominator,
-            demon_difficulty_value=demon_difficulty_value,
-            auto=auto,
-            demon=demon,
+        values["difficulty"] = DifficultyParameters(
+            difficulty_numerator=values.pop("difficulty_numerator"),
+            difficulty_denominator=values.pop("difficulty_denominator"),
+            demon_difficulty_value=values.pop("demon_difficulty_value"),
+            auto=values.pop("auto"),
+            demon=values.pop("demon"),
         ).into_difficulty()
 
-        downloads = view.get_option(LEVEL_DOWNLOADS).map(int).unwrap_or(DEFAULT_DOWNLOADS)
-
-        official_song_id = view.get_option(LEVEL_OFFICIAL_SONG_ID).map(int).unwrap_or(DEFAULT_ID)
+        length: LevelLength = values["length"]
 
-        game_version = (
-            view.get_option(LEVEL_GAME_VERSION)
-            .map(GameVersion.from_robtop)
-            .unwrap_or(CURRENT_GAME_VERSION)
-        )
+        values["platformer"] = platformer = length.is_platformer()
 
-        rating = view.get_option(LEVEL_RATING).map(int).unwrap_or(DEFAULT_RATING)
-
-        length = (
-            view.get_option(LEVEL_LENGTH).map(int).map(LevelLength).unwrap_or(LevelLength.DEFAULT)
-        )
+        values["reward"] = EitherReward(values["reward"], platformer)
+        values["requested_reward"] = EitherReward(values["requested_reward"], platformer)
 
-        platformer = length.is_platformer()
+        values["score"] = max(0, values["score"])
 
-        reward_count = view.get_option(LEVEL_REWARD).map(int).unwrap_or(DEFAULT_COUNT)
-
-        reward = EitherReward(reward_count, platformer)
-
-        score = max(0, view.get_option(LEVEL_SCORE).map(int).unwrap_or(DEFAULT_SCORE))
-
-        password = (
-            view.get_option(LEVEL_PASSWORD).map(Password.from_robtop).unwrap_or_else(Password)
-        )
+        values["timely_id"], values["timely_type"] = split_timely_id(values["timely_id"])
 
-        created_at = (
-            view.get_option(LEVEL_CREATED_AT)
-            .map(option_date_time_from_human)
-            .flatten()
-            .unwrap_or_else(utc_now)
-        )
-
-        updated_at = (
-            view.get_option(LEVEL_UPDATED_AT)
-            .map(option_date_time_from_human)
-            .flatten()
-            .unwrap_or_else(utc_now)
-        )
-
-        original_id = view.get_option(LEVEL_ORIGINAL_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        two_player = view.get_option(LEVEL_TWO_PLAYER).map(int_bool).unwrap_or(DEFAULT_TWO_PLAYER)
-
-        custom_song_id = view.get_option(LEVEL_CUSTOM_SONG_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        capacity = (
-            view.get_option(LEVEL_CAPACITY).map(Capacity.from_robtop).unwrap_or_else(Capacity)
-        )
-
-        coins = view.get_option(LEVEL_COINS).map(int).unwrap_or(DEFAULT_COINS)
-
-        verified_coins = (
-            view.get_option(LEVEL_VERIFIED_COINS).map(int_bool).unwrap_or(DEFAULT_VERIFIED_COINS)
-        )
-
-        requested_reward_count = (
-            view.get_option(LEVEL_REQUESTED_REWARD).map(int).unwrap_or(DEFAULT_COUNT)
-        )
-
-        requested_reward = EitherReward(requested_reward_count, platformer)
-
-        low_detail = view.get_option(LEVEL_LOW_DETAIL).map(int_bool).unwrap_or(DEFAULT_LOW_DETAIL)
-
-        timely_id = view.get_option(LEVEL_TIMELY_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        if timely_id:
-            result, timely_id = divmod(timely_id, WEEKLY_ID_ADD)
-
-            if result:
-                timely_type = TimelyType.WEEKLY
-
-            else:
-                timely_type = TimelyType.DAILY
-
-        else:
-            timely_type = TimelyType.NOT_TIMELY
-
-        special_rate_type = (
-            view.get_option(LEVEL_SPECIAL_RATE_TYPE)
-            .map(int)
-            .map(SpecialRateType)
-            .unwrap_or(SpecialRateType.DEFAULT)
-        )
-
-        object_count = view.get_option(LEVEL_OBJECT_COUNT).map(int).unwrap_or(DEFAULT_OBJECT_COUNT)
-
-        editor_time = (
-            view.get_option(LEVEL_EDITOR_TIME)
-            .filter(bool)
-            .map(float)
-            .map(duration_from_seconds)
-            .unwrap_or_else(duration)
-        )
-
-        copies_time = (
-            view.get_option(LEVEL_COPIES_TIME)
-            .filter(bool)
-            .map(float)
-            .map(duration_from_seconds)
-            .unwrap_or_else(duration)
-        )
-
-        time_steps = (
-            view.get_option(LEVEL_TIME_STEPS)
-            .map(option_int)
-            .flatten()
-            .unwrap_or(DEFAULT_TIME_STEPS)
-        )
-
-        return cls(
-            id=id,
-            name=name,
-            description=description,
-            unprocessed_data=unprocessed_data,
-            version=version,
-            creator_id=creator_id,
-            difficulty=difficulty,
-            downloads=downloads,
-            official_song_id=official_song_id,
-            game_version=game_version,
-            rating=rating,
-            length=length,
-            reward=reward,
-            score=score,
-            password=password,
-            created_at=created_at,
-            updated_at=updated_at,
-            original_id=original_id,
-            two_player=two_player,
-            custom_song_id=custom_song_id,
-            capacity=capacity,
-            coins=coins,
-            verified_coins=verified_coins,
-            requested_reward=requested_reward,
-            low_detail=low_detail,
-            timely_id=timely_id,
-            timely_type=timely_type,
-            special_rate_type=special_rate_type,
-            object_count=object_count,
-            editor_time=editor_time,
-            copies_time=copies_time,
-            time_steps=time_steps,
-            platformer=platformer,
-        )
+        return cls(**values)
 
     def to_robtop(self) -> str:
         timely_id = self.timely_id
@@ -1813,6 +1649,29 @@ LEVEL_COMMENT_INNER_ROLE_ID = 11
 LEVEL_COMMENT_INNER_COLOR = 12
 
 
+LEVEL_COMMENT_INNER_DECODER = Decoder(
+    LEVEL_COMMENT_INNER_SEPARATOR,
+    (
+        DecoderField(LEVEL_COMMENT_INNER_LEVEL_ID, "level_id", int, DEFAULT_ID),
+        DecoderField(LEVEL_COMMENT_INNER_CONTENT, "content", decode_base64_string_url_safe, EMPTY),
+        DecoderField(LEVEL_COMMENT_INNER_USER_ID, "user_id", int, DEFAULT_ID),
+        DecoderField(LEVEL_COMMENT_INNER_RATING, "rating", int, DEFAULT_RATING),
+        DecoderField(LEVEL_COMMENT_INNER_ID, "id", int, DEFAULT_ID),
+        DecoderField(LEVEL_COMMENT_INNER_SPAM, "spam", int_bool, DEFAULT_SPAM),
+        DecoderField(
+            LEVEL_COMMENT_INNER_CREATED_AT,
+            "created_at",
+            option_date_time_from_human,
+            factory=utc_now,
+            optional=True,
+        ),
+        DecoderField(LEVEL_COMMENT_INNER_RECORD, "record", int, DEFAULT_RECORD),
+        DecoderField(LEVEL_COMMENT_INNER_ROLE_ID, "role_id", int, DEFAULT_ID),
+        DecoderField(LEVEL_COMMENT_INNER_COLOR, "color", Color.from_robtop, factory=Color.default),
+    ),
+)
+
+
 @define()
 class LevelCommentInnerModel(Model):
     level_id: int = field(default=DEFAULT_ID)
@@ -1828,55 +1687,7 @@ class LevelCommentInnerModel(Model):
 
     @classmethod
     def from_robtop(cls, string: str) -> Self:
-        mapping = split_level_comment_inner(string)
-
-        view = RobTopView(mapping)
-
-        level_id = view.get_option(LEVEL_COMMENT_INNER_LEVEL_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        content = (
-            view.get_option(LEVEL_COMMENT_INNER_CONTENT)
-            .map(decode_base64_string_url_safe)
-            .unwrap_or(EMPTY)
-        )
-
-        user_id = view.get_option(LEVEL_COMMENT_INNER_USER_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        rating = view.get_option(LEVEL_COMMENT_INNER_RATING).map(int).unwrap_or(DEFAULT_RATING)
-
-        id = view.get_option(LEVEL_COMMENT_INNER_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        spam = view.get_option(LEVEL_COMMENT_INNER_SPAM).map(int_bool).unwrap_or(DEFAULT_SPAM)
-
-        created_at = (
-            view.get_option(LEVEL_COMMENT_INNER_CREATED_AT)
-            .map(option_date_time_from_human)
-            .flatten()
-            .unwrap_or_else(utc_now)
-        )
-
-        record = view.get_option(LEVEL_COMMENT_INNER_RECORD).map(int).unwrap_or(DEFAULT_RECORD)
-
-        role_id = view.get_option(LEVEL_COMMENT_INNER_ROLE_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        color = (
-            view.get_option(LEVEL_COMMENT_INNER_COLOR)
-            .map(Color.from_robtop)
-            .unwrap_or_else(Color.default)
-        )
-
-        return cls(
-            level_id=level_id,
-            content=content,
-            user_id=user_id,
-            rating=rating,
-            id=id,
-            spam=spam,
-            created_at=created_at,
-            record=record,
-            role_id=role_id,
-            color=color,
-        )
+        return cls(**LEVEL_COMMENT_INNER_DECODER.decode(string))
 
     def to_robtop(self) -> str:
         mapping = {
@@ -1911,6 +1722,22 @@ LEVEL_COMMENT_USER_GLOW = 15
 LEVEL_COMMENT_USER_ACCOUNT_ID = 16
 
 
+LEVEL_COMMENT_USER_DECODER = Decoder(
+    LEVEL_COMMENT_USER_SEPARATOR,
+    (
+        DecoderField(LEVEL_COMMENT_USER_NAME, "name", default=EMPTY),
+        DecoderField(LEVEL_COMMENT_USER_ICON_ID, "icon_id", int, DEFAULT_ICON_ID),
+        DecoderField(LEVEL_COMMENT_USER_COLOR_1_ID, "color_1_id", int, DEFAULT_COLOR_1_ID),
+        DecoderField(LEVEL_COMMENT_USER_COLOR_2_ID, "color_2_id", int, DEFAULT_COLOR_2_ID),
+        DecoderField(
+            LEVEL_COMMENT_USER_ICON_TYPE, "icon_type", int_into(IconType), IconType.DEFAULT
+        ),
+        DecoderField(LEVEL_COMMENT_USER_GLOW, "glow", int_bool, DEFAULT_GLOW),
+        DecoderField(LEVEL_COMMENT_USER_ACCOUNT_ID, "account_id", int, DEFAULT_ID),
+    ),
+)
+
+
 @define()
 class LevelCommentUserModel(Model):
     name: str = EMPTY
@@ -1923,41 +1750,7 @@ class LevelCommentUserModel(Model):
 
     @classmethod
     def from_robtop(cls, string: str) -> Self:
-        mapping = split_level_comment_user(string)
-
-        view = RobTopView(mapping)
-
-        name = view.get_option(LEVEL_COMMENT_USER_NAME).unwrap_or(EMPTY)
-
-        icon_id = view.get_option(LEVEL_COMMENT_USER_ICON_ID).map(int).unwrap_or(DEFAULT_ICON_ID)
-
-        color_1_id = (
-            view.get_option(LEVEL_COMMENT_USER_COLOR_1_ID).map(int).unwrap_or(DEFAULT_COLOR_1_ID)
-        )
-        color_2_id = (
-            view.get_option(LEVEL_COMMENT_USER_COLOR_2_ID).map(int).unwrap_or(DEFAULT_COLOR_2_ID)
-        )
-
-        icon_type = (
-            view.get_option(LEVEL_COMMENT_USER_ICON_TYPE)
-            .map(int)
-            .map(IconType)
-            .unwrap_or(IconType.DEFAULT)
-        )
-
-        glow = view.get_option(LEVEL_COMMENT_USER_GLOW).map(int_bool).unwrap_or(DEFAULT_GLOW)
-
-        account_id = view.get_option(LEVEL_COMMENT_USER_ACCOUNT_ID).map(int).unwrap_or(DEFAULT_ID)
-
-        return cls(
-            name=name,
-            icon_id=icon_id,
-            color_1_id=color_1_id,
-            color_2_id=color_2_id,
-            icon_type=icon_type,
-            glow=glow,
-            account_id=account_id,
-        )
+        return cls(**LEVEL_COMMENT_USER_DECODER.decode(string))
 
     def to_robtop(self) -> str:
         glow = self.has_glow()
@@ -3200,3 +2993,149 @@ class CommentBannedModel(Model):
     @classmethod
     def can_be_in(cls, string: str) -> bool:
         return COMMENT_BANNED_SEPARATOR in string
+
+
+DEFAULT_CHUNK_SIZE = 1000
+"""The default number of strings parsed by each worker task."""
+
+DEFAULT_UNSTRUCTURE = False
+
+EXPECTED_POSITIVE_CHUNK_SIZE = "expected `chunk_size` to be positive"
+
+M = TypeVar("M", bound=Model)
+
+
+def parse_chunk(model_type: Type[M], strings: List[str], unstructure: bool) -> List[Any]:
+    models = [model_type.from_robtop(string) for string in strings]
+
+    if unstructure:
+        return [CONVERTER.unstructure(model) for model in models]
+
+    return models
+
+
+@overload
+def parse_many(
+    model_type: Type[M],
+    strings: Iterable[str],
+    workers: Optional[int] = ...,
+    chunk_size: int = ...,
+    unstructure: Literal[False] = ...,
+    executor: Optional[Executor] = ...,
+) -> List[M]:
+    ...
+
+
+@overload
+def parse_many(
+    model_type: Type[M],
+    strings: Iterable[str],
+    workers: Optional[int] = ...,
+    chunk_size: int = ...,
+    *,
+    unstructure: Literal[True],
+    executor: Optional[Executor] = ...,
+) -> List[StringDict[Any]]:
+    ...
+
+
+def parse_many(
+    model_type: Type[M],
+    strings: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    unstructure: bool = DEFAULT_UNSTRUCTURE,
+    executor: Optional[Executor] = None,
+) -> List[Any]:
+    """Parses the RobTop `strings` into models of `model_type` in bulk,
+    sharding them across the process pool.
+
+    The `strings` are split into chunks of `chunk_size`, which are parsed by the workers;
+    the results are returned in the original order.
+
+    If `unstructure` is true, models are unstructured into dictionaries in the workers,
+    which is considerably cheaper to send back than the models themselves.
+
+    If there is only one chunk, or `workers` is `1`, the strings are parsed in this process.
+
+    Example:
+        ```python
+        levels = parse_many(LevelModel, strings, workers=8)
+        ```
+
+    Arguments:
+        model_type: The type of the models to parse.
+        strings: The RobTop strings to parse.
+        workers: The number of worker processes, defaulting to the number of processors.
+        chunk_size: The number of strings parsed by each worker task.
+        unstructure: Whether to unstructure the models into dictionaries.
+        executor: The executor to use instead of creating the process pool.
+
+    Raises:
+        ValueError: `chunk_size` is not positive.
+
+    Returns:
+        The parsed models or their unstructured dictionaries.
+    """
+    if chunk_size < 1:
+        raise ValueError(EXPECTED_POSITIVE_CHUNK_SIZE)
+
+    chunks = iter(strings).chunks(chunk_size).list()
+
+    parse = partial(parse_chunk, model_type, unstructure=unstructure)
+
+    if executor is None and (workers == 1 or len(chunks) <= 1):
+        return iter(chunks).map(parse).flatten().list()
+
+    if executor is None:
+        with ProcessPoolExecutor(workers) as executor:
+            return iter(executor.map(parse, chunks)).flatten().list()
+
+    return iter(executor.map(parse, chunks)).flatten().list()
+
+
+@overload
+async def parse_many_async(
+    model_type: Type[M],
+    strings: Iterable[str],
+    workers: Optional[int] = ...,
+    chunk_size: int = ...,
+    unstructure: Literal[False] = ...,
+    executor: Optional[Executor] = ...,
+) -> List[M]:
+    ...
+
+
+@overload
+async def parse_many_async(
+    model_type: Type[M],
+    strings: Iterable[str],
+    workers: Optional[int] = ...,
+    chunk_size: int = ...,
+    *,
+    unstructure: Literal[True],
+    executor: Optional[Executor] = ...,
+) -> List[StringDict[Any]]:
+    ...
+
+
+async def parse_many_async(
+    model_type: Type[M],
+    strings: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    unstructure: bool = DEFAULT_UNSTRUCTURE,
+    executor: Optional[Executor] = None,
+) -> List[Any]:
+    """Same as [`parse_many`][gd.models.parse_many], except the parsing is awaited
+    via [`run_blocking`][gd.asyncio.run_blocking], without blocking the event loop.
+    """
+    return await run_blocking(
+        parse_many,  # type: ignore[arg-type]
+        model_type,
+        strings,
+        workers,
+        chunk_size,
+        unstructure,
+        executor,
+    )
@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+from builtins import getattr as get_attribute
+from typing import Any, ClassVar, Dict, Generic, List, Optional, Type, TypeVar, Union, overload
+
+from attrs import define, field
+from attrs import fields as get_fields
+from iters.iters import iter
+from pendulum import DateTime, Duration
+from typing_aliases import Unary
+from typing_extensions import Self
+from yarl import URL
+
+from gd.capacity import Capacity
+from gd.color import Color
+from gd.constants import EMPTY
+from gd.difficulty_parameters import DifficultyParameters
+from gd.either_reward import EitherReward
+from gd.enums import Difficulty, IconType, LevelLength, SpecialRateType, TimelyType
+from gd.models import (
+    LEVEL_COMMENT_INNER_DECODER,
+    LEVEL_COMMENT_USER_DECODER,
+    LEVEL_DECODER,
+    SONG_DECODER,
+    UNPROCESSED_DATA,
+    CreatorModel,
+    LevelCommentInnerModel,
+    LevelCommentModel,
+    LevelCommentsResponseModel,
+    LevelCommentUserModel,
+    LevelModel,
+    Model,
+    PageModel,
+    SearchLevelsResponseModel,
+    SongModel,
+    process_unprocessed_data,
+    split_timely_id,
+)
+from gd.models_constants import (
+    LEVEL_COMMENT_SEPARATOR,
+    LEVEL_COMMENTS_RESPONSE_SEPARATOR,
+    SEARCH_LEVELS_RESPONSE_SEPARATOR,
+)
+from gd.models_utils import (
+    concat_level_comment,
+    concat_level_comments_response,
+    concat_level_comments_response_comments,
+    concat_search_levels_response,
+    concat_search_levels_response_creators,
+    concat_search_levels_response_levels,
+    concat_search_levels_response_songs,
+    split_level_comment,
+    split_level_comments_response,
+    split_level_comments_response_comments,
+    split_search_levels_response,
+    split_search_levels_response_creators,
+    split_search_levels_response_levels,
+    split_search_levels_response_songs,
+)
+from gd.password import Password
+from gd.robtop_decoder import Decoder, RawMapping
+from gd.versions import GameVersion
+
+__all__ = (
+    "Lazy",
+    "lazy",
+    "LazyModel",
+    "LazySongModel",
+    "LazyLevelModel",
+    "LazyLevelCommentInnerModel",
+    "LazyLevelCommentUserModel",
+    "LazyLevelCommentModel",
+    "LazySearchLevelsResponseModel",
+    "LazyLevelCommentsResponseModel",
+)
+
+T = TypeVar("T")
+M = TypeVar("M", bound=Model)
+
+L = TypeVar("L", bound="LazyModel[Any]")
+
+
+@define()
+class Lazy(Generic[T]):
+    """Represents attributes of lazy models, decoded on first access and cached afterwards.
+
+    By default, the value is decoded by the [`Decoder`][gd.robtop_decoder.Decoder]
+    of the model, using the name of the attribute. Otherwise, the `compute` function
+    is called with the model (see [`lazy`][gd.models_lazy.lazy]).
+    """
+
+    compute: Optional[Unary[Any, T]] = field(default=None)
+    name: str = field(default=EMPTY, init=False)
+
+    def __set_name__(self, owner: Type[Any], name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, type: Optional[Type[L]] = ...) -> Self:
+        ...
+
+    @overload
+    def __get__(self, instance: L, type: Optional[Type[L]]) -> T:
+        ...
+
+    def __get__(self, instance: Optional[L], type: Optional[Type[L]] = None) -> Union[Self, T]:
+        if instance is None:
+            return self
+
+        name = self.name
+
+        values = instance.values
+
+        if name in values:
+            return values[name]  # type: ignore[no-any-return]
+
+        compute = self.compute
+
+        if compute is None:
+            value = instance.decode(name)
+
+        else:
+            value = compute(instance)
+
+        values[name] = value
+
+        return value  # type: ignore[no-any-return]
+
+
+def lazy(compute: Unary[Any, T]) -> Lazy[T]:
+    """Creates lazy attributes computed by the decorated function.
+
+    Example:
+        ```python
+        @lazy
+        def platformer(self) -> bool:
+            return self.length.is_platformer()
+        ```
+
+    Arguments:
+        compute: The function to compute the value with.
+
+    Returns:
+        The lazy attribute.
+    """
+    return Lazy(compute)
+
+
+@define()
+class LazyModel(Model, Generic[M]):
+    """Represents lazy variants of models.
+
+    Lazy models keep the raw split mapping and decode each attribute on first access,
+    which is considerably cheaper when only a few attributes of each model are used.
+
+    Lazy models are round-tripped to RobTop strings without decoding anything,
+    and can be turned into the actual models via [`materialize`][gd.models_lazy.LazyModel.materialize].
+    """
+
+    MODEL: ClassVar[Type[Any]]
+    """The type of the model to materialize into."""
+
+    DECODER: ClassVar[Decoder]
+    """The decoder to use."""
+
+    mapping: RawMapping = field(factory=dict)
+    """The raw values, by string keys."""
+
+    values: Dict[str, Any] = field(factory=dict, init=False, repr=False, eq=False)
+    """The values decoded so far, by names."""
+
+    @classmethod
+    def from_robtop(cls, string: str) -> Self:
+        return cls(cls.DECODER.split(string))
+
+    def to_robtop(self) -> str:
+        return self.DECODER.concat(self.mapping)
+
+    @classmethod
+    def can_be_in(cls, string: str) -> bool:
+        return cls.MODEL.can_be_in(string)  # type: ignore[no-any-return]
+
+    def decode(self, name: str) -> Any:
+        """Decodes the value named `name` from the raw mapping.
+
+        Arguments:
+            name: The name of the value.
+
+        Returns:
+            The decoded value.
+        """
+        return self.DECODER.decode_value(name, self.mapping)
+
+    def materialize(self) -> M:
+        """Decodes all of the attributes, creating the actual model.
+
+        Returns:
+            The materialized model.
+        """
+        model = self.MODEL
+
+        return model(  # type: ignore[no-any-return]
+            **{field.name: get_attribute(self, field.name) for field in get_fields(model)}
+        )
+
+
+@define()
+class LazySongModel(LazyModel[SongModel]):
+    MODEL = SongModel
+    DECODER = SONG_DECODER
+
+    id = Lazy[int]()
+    name = Lazy[str]()
+    artist_id = Lazy[int]()
+    artist_name = Lazy[str]()
+    size = Lazy[float]()
+    youtube_video_id = Lazy[str]()
+    youtube_channel_id = Lazy[str]()
+    artist_verified = Lazy[bool]()
+    url = Lazy[Optional[URL]]()
+
+
+@define()
+class LazyLevelModel(LazyModel[LevelModel]):
+    MODEL = LevelModel
+    DECODER = LEVEL_DECODER
+
+    id = Lazy[int]()
+    name = Lazy[str]()
+    description = Lazy[str]()
+    version = Lazy[int]()
+    creator_id = Lazy[int]()
+    downloads = Lazy[int]()
+    official_song_id = Lazy[int]()
+    game_version = Lazy[GameVersion]()
+    rating = Lazy[int]()
+    length = Lazy[LevelLength]()
+    password = Lazy[Password]()
+    created_at = Lazy[DateTime]()
+    updated_at = Lazy[DateTime]()
+    original_id = Lazy[int]()
+    two_player = Lazy[bool]()
+    custom_song_id = Lazy[int]()
+    capacity = Lazy[Capacity]()
+    coins = Lazy[int]()
+    verified_coins = Lazy[bool]()
+    low_detail = Lazy[bool]()
+    special_rate_type = Lazy[SpecialRateType]()
+    object_count = Lazy[int]()
+    editor_time = Lazy[Duration]()
+    copies_time = Lazy[Duration]()
+    time_steps = Lazy[int]()
+
+    @lazy
+    def unprocessed_data(self) -> str:
+        return process_unprocessed_data(self.decode(UNPROCESSED_DATA))
+
+    @lazy
+    def difficulty(self) -> Difficulty:
+        decode = self.decode
+
+        return DifficultyParameters(
+            difficulty_numerator=decode("difficulty_numerator"),
+            difficulty_denominator=decode("difficulty_denominator"),
+            demon_difficulty_value=decode("demon_difficulty_value"),
+            auto=decode("auto"),
+            demon=decode("demon"),
+        ).into_difficulty()
+
+    @lazy
+    def platformer(self) -> bool:
+        return self.length.is_platformer()
+
+    @lazy
+    def reward(self) -> EitherReward:
+        return EitherReward(self.decode("reward"), self.platformer)
+
+    @lazy
+    def requested_reward(self) -> EitherReward:
+        return EitherReward(self.decode("requested_reward"), self.platformer)
+
+    @lazy
+    def score(self) -> int:
+        score: int = self.decode("score")
+
+        return max(0, score)
+
+    @lazy
+    def timely_id(self) -> int:
+        timely_id, _ = split_timely_id(self.decode("timely_id"))
+
+        return timely_id
+
+    @lazy
+    def timely_type(self) -> TimelyType:
+        _, timely_type = split_timely_id(self.decode("timely_id"))
+
+        return timely_type
+
+
+@define()
+class LazyLevelCommentInnerModel(LazyModel[LevelCommentInnerModel]):
+    MODEL = LevelCommentInnerModel
+    DECODER = LEVEL_COMMENT_INNER_DECODER
+
+    level_id = Lazy[int]()
+    content = Lazy[str]()
+    user_id = Lazy[int]()
+    rating = Lazy[int]()
+    id = Lazy[int]()
+    spam = Lazy[bool]()
+    created_at = Lazy[DateTime]()
+    record = Lazy[int]()
+    role_id = Lazy[int]()
+    color = Lazy[Color]()
+
+
+@define()
+class LazyLevelCommentUserModel(LazyModel[LevelCommentUserModel]):
+    MODEL = LevelCommentUserModel
+    DECODER = LEVEL_COMMENT_USER_DECODER
+
+    name = Lazy[str]()
+    icon_id = Lazy[int]()
+    color_1_id = Lazy[int]()
+    color_2_id = Lazy[int]()
+    icon_type = Lazy[IconType]()
+    glow = Lazy[bool]()
+    account_id = Lazy[int]()
+
+
+@define()
+class LazyLevelCommentModel(Model):
+    inner: LazyLevelCommentInnerModel = field(factory=LazyLevelCommentInnerModel)
+    user: LazyLevelCommentUserModel = field(factory=LazyLevelCommentUserModel)
+
+    @classmethod
+    def from_robtop(cls, string: str) -> Self:
+        inner_string, user_string = split_level_comment(string)
+
+        inner = LazyLevelCommentInnerModel.from_robtop(inner_string)
+        user = LazyLevelCommentUserModel.from_robtop(user_string)
+
+        return cls(inner=inner, user=user)
+
+    def to_robtop(self) -> str:
+        return iter.of(self.inner.to_robtop(), self.user.to_robtop()).collect(concat_level_comment)
+
+    @classmethod
+    def can_be_in(cls, string: str) -> bool:
+        return LEVEL_COMMENT_SEPARATOR in string
+
+    def materialize(self) -> LevelCommentModel:
+        return LevelCommentModel(inner=self.inner.materialize(), user=self.user.materialize())
+
+
+def materialize(model: LazyModel[M]) -> M:
+    return model.materialize()
+
+
+def to_robtop(model: Model) -> str:
+    return model.to_robtop()
+
+
+@define()
+class LazySearchLevelsResponseModel(Model):
+    """Represents lazy variants of
+    [`SearchLevelsResponseModel`][gd.models.SearchLevelsResponseModel].
+
+    Levels and songs are [`LazyModel`][gd.models_lazy.LazyModel] instances,
+    while creators and pages are decoded eagerly, since they are small.
+    """
+
+    levels: List[LazyLevelModel] = field(factory=list)
+    creators: List[CreatorModel] = field(factory=list)
+    songs: List[LazySongModel] = field(factory=list)
+    page: PageModel = field(factory=PageModel)
+    hash: str = field(default=EMPTY)
+
+    @classmethod
+    def from_robtop(cls, string: str) -> Self:
+        (
+            levels_string,
+            creators_string,
+            songs_string,
+            page_string,
+            hash,
+        ) = split_search_levels_response(string)
+
+        levels = (
+            iter(split_search_levels_response_levels(levels_string))
+            .map(LazyLevelModel.from_robtop)
+            .list()
+        )
+
+        creators = (
+            iter(split_search_levels_response_creators(creators_string))
+            .map(CreatorModel.from_robtop)
+            .list()
+        )
+
+        songs = (
+            iter(split_search_levels_response_songs(songs_string))
+            .map(LazySongModel.from_robtop)
+            .list()
+        )
+
+        page = PageModel.from_robtop(page_string)
+
+        return cls(levels=levels, creators=creators, songs=songs, page=page, hash=hash)
+
+    def to_robtop(self) -> str:
+        return iter.of(
+            iter(self.levels).map(to_robtop).collect(concat_search_levels_response_levels),
+            iter(self.creators).map(to_robtop).collect(concat_search_levels_response_creators),
+            iter(self.songs).map(to_robtop).collect(concat_search_levels_response_songs),
+            self.page.to_robtop(),
+            self.hash,
+        ).collect(concat_search_levels_response)
+
+    @classmethod
+    def can_be_in(cls, string: str) -> bool:
+        return SEARCH_LEVELS_RESPONSE_SEPARATOR in string
+
+    def materialize(self) -> SearchLevelsResponseModel:
+        return SearchLevelsResponseModel(
+            levels=iter(self.levels).map(materialize).list(),
+            creators=self.creators,
+            songs=iter(self.songs).map(materialize).list(),
+            page=self.page,
+            hash=self.hash,
+        )
+
+
+@define()
+class LazyLevelCommentsResponseModel(Model):
+    """Represents lazy variants of
+    [`LevelCommentsResponseModel`][gd.models.LevelCommentsResponseModel].
+    """
+
+    comments: List[LazyLevelCommentModel] = field(factory=list)
+    page: PageModel = field(factory=PageModel)
+
+    @classmethod
+    def from_robtop(cls, string: str) -> Self:
+        comments_string, page_string = split_level_comments_response(string)
+
+        comments = (
+            iter(split_level_comments_response_comments(comments_string))
+            .map(LazyLevelCommentModel.from_robtop)
+            .list()
+        )
+
+        page = PageModel.from_robtop(page_string)
+
+        return cls(comments=comments, page=page)
+
+    def to_robtop(self) -> str:
+        return iter.of(
+            iter(self.comments).map(to_robtop).collect(concat_level_comments_response_comments),
+            self.page.to_robtop(),
+        ).collect(concat_level_comments_response)
+
+    @classmethod
+    def can_be_in(cls, string: str) -> bool:
+        return LEVEL_COMMENTS_RESPONSE_SEPARATOR in string
+
+    def materialize(self) -> LevelCommentsResponseModel:
+        return LevelCommentsResponseModel(
+            comments=iter(self.comments).map(LazyLevelCommentModel.materialize).list(),
+            page=self.page,
+        )
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from asyncio import sleep
+from time import monotonic as clock
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+from aiohttp import BasicAuth
+from attrs import define, field, frozen
+
+from gd.enums import ProxyStrategy
+from gd.rate_limiter import RateLimit, TokenBucket
+
+if TYPE_CHECKING:
+    from gd.time import Clock
+
+__all__ = ("Proxy", "ProxyPool", "ProxyState")
+
+DEFAULT_FAILURE_THRESHOLD = 3
+"""The default number of consecutive failures after which proxies are quarantined."""
+
+DEFAULT_QUARANTINE = 60.0
+"""The default time (in seconds) proxies spend in quarantine."""
+
+DEFAULT_MAX_QUARANTINE = 3600.0
+"""The default maximum time (in seconds) proxies spend in quarantine."""
+
+QUARANTINE_MULTIPLY = 2.0
+
+EXPECTED_PROXIES = "expected at least one proxy"
+
+
+@frozen()
+class Proxy:
+    """Represents proxies, that is, egress addresses."""
+
+    url: str = field()
+    auth: Optional[BasicAuth] = field(default=None, repr=False)
+
+    rate_limit: Optional[RateLimit] = field(default=None)
+    """The request budget of the proxy."""
+
+
+@define()
+class ProxyState:
+    """Represents health and load states of proxies within [`ProxyPool`][gd.proxies.ProxyPool]."""
+
+    proxy: Proxy = field()
+    bucket: Optional[TokenBucket] = field(default=None, repr=False)
+
+    in_flight: int = field(default=0)
+    failures: int = field(default=0)
+    quarantines: int = field(default=0)
+    quarantined_until: float = field(default=0.0)
+
+    def is_quarantined(self, now: float) -> bool:
+        return now < self.quarantined_until
+
+
+@define()
+class ProxyPool:
+    """Represents pools of proxies used by [`HTTPClient`][gd.http.HTTPClient].
+
+    Proxies are selected according to the [`ProxyStrategy`][gd.enums.ProxyStrategy].
+    Proxies that fail `failure_threshold` times in a row are quarantined,
+    with the quarantine time doubling on each subsequent quarantine
+    until the proxy succeeds again.
+    """
+
+    proxies: Sequence[Proxy] = field()
+    strategy: ProxyStrategy = field(default=ProxyStrategy.DEFAULT)
+
+    failure_threshold: int = field(default=DEFAULT_FAILURE_THRESHOLD)
+    quarantine: float = field(default=DEFAULT_QUARANTINE)
+    max_quarantine: float = field(default=DEFAULT_MAX_QUARANTINE)
+
+    _clock: Clock = field(default=clock, repr=False)
+
+    states: List[ProxyState] = field(init=False)
+
+    _index: int = field(default=0, init=False, repr=False)
+    _sticky: Dict[int, ProxyState] = field(factory=dict, init=False, repr=False)
+
+    @proxies.validator
+    def check_proxies(self, attribute: object, proxies: Sequence[Proxy]) -> None:
+        if not proxies:
+            raise ValueError(EXPECTED_PROXIES)
+
+    @states.default
+    def default_states(self) -> List[ProxyState]:
+        clock = self._clock
+
+        return [
+            ProxyState(
+                proxy, None if proxy.rate_limit is None else proxy.rate_limit.create_bucket(clock)
+            )
+            for proxy in self.proxies
+        ]
+
+    def available(self) -> List[ProxyState]:
+        """Returns the states of proxies that are not quarantined.
+
+        If all proxies are quarantined, the one to be released the soonest is returned.
+
+        Returns:
+            The list of available proxy states.
+        """
+        now = self._clock()
+
+        states = self.states
+
+        available = [state for state in states if not state.is_quarantined(now)]
+
+        if not available:
+            available.append(min(states, key=quarantined_until))
+
+        return available
+
+    def select(self, account_id: Optional[int] = None) -> ProxyState:
+        """Selects the proxy to use for the next request.
+
+        Arguments:
+            account_id: The ID of the account making the request, if any.
+
+        Returns:
+            The state of the selected proxy.
+        """
+        available = self.available()
+
+        strategy = self.strategy
+
+        if strategy.is_sticky() and account_id is not None:
+            sticky = self._sticky
+
+            state = sticky.get(account_id)
+
+            if state is None or state not in available:
+                state = available[account_id % len(available)]
+
+                sticky[account_id] = state
+
+            return state
+
+        if strategy.is_least_loaded():
+            return min(available, key=load)
+
+        index = self._index
+
+        self._index = index + 1
+
+        return available[index % len(available)]
+
+    async def acquire(self, account_id: Optional[int] = None) -> ProxyState:
+        """Selects the proxy and waits until its budget allows sending the request.
+
+        Arguments:
+            account_id: The ID of the account making the request, if any.
+
+        Returns:
+            The state of the acquired proxy, which has to be
+            [`release`][gd.proxies.ProxyPool.release]d afterwards.
+        """
+        state = self.select(account_id)
+
+        bucket = state.bucket
+
+        if bucket is not None:
+            delay = bucket.delay()
+
+            while delay:
+                await sleep(delay)
+
+                delay = bucket.delay()
+
+            bucket.consume()
+
+        state.in_flight += 1
+
+        return state
+
+    def release(self, state: ProxyState, success: Optional[bool]) -> None:
+        """Releases the proxy, recording the outcome of the request.
+
+        Arguments:
+            state: The state of the proxy to release.
+            success: Whether the request succeeded; `None` means the outcome is unknown,
+                for instance, if the request was cancelled.
+        """
+        state.in_flight -= 1
+
+        if success is None:
+            return
+
+        if success:
+            state.failures = 0
+            state.quarantines = 0
+
+            return
+
+        state.failures += 1
+
+        if state.failures >= self.failure_threshold:
+            duration = min(
+                self.quarantine * QUARANTINE_MULTIPLY**state.quarantines, self.max_quarantine
+            )
+
+            state.quarantined_until = self._clock() + duration
+
+            state.failures = 0
+            state.quarantines += 1
+
+
+def quarantined_until(state: ProxyState) -> float:
+    return state.quarantined_until
+
+
+def load(state: ProxyState) -> int:
+    return state.in_flight
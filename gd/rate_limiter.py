@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+from asyncio import Event, sleep
+from contextvars import ContextVar, Token
+from heapq import heappop, heappush
+from itertools import count
+from time import monotonic as clock
+from typing import TYPE_CHECKING, Dict, Iterator, List, Mapping, Optional, Tuple, Type, TypeVar
+
+from attrs import define, field, frozen
+
+from gd.enums import RequestPriority
+
+if TYPE_CHECKING:
+    from types import TracebackType as Traceback
+
+    from gd.time import Clock
+
+__all__ = (
+    "RateLimit",
+    "RateLimiter",
+    "TokenBucket",
+    "get_priority",
+    "prioritized",
+)
+
+DEFAULT_TOKENS = 1.0
+
+priority_variable: ContextVar[RequestPriority] = ContextVar(
+    "priority", default=RequestPriority.DEFAULT
+)
+
+
+def get_priority() -> RequestPriority:
+    """Returns the request priority of the current context.
+
+    Returns:
+        The current [`RequestPriority`][gd.enums.RequestPriority].
+    """
+    return priority_variable.get()
+
+
+E = TypeVar("E", bound=BaseException)
+
+
+@define()
+class PriorityContextManager:
+    priority: RequestPriority = field()
+    token: Optional[Token[RequestPriority]] = field(default=None, repr=False, init=False)
+
+    def __enter__(self) -> RequestPriority:
+        self.token = priority_variable.set(self.priority)
+
+        return self.priority
+
+    def __exit__(
+        self,
+        error_type: Optional[Type[E]],
+        error: Optional[E],
+        traceback: Optional[Traceback],
+    ) -> None:
+        token = self.token
+
+        if token is not None:
+            priority_variable.reset(token)
+
+            self.token = None
+
+
+def prioritized(priority: RequestPriority) -> PriorityContextManager:
+    """Sets the priority of requests made within the context.
+
+    Unlike [`HTTPClient.change`][gd.http.HTTPClient.change], the priority is
+    local to the current task, so concurrent tasks sharing the client are not affected.
+
+    Example:
+        ```python
+        from gd.rate_limiter import prioritized
+
+        with prioritized(gd.RequestPriority.BACKGROUND):
+            levels = await client.search_levels(pages=range(100)).list()
+        ```
+
+    Arguments:
+        priority: The priority to use.
+
+    Returns:
+        The context manager setting the priority.
+    """
+    return PriorityContextManager(priority)
+
+
+@frozen()
+class RateLimit:
+    """Represents rate limits, that is, token bucket configurations."""
+
+    rate: float = field()
+    """The rate (in requests per second) at which tokens are refilled."""
+
+    capacity: float = field(default=DEFAULT_TOKENS)
+    """The maximum number of tokens stored, which limits bursts."""
+
+    @classmethod
+    def per_minute(cls, requests: float, capacity: float = DEFAULT_TOKENS) -> RateLimit:
+        return cls(requests / 60.0, capacity)
+
+    def create_bucket(self, clock: Clock = clock) -> TokenBucket:
+        return TokenBucket(self.rate, self.capacity, clock=clock)
+
+
+@define()
+class TokenBucket:
+    """Represents token buckets."""
+
+    rate: float = field()
+    capacity: float = field(default=DEFAULT_TOKENS)
+
+    _clock: Clock = field(default=clock, repr=False)
+
+    tokens: float = field(init=False)
+    updated_at: float = field(init=False, repr=False)
+
+    @tokens.default
+    def default_tokens(self) -> float:
+        return self.capacity
+
+    @updated_at.default
+    def default_updated_at(self) -> float:
+        return self._clock()
+
+    def refill(self) -> None:
+        now = self._clock()
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+
+        self.updated_at = now
+
+    def delay(self, tokens: float = DEFAULT_TOKENS) -> float:
+        """Computes the delay until `tokens` can be consumed.
+
+        Arguments:
+            tokens: The amount of tokens to consume.
+
+        Returns:
+            The delay in seconds, `0.0` meaning tokens can be consumed right away.
+        """
+        self.refill()
+
+        missing = tokens - self.tokens
+
+        if missing <= 0.0:
+            return 0.0
+
+        return missing / self.rate
+
+    def consume(self, tokens: float = DEFAULT_TOKENS) -> None:
+        self.refill()
+
+        self.tokens -= tokens
+
+
+WaiterKey = Tuple[int, int]
+
+
+@define(order=True)
+class Waiter:
+    key: WaiterKey = field()
+    buckets: Tuple[TokenBucket, ...] = field(eq=False, order=False)
+    event: Event = field(factory=Event, eq=False, order=False, repr=False)
+    removed: bool = field(default=False, eq=False, order=False, repr=False)
+
+
+Queue = List[Waiter]
+"""Queues of waiters, that is, heaps ordered by waiter keys."""
+
+
+@define()
+class RateLimiter:
+    """Represents rate limiters, scheduling requests using token buckets.
+
+    Requests are throttled by the global limit, the limit of the route requested
+    and the limit of the account used, if any of these are configured.
+
+    Waiting requests are served in the order of their [`RequestPriority`][gd.enums.RequestPriority],
+    and then in the order of arrival; a request only goes ahead of another one
+    waiting on the same bucket if it has higher priority.
+
+    Each bucket keeps the heap of requests waiting on it; a request proceeds once it
+    is at the top of all of its heaps, and is woken up exactly when that happens.
+    """
+
+    global_limit: Optional[RateLimit] = field(default=None)
+    """The limit applied to all requests."""
+
+    route_limits: Mapping[str, RateLimit] = field(factory=dict)
+    """The limits per route name (e.g. `getGJLevels21.php`)."""
+
+    account_limit: Optional[RateLimit] = field(default=None)
+    """The limit applied to each account separately."""
+
+    _clock: Clock = field(default=clock, repr=False)
+
+    _global_bucket: Optional[TokenBucket] = field(init=False, repr=False)
+    _route_buckets: Dict[str, TokenBucket] = field(factory=dict, init=False, repr=False)
+    _account_buckets: Dict[int, TokenBucket] = field(factory=dict, init=False, repr=False)
+
+    _queues: Dict[int, Queue] = field(factory=dict, init=False, repr=False)
+    _waiting: int = field(default=0, init=False, repr=False)
+    _counter: Iterator[int] = field(factory=count, init=False, repr=False)
+
+    @_global_bucket.default
+    def default_global_bucket(self) -> Optional[TokenBucket]:
+        global_limit = self.global_limit
+
+        if global_limit is None:
+            return None
+
+        return global_limit.create_bucket(self._clock)
+
+    def buckets_for(self, name: str, account_id: Optional[int] = None) -> List[TokenBucket]:
+        """Returns the buckets that the request to the route named `name` is limited by.
+
+        Arguments:
+            name: The name of the route.
+            account_id: The ID of the account making the request, if any.
+
+        Returns:
+            The list of buckets.
+        """
+        buckets: List[TokenBucket] = []
+
+        global_bucket = self._global_bucket
+
+        if global_bucket is not None:
+            buckets.append(global_bucket)
+
+        route_limit = self.route_limits.get(name)
+
+        if route_limit is not None:
+            route_buckets = self._route_buckets
+
+            route_bucket = route_buckets.get(name)
+
+            if route_bucket is None:
+                route_buckets[name] = route_bucket = route_limit.create_bucket(self._clock)
+
+            buckets.append(route_bucket)
+
+        account_limit = self.account_limit
+
+        if account_limit is not None and account_id is not None:
+            account_buckets = self._account_buckets
+
+            account_bucket = account_buckets.get(account_id)
+
+            if account_bucket is None:
+                account_buckets[account_id] = account_bucket = account_limit.create_bucket(
+                    self._clock
+                )
+
+            buckets.append(account_bucket)
+
+        return buckets
+
+    def is_ready(self, waiter: Waiter) -> bool:
+        queues = self._queues
+
+        return all(queues[id(bucket)][0] is waiter for bucket in waiter.buckets)
+
+    def waiting(self) -> int:
+        return self._waiting
+
+    def push(self, waiter: Waiter) -> None:
+        queues = self._queues
+
+        for bucket in waiter.buckets:
+            queue = queues.get(id(bucket))
+
+            if queue is None:
+                queues[id(bucket)] = queue = []
+
+            heappush(queue, waiter)
+
+    def remove(self, waiter: Waiter) -> None:
+        waiter.removed = True
+
+        queues = self._queues
+
+        for bucket in waiter.buckets:
+            key = id(bucket)
+
+            queue = queues[key]
+
+            while queue and queue[0].removed:
+                heappop(queue)
+
+            if not queue:
+                del queues[key]
+
+                continue
+
+            top = queue[0]
+
+            if self.is_ready(top):
+                top.event.set()
+
+    async def acquire(
+        self,
+        name: str,
+        account_id: Optional[int] = None,
+        priority: Optional[RequestPriority] = None,
+    ) -> None:
+        """Waits until the request to the route named `name` is allowed to be sent.
+
+        Arguments:
+            name: The name of the route.
+            account_id: The ID of the account making the request, if any.
+            priority: The priority of the request; the priority of the current context
+                is used if not given.
+        """
+        buckets = self.buckets_for(name, account_id)
+
+        if not buckets:
+            return
+
+        if priority is None:
+            priority = get_priority()
+
+        waiter = Waiter((priority.value, next(self._counter)), tuple(buckets))
+
+        self.push(waiter)
+
+        self._waiting += 1
+
+        try:
+            while True:
+                while not self.is_ready(waiter):
+                    waiter.event.clear()
+
+                    await waiter.event.wait()
+
+                delay = max(bucket.delay() for bucket in buckets)
+
+                if not delay:
+                    for bucket in buckets:
+                        bucket.consume()
+
+                    return
+
+                await sleep(delay)
+
+        finally:
+            self._waiting -= 1
+
+            self.remove(waiter)
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from hashlib import sha256
+from pathlib import Path
+from sqlite3 import Connection, connect
+from threading import Lock
+from time import time as clock
+from typing import TYPE_CHECKING, Hashable, Mapping, Optional, Union
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from gd.time import Clock
+
+__all__ = ("ResponseCache", "cache_key")
+
+CachedResponse = Union[str, bytes]
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+"""The default maximum total size (in bytes) of cached responses."""
+
+DEFAULT_TIMEOUT = 30.0
+"""The default time (in seconds) to wait for other processes holding the database lock."""
+
+UTF_8 = "utf-8"
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    route TEXT NOT NULL,
+    value BLOB NOT NULL,
+    text INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+CREATE_INDEX = "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+
+ENABLE_WAL = "PRAGMA journal_mode=WAL"
+
+SELECT = "SELECT value, text, created_at FROM responses WHERE key = ?"
+
+TOUCH = "UPDATE responses SET accessed_at = ? WHERE key = ?"
+
+INSERT = (
+    "INSERT OR REPLACE INTO responses (key, route, value, text, size, created_at, accessed_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+DELETE = "DELETE FROM responses WHERE key = ?"
+
+DELETE_ALL = "DELETE FROM responses"
+
+TOTAL_SIZE = "SELECT COALESCE(SUM(size), 0) FROM responses"
+
+SELECT_OLDEST = "SELECT key, size FROM responses ORDER BY accessed_at"
+
+
+def cache_key(key: Hashable) -> str:
+    """Converts the request `key` into the string used to store responses.
+
+    Arguments:
+        key: The request key, which must have a stable `repr`.
+
+    Returns:
+        The hex digest of the key.
+    """
+    return sha256(repr(key).encode(UTF_8)).hexdigest()
+
+
+@define()
+class ResponseCache:
+    """Represents persistent response caches, backed by SQLite databases.
+
+    Responses are keyed on the route and canonical parameters of requests,
+    and are kept for the time-to-live configured for their routes.
+    Only routes with configured time-to-live values are cached.
+    The database can be shared by several processes on one host.
+
+    When the total size of responses exceeds `max_size`,
+    the least recently used responses are evicted.
+    """
+
+    path: Path = field(converter=Path)
+    """The path to the database."""
+
+    ttls: Mapping[str, float] = field(factory=dict)
+    """The time-to-live values (in seconds) per route name (e.g. `getGJGauntlets21.php`).
+
+    Caching is opt-in: routes not present here are never cached.
+    """
+
+    max_size: int = field(default=DEFAULT_MAX_SIZE)
+    """The maximum total size (in bytes) of cached responses."""
+
+    timeout: float = field(default=DEFAULT_TIMEOUT, repr=False)
+
+    _clock: Clock = field(default=clock, repr=False)
+
+    _connection: Optional[Connection] = field(default=None, init=False, repr=False)
+    _lock: Lock = field(factory=Lock, init=False, repr=False)
+
+    def ttl_for(self, name: str) -> Optional[float]:
+        return self.ttls.get(name)
+
+    def covers(self, name: str) -> bool:
+        return self.ttl_for(name) is not None
+
+    @property
+    def connection(self) -> Connection:
+        connection = self._connection
+
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            connection = connect(
+                str(self.path), timeout=self.timeout, check_same_thread=False, isolation_level=None
+            )
+
+            connection.execute(ENABLE_WAL)
+            connection.execute(CREATE_TABLE)
+            connection.execute(CREATE_INDEX)
+
+            self._connection = connection
+
+        return connection
+
+    def get(self, key: str, name: str) -> Optional[CachedResponse]:
+        """Fetches the response stored by `key` for the route named `name`.
+
+        Arguments:
+            key: The key of the response.
+            name: The name of the route.
+
+        Returns:
+            The response, if present and not expired, otherwise `None`.
+        """
+        ttl = self.ttl_for(name)
+
+        if ttl is None:
+            return None
+
+        with self._lock:
+            connection = self.connection
+
+            row = connection.execute(SELECT, (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            value, text, created_at = row
+
+            now = self._clock()
+
+            if now - created_at > ttl:
+                connection.execute(DELETE, (key,))
+
+                return None
+
+            connection.execute(TOUCH, (now, key))
+
+        if text:
+            return bytes(value).decode(UTF_8)
+
+        return bytes(value)
+
+    def put(self, key: str, name: str, response: CachedResponse) -> None:
+        """Stores the `response` by `key` for the route named `name`,
+        evicting the least recently used responses if needed.
+
+        Arguments:
+            key: The key of the response.
+            name: The name of the route.
+            response: The response to store.
+        """
+        if not self.covers(name):
+            return
+
+        text = isinstance(response, str)
+
+        value = response.encode(UTF_8) if isinstance(response, str) else response
+
+        size = len(value)
+
+        if size > self.max_size:
+            return
+
+        now = self._clock()
+
+        with self._lock:
+            connection = self.connection
+
+            connection.execute(INSERT, (key, name, value, text, size, now, now))
+
+            self.evict_unlocked()
+
+    def evict_unlocked(self) -> None:
+        connection = self.connection
+
+        (total_size,) = connection.execute(TOTAL_SIZE).fetchone()
+
+        max_size = self.max_size
+
+        if total_size <= max_size:
+            return
+
+        for key, size in connection.execute(SELECT_OLDEST).fetchall():
+            connection.execute(DELETE, (key,))
+
+            total_size -= size
+
+            if total_size <= max_size:
+                break
+
+    def evict(self) -> None:
+        with self._lock:
+            self.evict_unlocked()
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self.connection.execute(DELETE, (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self.connection.execute(DELETE_ALL)
+
+    def total_size(self) -> int:
+        with self._lock:
+            (total_size,) = self.connection.execute(TOTAL_SIZE).fetchone()
+
+        return int(total_size)
+
+    def close(self) -> None:
+        with self._lock:
+            connection = self._connection
+
+            if connection is not None:
+                connection.close()
+
+                self._connection = None
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic as clock
+from typing import TYPE_CHECKING, AbstractSet, Mapping, Optional
+
+from attrs import field, frozen
+
+from gd.tasks import ExponentialBackoff
+
+if TYPE_CHECKING:
+    from gd.time import Clock
+
+__all__ = ("RetryPolicy", "parse_retry_after")
+
+RETRY_AFTER = "Retry-After"
+
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_INTERNAL_SERVER_ERROR = 500
+HTTP_BAD_GATEWAY = 502
+HTTP_SERVICE_UNAVAILABLE = 503
+HTTP_GATEWAY_TIMEOUT = 504
+
+DEFAULT_RETRY_STATUSES = frozenset(
+    (
+        HTTP_TOO_MANY_REQUESTS,
+        HTTP_INTERNAL_SERVER_ERROR,
+        HTTP_BAD_GATEWAY,
+        HTTP_SERVICE_UNAVAILABLE,
+        HTTP_GATEWAY_TIMEOUT,
+    )
+)
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"))
+
+DEFAULT_MULTIPLY = 0.5
+DEFAULT_BASE = 2.0
+DEFAULT_LIMIT = 6
+
+DEFAULT_MAX_TIME = 60.0
+
+DEFAULT_HONOR_RETRY_AFTER = True
+
+INFINITE = -1
+NO_RETRIES = 0
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Parses the `Retry-After` header value into the delay in seconds.
+
+    Both *delay-seconds* and *HTTP-date* forms are supported.
+
+    Arguments:
+        value: The header value to parse.
+
+    Returns:
+        The delay in seconds, or `None` if the `value` is invalid.
+    """
+    value = value.strip()
+
+    try:
+        return max(0.0, float(value))
+
+    except ValueError:
+        pass
+
+    try:
+        date_time = parsedate_to_datetime(value)
+
+    except (TypeError, ValueError):
+        return None
+
+    if date_time.tzinfo is None:
+        return None
+
+    return max(0.0, (date_time - datetime.now(timezone.utc)).total_seconds())
+
+
+@frozen()
+class RetryPolicy:
+    """Represents retry policies used by [`HTTPClient`][gd.http.HTTPClient].
+
+    Retries are delayed using the [`ExponentialBackoff`][gd.tasks.ExponentialBackoff]
+    with *full jitter*, and are only performed on idempotent routes.
+    """
+
+    budgets: Mapping[str, int] = field(factory=dict)
+    """The retry budgets per route name (e.g. `getGJLevels21.php`),
+    overriding the `retries` passed to requests.
+    """
+
+    idempotent: AbstractSet[str] = field(factory=frozenset)
+    """The names of routes that are safe to retry."""
+
+    statuses: AbstractSet[int] = field(default=DEFAULT_RETRY_STATUSES)
+    """The HTTP statuses to retry on."""
+
+    multiply: float = field(default=DEFAULT_MULTIPLY)
+    base: float = field(default=DEFAULT_BASE)
+    limit: int = field(default=DEFAULT_LIMIT)
+
+    max_time: Optional[float] = field(default=DEFAULT_MAX_TIME)
+    """The maximum total time (in seconds) to spend retrying; `None` means unbounded."""
+
+    honor_retry_after: bool = field(default=DEFAULT_HONOR_RETRY_AFTER)
+    """Whether to honor the `Retry-After` header sent by the server."""
+
+    clock: Clock = field(default=clock, repr=False)
+
+    def is_idempotent(self, method: str, name: str) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS or name in self.idempotent
+
+    def should_retry_status(self, status: int) -> bool:
+        return status in self.statuses
+
+    def compute_attempts(self, method: str, name: str, retries: int) -> int:
+        """Computes the number of attempts to make.
+
+        Arguments:
+            method: The HTTP method of the request.
+            name: The name of the route requested.
+            retries: The number of retries requested; negative values mean infinite retries.
+
+        Returns:
+            The number of attempts, where `-1` means infinite attempts.
+        """
+        if not self.is_idempotent(method, name):
+            retries = NO_RETRIES
+
+        else:
+            retries = self.budgets.get(name, retries)
+
+        if retries < 0:
+            return INFINITE
+
+        return retries + 1
+
+    def create_backoff(self) -> ExponentialBackoff:
+        return ExponentialBackoff(
+            multiply=self.multiply, base=self.base, limit=self.limit, clock=self.clock
+        )
+
+    def compute_delay(
+        self, backoff: ExponentialBackoff, retry_after: Optional[str] = None
+    ) -> float:
+        """Computes the delay before the next attempt.
+
+        Arguments:
+            backoff: The backoff to compute the delay with.
+            retry_after: The `Retry-After` header value, if any.
+
+        Returns:
+            The delay in seconds.
+        """
+        delay = backoff.delay()
+
+        if retry_after is not None and self.honor_retry_after:
+            server_delay = parse_retry_after(retry_after)
+
+            if server_delay is not None:
+                delay = max(delay, server_delay)
+
+        return delay
+
+    def can_wait(self, started_at: float, delay: float) -> bool:
+        """Checks whether waiting for `delay` seconds fits into the total time budget.
+
+        Arguments:
+            started_at: The time when the request has started, according to the clock.
+            delay: The delay to wait for.
+
+        Returns:
+            Whether the waiting is allowed.
+        """
+        max_time = self.max_time
+
+        if max_time is None:
+            return True
+
+        return self.clock() - started_at + delay <= max_time
@@ -11,6 +11,8 @@ T = TypeVar("T", bound="FromRobTop")
 
 @runtime_checkable
 class FromRobTop(Protocol):
+    __slots__ = ()
+
     @classmethod
     @required
     def from_robtop(cls, string: str) -> Self:
@@ -27,6 +29,8 @@ def is_from_robtop(item: Any) -> TypeGuard[FromRobTop]:
 
 @runtime_checkable
 class ToRobTop(Protocol):
+    __slots__ = ()
+
     @required
     def to_robtop(self) -> str:
         ...
@@ -38,4 +42,4 @@ def is_to_robtop(item: Any) -> TypeGuard[ToRobTop]:
 
 @runtime_checkable
 class RobTop(FromRobTop, ToRobTop, Protocol):
-    pass
+    __slots__ = ()
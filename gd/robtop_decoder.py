@@ -0,0 +1,263 @@
+from builtins import iter as standard_iter
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from attrs import field, frozen
+from typing_aliases import Nullary, Unary
+from wraps import Option
+
+__all__ = ("DecoderField", "Decoder", "RawMapping", "int_into")
+
+E = TypeVar("E")
+
+Convert = Unary[str, Any]
+
+RawMapping = Dict[str, str]
+"""Raw RobTop mappings, that is, values by string keys."""
+
+Entry = Tuple[str, Optional[Convert], bool, bool]
+"""Compiled fields, that is, the name, the converter, whether empty values are skipped
+and whether the converter returns options.
+"""
+
+
+def int_into(type: Type[E]) -> Unary[str, E]:
+    """Creates converters of strings to integers, which are then passed to the `type`
+    (for instance, some integer enum).
+
+    Arguments:
+        type: The type to convert integers into.
+
+    Returns:
+        The converter.
+    """
+
+    def convert(string: str) -> E:
+        return type(int(string))  # type: ignore[call-arg]
+
+    return convert
+
+
+@frozen()
+class DecoderField:
+    """Represents fields of [`Decoder`][gd.robtop_decoder.Decoder] specifications."""
+
+    key: int
+    """The key of the field in the RobTop string."""
+
+    name: str
+    """The name of the field, usually matching the name of the model attribute."""
+
+    convert: Optional[Convert] = field(default=None)
+    """The function to convert values with, or `None` to keep strings."""
+
+    default: Any = field(default=None)
+    """The default value to use if the field is missing."""
+
+    factory: Optional[Nullary[Any]] = field(default=None)
+    """The factory of default values, used instead of `default` if provided."""
+
+    skip_empty: bool = field(default=False)
+    """Whether to treat empty values as missing."""
+
+    optional: bool = field(default=False)
+    """Whether `convert` returns [`Option[T]`][wraps.option.Option],
+    in which case `null` values are treated as missing.
+    """
+
+    def create_default(self) -> Any:
+        factory = self.factory
+
+        if factory is None:
+            return self.default
+
+        return factory()
+
+    def decode(self, value: Optional[str]) -> Any:
+        """Decodes the `value` of the field, if present.
+
+        Arguments:
+            value: The raw value, or `None` if the field is missing.
+
+        Returns:
+            The decoded value, or the default one if the field is missing.
+        """
+        if value is None or self.skip_empty and not value:
+            return self.create_default()
+
+        convert = self.convert
+
+        if convert is None:
+            return value
+
+        if self.optional:
+            option: Option[Any] = convert(value)
+
+            result = option.extract()
+
+            if result is None:
+                return self.create_default()
+
+            return result
+
+        return convert(value)
+
+
+def convert_fields(fields: Iterable[DecoderField]) -> Tuple[DecoderField, ...]:
+    return tuple(fields)
+
+
+@frozen()
+class Decoder:
+    """Represents table-driven decoders of RobTop mappings.
+
+    The specification is compiled once into the lookup table keyed by the string keys,
+    so that decoding walks the split list directly, without building intermediate mappings,
+    views or options per field.
+
+    Unknown keys are ignored; if some key is repeated, the last value wins.
+
+    Example:
+        ```python
+        DECODER = Decoder(
+            ":",
+            (
+                DecoderField(1, "id", int, DEFAULT_ID),
+                DecoderField(2, "name", default=EMPTY),
+            ),
+        )
+
+        values = DECODER.decode("1:13:2:nekit")  # {"id": 13, "name": "nekit"}
+        ```
+    """
+
+    separator: str
+    fields: Tuple[DecoderField, ...] = field(converter=convert_fields)
+
+    _table: Dict[str, Entry] = field(init=False, repr=False, eq=False)
+    _defaults: Dict[str, Any] = field(init=False, repr=False, eq=False)
+    _factories: List[Tuple[str, Nullary[Any]]] = field(init=False, repr=False, eq=False)
+    _named: Dict[str, Tuple[str, DecoderField]] = field(init=False, repr=False, eq=False)
+
+    @_table.default
+    def default_table(self) -> Dict[str, Entry]:
+        return {
+            str(field.key): (field.name, field.convert, field.skip_empty, field.optional)
+            for field in self.fields
+        }
+
+    @_defaults.default
+    def default_defaults(self) -> Dict[str, Any]:
+        return {field.name: field.default for field in self.fields if field.factory is None}
+
+    @_factories.default
+    def default_factories(self) -> List[Tuple[str, Nullary[Any]]]:
+        return [(field.name, field.factory) for field in self.fields if field.factory is not None]
+
+    @_named.default
+    def default_named(self) -> Dict[str, Tuple[str, DecoderField]]:
+        return {field.name: (str(field.key), field) for field in self.fields}
+
+    def split(self, string: str) -> RawMapping:
+        """Splits the RobTop `string` into raw values by string keys, without decoding them.
+
+        Arguments:
+            string: The string to split.
+
+        Returns:
+            The raw values, by string keys.
+        """
+        if not string:
+            return {}
+
+        iterator = standard_iter(string.split(self.separator))
+
+        return dict(zip(iterator, iterator))
+
+    def concat(self, mapping: RawMapping) -> str:
+        """Concatenates the raw `mapping` back into the RobTop string.
+
+        Arguments:
+            mapping: The raw values, by string keys.
+
+        Returns:
+            The RobTop string.
+        """
+        return self.separator.join(chain.from_iterable(mapping.items()))
+
+    def decode_value(self, name: str, mapping: RawMapping) -> Any:
+        """Decodes the single value of the field named `name` from the raw `mapping`.
+
+        Arguments:
+            name: The name of the field.
+            mapping: The raw values, by string keys.
+
+        Raises:
+            KeyError: The field is not defined.
+
+        Returns:
+            The decoded value.
+        """
+        key, field = self._named[name]
+
+        return field.decode(mapping.get(key))
+
+    def decode_parts(self, parts: Iterable[str]) -> Dict[str, Any]:
+        """Decodes the alternating keys and values.
+
+        Arguments:
+            parts: The alternating keys and values.
+
+        Returns:
+            The values, by field names.
+        """
+        table = self._table
+
+        values = dict(self._defaults)
+
+        iterator = standard_iter(parts)
+
+        for key, value in zip(iterator, iterator):
+            entry = table.get(key)
+
+            if entry is None:
+                continue
+
+            name, convert, skip_empty, optional = entry
+
+            if skip_empty and not value:
+                continue
+
+            if convert is None:
+                values[name] = value
+
+            elif optional:
+                option: Option[Any] = convert(value)
+
+                result = option.extract()
+
+                if result is not None:
+                    values[name] = result
+
+            else:
+                values[name] = convert(value)
+
+        for name, factory in self._factories:
+            if name not in values:
+                values[name] = factory()
+
+        return values
+
+    def decode(self, string: str) -> Dict[str, Any]:
+        """Decodes the RobTop `string`.
+
+        Arguments:
+            string: The string to decode.
+
+        Returns:
+            The values, by field names.
+        """
+        if not string:
+            return self.decode_parts(())
+
+        return self.decode_parts(string.split(self.separator))
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-from typing import AsyncIterator, TypeVar
+from asyncio import FIRST_COMPLETED, Future, ensure_future, wait
+from typing import AsyncIterator, Awaitable, Dict, Generic, List, Optional, TypeVar
 
 from async_extensions.collecting import collect_iterable_results
+from attrs import field, frozen
 from iters.async_utils import async_iter, async_list
-from typing_aliases import AnyErrorType, AnyIterable, is_instance
+from typing_aliases import AnyErrorType, AnyIterable, DynamicTuple, Unary, is_instance
 from wraps.primitives.result import is_error
 
-__all__ = ("run_iterables",)
+from gd.constants import DEFAULT_PAGE
+from gd.errors import NothingFound
+from gd.models import PageModel
+
+__all__ = ("Page", "crawl_pages", "run_iterables", "stream_iterables")
+
+EXPECTED_POSITIVE_CONCURRENCY = "expected `concurrency` to be positive"
 
 T = TypeVar("T")
 
@@ -31,3 +39,203 @@ async def run_iterables(
         else:
             for item in result.unwrap():
                 yield item
+
+
+DEFAULT_CONCURRENCY = 10
+DEFAULT_ORDERED = True
+DEFAULT_STOP_ON_EMPTY = True
+
+Items = List[T]
+
+
+async def stream_iterables(
+    iterables: AnyIterable[AnyIterable[T]],
+    *ignore: AnyErrorType,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = DEFAULT_ORDERED,
+    stop_on_empty: bool = DEFAULT_STOP_ON_EMPTY,
+    stop: DynamicTuple[AnyErrorType] = (NothingFound,),
+) -> AsyncIterator[T]:
+    """Streams items of `iterables` (typically pages), keeping at most
+    `concurrency` of them in flight at any time.
+
+    Unlike [`run_iterables`][gd.run_iterables.run_iterables], new iterables are only
+    started as the results are consumed, which keeps memory usage bounded.
+
+    Arguments:
+        iterables: The iterables to stream items from.
+        *ignore: The error types to ignore, skipping the iterables that raised them.
+        concurrency: The maximum number of iterables in flight.
+        ordered: Whether to yield items in the order of `iterables`,
+            rather than as soon as each iterable is collected.
+        stop_on_empty: Whether to stop once some iterable turns out to be empty.
+        stop: The error types that stop the streaming, as if the iterable was empty.
+
+    Returns:
+        The asynchronous iterator over the items.
+    """
+    if concurrency < 1:
+        raise ValueError(EXPECTED_POSITIVE_CONCURRENCY)
+
+    iterator = async_iter(iterables)
+
+    pending: Dict[Future[Items[T]], int] = {}
+
+    index = 0
+    exhausted = False
+
+    stop_index: Optional[int] = None
+
+    async def fill() -> None:
+        nonlocal index, exhausted
+
+        while not exhausted and stop_index is None and len(pending) < concurrency:
+            try:
+                iterable = await iterator.__anext__()
+
+            except StopAsyncIteration:
+                exhausted = True
+
+            else:
+                pending[ensure_future(async_list(iterable))] = index
+
+                index += 1
+
+    def cancel_after(last: int) -> None:
+        for future, future_index in list(pending.items()):
+            if future_index > last:
+                future.cancel()
+
+                del pending[future]
+
+    try:
+        while True:
+            await fill()
+
+            if not pending:
+                break
+
+            if ordered:
+                future = min(pending, key=pending.__getitem__)
+
+                await wait((future,))
+
+            else:
+                done, _ = await wait(pending, return_when=FIRST_COMPLETED)
+
+                future = min(done, key=pending.__getitem__)
+
+            future_index = pending.pop(future)
+
+            try:
+                page = future.result()
+
+            except stop:
+                page = []
+
+            except ignore:
+                continue
+
+            if not page and stop_on_empty:
+                if stop_index is None or future_index < stop_index:
+                    stop_index = future_index
+
+                cancel_after(stop_index)
+
+                continue
+
+            await fill()
+
+            for item in page:
+                yield item
+
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+@frozen()
+class Page(Generic[T]):
+    """Represents pages of items along with the page information reported by the server."""
+
+    items: List[T] = field(factory=list)
+    info: PageModel = field(factory=PageModel)
+
+    def is_last(self) -> bool:
+        """Checks whether this page is the last one.
+
+        Pages are considered last if they are empty, or if they reach the total
+        count reported by the server; if the total is unknown, only empty pages are last.
+
+        Returns:
+            Whether this page is the last one.
+        """
+        items = self.items
+
+        if not items:
+            return True
+
+        info = self.info
+
+        total = info.total
+
+        if total is None:
+            return False
+
+        return info.start + len(items) >= total
+
+
+DEFAULT_PREFETCH = True
+
+
+async def crawl_pages(
+    fetch_page: Unary[int, Awaitable[Page[T]]],
+    page: int = DEFAULT_PAGE,
+    prefetch: bool = DEFAULT_PREFETCH,
+    stop: DynamicTuple[AnyErrorType] = (NothingFound,),
+) -> AsyncIterator[T]:
+    """Crawls pages starting from `page` until the server reports the end.
+
+    Arguments:
+        fetch_page: The function to fetch pages with.
+        page: The page to start from.
+        prefetch: Whether to fetch the next page while the current one is being consumed.
+        stop: The error types that signal the end, as if the page was empty.
+
+    Returns:
+        The asynchronous iterator over the items.
+    """
+    future = ensure_future(fetch_page(page))
+
+    try:
+        while True:
+            try:
+                current = await future
+
+            except stop:
+                return
+
+            last = current.is_last()
+
+            if not last:
+                page += 1
+
+                if prefetch:
+                    future = ensure_future(fetch_page(page))
+
+            for item in current.items:
+                yield item
+
+            if last:
+                return
+
+            if not prefetch:
+                future = ensure_future(fetch_page(page))
+
+    finally:
+        if future.done():
+            if not future.cancelled():
+                future.exception()  # mark the error as retrieved, if any
+
+        else:
+            future.cancel()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Sequence, TypeVar
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Sequence, TypeVar
 
 from attrs import field, frozen
 
@@ -48,6 +48,7 @@ from gd.models import (
     LeaderboardResponseModel,
     LevelCommentsResponseModel,
     LevelLeaderboardResponseModel,
+    LevelModel,
     LevelResponseModel,
     LoginModel,
     MapPacksResponseModel,
@@ -71,6 +72,7 @@ from gd.newgrounds import (
     search_song_models,
 )
 from gd.queries import EMPTY_QUERY
+from gd.streaming import decode_stream, split_sections
 
 if TYPE_CHECKING:
     from pendulum import Duration
@@ -88,6 +90,8 @@ __all__ = ("Session",)
 
 FIRST = 0
 
+LEVELS_SECTION = 0
+
 T = TypeVar("T")
 
 
@@ -295,6 +299,38 @@ class Session:
 
         return SearchLevelsResponseModel.from_robtop(response)
 
+    async def stream_search_levels_on_page(
+        self,
+        query: Query = EMPTY_QUERY,
+        page: int = DEFAULT_PAGE,
+        filters: Optional[Filters] = None,
+        user_id: Optional[int] = None,
+        gauntlet: Optional[int] = None,
+        *,
+        client_account_id: Optional[int] = None,
+        client_user_id: Optional[int] = None,
+        hashed_password: Optional[str] = None,
+    ) -> AsyncIterator[LevelModel]:
+        """Streams level models found on the page, parsing each of them as soon as it arrives.
+
+        Since creators and songs are sent after all levels, they are not resolved here;
+        use [`search_levels_on_page`][gd.session.Session.search_levels_on_page] for that.
+        """
+        chunks = self.http.stream_search_levels_on_page(
+            query=query,
+            page=page,
+            filters=filters,
+            user_id=user_id,
+            gauntlet=gauntlet,
+            client_account_id=client_account_id,
+            client_user_id=client_user_id,
+            hashed_password=hashed_password,
+        )
+
+        async for section, item in split_sections(decode_stream(chunks)):
+            if section == LEVELS_SECTION:
+                yield LevelModel.from_robtop(item)
+
     async def get_timely_info(self, type: TimelyType) -> TimelyInfoModel:
         response = await self.http.get_timely_info(type=type)
 
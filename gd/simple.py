@@ -10,6 +10,8 @@ T = TypeVar("T")
 
 @runtime_checkable
 class Simple(Protocol[T]):
+    __slots__ = ()
+
     @classmethod
     @required
     def from_value(cls, value: T) -> Self:
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from asyncio import Future, ensure_future, shield
+from typing import Any, Awaitable, Dict, Generic, Hashable, Iterable, Optional, Tuple, TypeVar
+
+from attrs import define, field
+from typing_aliases import Nullary, Parameters
+
+__all__ = ("SingleFlight", "IGNORED_KEYS", "canonicalize")
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+IGNORED_KEYS = frozenset(("rs", "chk", "udid", "uuid"))
+"""The payload keys that are randomized per request and therefore ignored when coalescing."""
+
+Canonical = Tuple[Tuple[str, str], ...]
+
+
+def canonicalize(
+    parameters: Optional[Parameters], ignored: Iterable[str] = IGNORED_KEYS
+) -> Canonical:
+    """Converts `parameters` into their canonical form, dropping the `ignored` keys.
+
+    Arguments:
+        parameters: The parameters to canonicalize.
+        ignored: The keys to ignore.
+
+    Returns:
+        The sorted tuple of key-value pairs, with values converted to strings.
+    """
+    if not parameters:
+        return ()
+
+    ignored_set = set(ignored)
+
+    return tuple(
+        sorted((key, str(value)) for key, value in parameters.items() if key not in ignored_set)
+    )
+
+
+@define()
+class SingleFlight(Generic[K, T]):
+    """Represents *single-flight* groups, which coalesce concurrent calls by their keys.
+
+    While the call with some key is in flight, other calls with the same key
+    wait for it to complete and share its result (or error) instead of running again.
+    """
+
+    _flights: Dict[K, Future[T]] = field(factory=dict, init=False, repr=False)
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def run(self, key: K, function: Nullary[Awaitable[T]]) -> T:
+        """Runs the `function`, unless the call with the same `key` is already in flight.
+
+        The call itself is shielded from cancellation of individual callers,
+        so that cancelling one of them does not affect the others.
+
+        Arguments:
+            key: The key of the call.
+            function: The function to run.
+
+        Returns:
+            The result of the call.
+        """
+        flights = self._flights
+
+        future = flights.get(key)
+
+        if future is None:
+            future = ensure_future(function())
+
+            flights[key] = future
+
+            def done(_: Any) -> None:
+                if flights.get(key) is future:
+                    del flights[key]
+
+            future.add_done_callback(done)
+
+        return await shield(future)
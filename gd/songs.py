@@ -227,6 +227,8 @@ class Song(Entity, Binary):
             return await self.client.get_song(self.id)
 
     async def update(self, from_newgrounds: bool = DEFAULT_FROM_NEWGROUNDS) -> Self:
+        self.client.cache.songs.remove(self.id)  # make sure we fetch the fresh song
+
         return self.update_from(await self.get(from_newgrounds=from_newgrounds))
 
     async def ensure_url(self) -> URL:
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from codecs import getincrementaldecoder as get_incremental_decoder
+from typing import AsyncIterable, AsyncIterator, List, Tuple
+
+from attrs import define, field
+
+from gd.constants import DEFAULT_ENCODING, DEFAULT_ERRORS, EMPTY
+from gd.models_constants import (
+    SEARCH_LEVELS_RESPONSE_LEVELS_SEPARATOR,
+    SEARCH_LEVELS_RESPONSE_SEPARATOR,
+)
+
+__all__ = ("Splitter", "SectionSplitter", "decode_stream", "split_sections")
+
+SectionItem = Tuple[int, str]
+
+
+@define()
+class Splitter:
+    """Represents incremental splitters, which split strings fed in chunks by the `separator`.
+
+    Chunks are only joined once the separator is found, so that feeding
+    large pieces in many chunks takes linear time.
+    """
+
+    separator: str = field()
+
+    _pending: List[str] = field(factory=list, init=False, repr=False)
+
+    def feed(self, chunk: str) -> List[str]:
+        """Feeds the `chunk` to the splitter.
+
+        Arguments:
+            chunk: The chunk to feed.
+
+        Returns:
+            The pieces completed by the `chunk`.
+        """
+        pending = self._pending
+
+        if self.separator not in chunk:
+            pending.append(chunk)
+
+            return []
+
+        first, *pieces = chunk.split(self.separator)
+
+        pending.append(first)
+
+        pieces.insert(0, EMPTY.join(pending))
+
+        pending.clear()
+
+        pending.append(pieces.pop())
+
+        return pieces
+
+    def finish(self) -> str:
+        """Finishes splitting, returning the last piece.
+
+        Returns:
+            The last piece.
+        """
+        pending = self._pending
+
+        piece = EMPTY.join(pending)
+
+        pending.clear()
+
+        return piece
+
+
+@define()
+class SectionSplitter:
+    """Represents incremental splitters of RobTop responses into sections and their items,
+    for instance, `levels#creators#songs#page#hash`, where items are separated by `|`.
+
+    Items are emitted along with the index of their section as soon as they are complete,
+    while empty items are skipped.
+    """
+
+    section_separator: str = field(default=SEARCH_LEVELS_RESPONSE_SEPARATOR)
+    item_separator: str = field(default=SEARCH_LEVELS_RESPONSE_LEVELS_SEPARATOR)
+
+    section: int = field(default=0, init=False)
+
+    _items: Splitter = field(init=False, repr=False)
+
+    @_items.default
+    def default_items(self) -> Splitter:
+        return Splitter(self.item_separator)
+
+    def feed(self, chunk: str) -> List[SectionItem]:
+        """Feeds the `chunk` to the splitter.
+
+        Arguments:
+            chunk: The chunk to feed.
+
+        Returns:
+            The `(section, item)` pairs completed by the `chunk`.
+        """
+        items = self._items
+
+        completed: List[SectionItem] = []
+
+        pieces = chunk.split(self.section_separator)
+
+        last = len(pieces) - 1
+
+        for index, piece in enumerate(pieces):
+            section = self.section
+
+            completed.extend((section, item) for item in items.feed(piece) if item)
+
+            if index < last:
+                item = items.finish()
+
+                if item:
+                    completed.append((section, item))
+
+                self.section += 1
+
+        return completed
+
+    def finish(self) -> List[SectionItem]:
+        """Finishes splitting, returning the last item, if any.
+
+        Returns:
+            The list of `(section, item)` pairs left.
+        """
+        item = self._items.finish()
+
+        if item:
+            return [(self.section, item)]
+
+        return []
+
+
+async def decode_stream(
+    chunks: AsyncIterable[bytes], encoding: str = DEFAULT_ENCODING, errors: str = DEFAULT_ERRORS
+) -> AsyncIterator[str]:
+    """Incrementally decodes byte `chunks` into strings.
+
+    Arguments:
+        chunks: The chunks to decode.
+        encoding: The encoding to use.
+        errors: The error handling scheme to use.
+
+    Returns:
+        The asynchronous iterator over decoded strings.
+    """
+    decoder = get_incremental_decoder(encoding)(errors)
+
+    async for chunk in chunks:
+        string = decoder.decode(chunk)
+
+        if string:
+            yield string
+
+    string = decoder.decode(bytes(), final=True)
+
+    if string:
+        yield string
+
+
+async def split_sections(
+    chunks: AsyncIterable[str],
+    section_separator: str = SEARCH_LEVELS_RESPONSE_SEPARATOR,
+    item_separator: str = SEARCH_LEVELS_RESPONSE_LEVELS_SEPARATOR,
+) -> AsyncIterator[SectionItem]:
+    """Incrementally splits string `chunks` into sections and their items.
+
+    Arguments:
+        chunks: The chunks to split.
+        section_separator: The separator of sections.
+        item_separator: The separator of items within sections.
+
+    Returns:
+        The asynchronous iterator over `(section, item)` pairs.
+    """
+    splitter = SectionSplitter(section_separator, item_separator)
+
+    async for chunk in chunks:
+        for section_item in splitter.feed(chunk):
+            yield section_item
+
+    for section_item in splitter.finish():
+        yield section_item
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from abc import abstractmethod as required
+from base64 import b64decode as decode_base64
+from base64 import b64encode as encode_base64
+from json import dumps as dump_json
+from json import loads as load_json
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Protocol, runtime_checkable
+
+from attrs import define, field, frozen
+from typing_aliases import Headers, Parameters
+
+from gd.asyncio import run_blocking
+from gd.enums import ResponseType
+from gd.errors import ReplayMissing
+from gd.response_cache import cache_key
+from gd.single_flight import canonicalize
+
+__all__ = (
+    "Transport",
+    "TransportRequest",
+    "TransportResponse",
+    "RecordingTransport",
+    "ReplayTransport",
+)
+
+UTF_8 = "utf-8"
+ASCII = "ascii"
+
+JSON_SUFFIX = ".json"
+
+METHOD = "method"
+URL = "url"
+DATA = "data"
+PARAMETERS = "parameters"
+REQUEST = "request"
+RESPONSE = "response"
+STATUS = "status"
+HEADERS = "headers"
+BODY = "body"
+ENCODING = "encoding"
+
+UNKNOWN_RESPONSE_TYPE = "unknown response type: {}"
+
+
+@frozen()
+class TransportRequest:
+    """Represents requests sent by transports."""
+
+    method: str = field()
+    url: str = field()
+    data: Optional[Parameters] = field(default=None)
+    parameters: Optional[Parameters] = field(default=None)
+    headers: Headers = field(factory=dict)
+    read: bool = field(default=True)
+
+    def key(self) -> str:
+        """Computes the key of the request, ignoring the fields randomized per request.
+
+        Returns:
+            The key of the request.
+        """
+        return cache_key(
+            (self.method, self.url, canonicalize(self.data), canonicalize(self.parameters))
+        )
+
+
+@frozen()
+class TransportResponse:
+    """Represents responses received by transports."""
+
+    status: int = field()
+    headers: Mapping[str, str] = field(factory=dict)
+    body: bytes = field(default=bytes())
+    encoding: str = field(default=UTF_8)
+
+    def text(self, errors: str) -> str:
+        return self.body.decode(self.encoding, errors)
+
+    def json(self, errors: str) -> Any:
+        return load_json(self.text(errors))
+
+    def decode(self, type: ResponseType, errors: str) -> Any:
+        if type is ResponseType.BYTES:
+            return self.body
+
+        if type is ResponseType.TEXT:
+            return self.text(errors)
+
+        if type is ResponseType.JSON:
+            return self.json(errors)
+
+        raise ValueError(UNKNOWN_RESPONSE_TYPE.format(type))
+
+
+@runtime_checkable
+class Transport(Protocol):
+    """Represents transports, which send requests and receive responses.
+
+    [`HTTPClient`][gd.http.HTTPClient] itself is the default transport,
+    sending requests over the network.
+    """
+
+    @required
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        ...
+
+
+def dump_exchange(request: TransportRequest, response: TransportResponse) -> str:
+    exchange = {
+        REQUEST: {
+            METHOD: request.method,
+            URL: request.url,
+            DATA: None if request.data is None else dict(request.data),
+            PARAMETERS: None if request.parameters is None else dict(request.parameters),
+        },
+        RESPONSE: {
+            STATUS: response.status,
+            HEADERS: dict(response.headers),
+            BODY: encode_base64(response.body).decode(ASCII),
+            ENCODING: response.encoding,
+        },
+    }
+
+    return dump_json(exchange, default=str)
+
+
+def load_response(string: str) -> TransportResponse:
+    response: Dict[str, Any] = load_json(string)[RESPONSE]
+
+    return TransportResponse(
+        status=response[STATUS],
+        headers=response[HEADERS],
+        body=decode_base64(response[BODY]),
+        encoding=response[ENCODING],
+    )
+
+
+@define()
+class RecordingTransport(Transport):
+    """Represents transports that record request/response pairs sent through the `inner` one.
+
+    Each exchange is written to its own file within the `path` directory,
+    named by the [`key`][gd.transport.TransportRequest.key] of the request.
+    """
+
+    inner: Transport = field()
+    path: Path = field(converter=Path)
+
+    def path_for(self, request: TransportRequest) -> Path:
+        return self.path / (request.key() + JSON_SUFFIX)
+
+    def write(self, request: TransportRequest, response: TransportResponse) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self.path_for(request).write_text(dump_exchange(request, response), UTF_8)
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        response = await self.inner.send(request)
+
+        await run_blocking(self.write, request, response)
+
+        return response
+
+
+@define()
+class ReplayTransport(Transport):
+    """Represents transports that serve responses recorded by
+    [`RecordingTransport`][gd.transport.RecordingTransport], without network access.
+
+    If the response to some request was not recorded, the `fallback` transport is used,
+    if given; otherwise, [`ReplayMissing`][gd.errors.ReplayMissing] is raised.
+    """
+
+    path: Path = field(converter=Path)
+    fallback: Optional[Transport] = field(default=None)
+
+    _responses: Dict[str, TransportResponse] = field(factory=dict, init=False, repr=False)
+
+    def read(self, request: TransportRequest) -> Optional[TransportResponse]:
+        key = request.key()
+
+        responses = self._responses
+
+        response = responses.get(key)
+
+        if response is None:
+            path = self.path / (key + JSON_SUFFIX)
+
+            if not path.exists():
+                return None
+
+            responses[key] = response = load_response(path.read_text(UTF_8))
+
+        return response
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        response = self.read(request)
+
+        if response is None:
+            fallback = self.fallback
+
+            if fallback is None:
+                raise ReplayMissing(request.method, request.url)
+
+            return await fallback.send(request)
+
+        return response
@@ -185,6 +185,8 @@ class UserReference(Entity, Binary):
     async def update(
         self, simple: bool = DEFAULT_SIMPLE, friend_state: bool = DEFAULT_FRIEND_STATE
     ) -> Self:
+        self.client.cache.users.remove(self.account_id)  # make sure we fetch the fresh user
+
         user = await self.get(simple=simple, friend_state=friend_state)
 
         return self.update_from(user.as_reference())
@@ -1198,6 +1200,8 @@ class User(UserReference, Binary):
     async def update(
         self, simple: bool = DEFAULT_SIMPLE, friend_state: bool = DEFAULT_FRIEND_STATE
     ) -> Self:
+        self.client.cache.users.remove(self.account_id)  # make sure we fetch the fresh user
+
         return self.update_from(await self.get(simple=simple, friend_state=friend_state))
 
     def as_reference(self) -> UserReference:
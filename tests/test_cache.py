@@ -0,0 +1,53 @@
+from gd.cache import Cache, CachePart, CacheSettings
+
+
+def test_cache_part_evicts_least_recently_used() -> None:
+    part = CachePart(2)
+
+    part.put(1, "one")
+    part.put(2, "two")
+
+    assert part.get(1) == "one"
+
+    part.put(3, "three")
+
+    assert part.get(2) is None
+    assert part.get(1) == "one"
+    assert part.get(3) == "three"
+
+
+def test_cache_part_expires_items() -> None:
+    now = 0.0
+
+    def clock() -> float:
+        return now
+
+    part = CachePart(1, ttl=10.0, clock=clock)
+
+    part.put(1, "one")
+
+    now = 5.0
+
+    assert part.get(1) == "one"
+
+    now = 15.0
+
+    assert part.get(1) is None
+    assert not part
+
+
+def test_cache_part_disabled() -> None:
+    part = CachePart(0)
+
+    part.put(1, "one")
+
+    assert part.get(1) is None
+
+
+def test_cache_uses_settings() -> None:
+    cache = Cache(CacheSettings(level_size=13, level_ttl=42.0))
+
+    assert cache.levels.size == 13
+    assert cache.levels.ttl == 42.0
+
+    assert not cache.users.is_enabled()
@@ -0,0 +1,139 @@
+from asyncio import sleep
+from typing import Iterator
+
+import pytest
+
+from gd.client import Client
+from gd.client_pool import ClientPool
+from gd.credentials import Credentials
+from gd.rate_limiter import RateLimit
+
+CREDENTIALS = [
+    Credentials(1, 11, "one", "password"),
+    Credentials(2, 12, "two", "password"),
+]
+
+
+def test_shared_session_and_cache() -> None:
+    pool = ClientPool()
+
+    clients = [pool.add_credentials(credentials) for credentials in CREDENTIALS]
+
+    assert all(client.session is pool.session for client in clients)
+    assert all(client.cache is pool.cache for client in clients)
+
+
+def test_account_limit() -> None:
+    limit = RateLimit(1.0)
+
+    pool = ClientPool(account_limit=limit)
+
+    rate_limiter = pool.session.http.rate_limiter
+
+    assert rate_limiter is not None
+    assert rate_limiter.account_limit == limit
+
+
+def test_add_requires_login() -> None:
+    pool = ClientPool()
+
+    with pytest.raises(ValueError):
+        pool.add(Client())
+
+
+@pytest.mark.asyncio
+async def test_map_spreads_work() -> None:
+    pool = ClientPool()
+
+    for credentials in CREDENTIALS:
+        pool.add_credentials(credentials)
+
+    async def account_of(client: Client, item: int) -> int:
+        return client.account_id
+
+    account_ids = await pool.map(account_of, range(4))
+
+    assert sorted(account_ids) == [1, 1, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_broadcast() -> None:
+    pool = ClientPool()
+
+    for credentials in CREDENTIALS:
+        pool.add_credentials(credentials)
+
+    async def name_of(client: Client) -> str:
+        return client.name
+
+    assert await pool.broadcast(name_of) == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_map_consumes_items_lazily() -> None:
+    pool = ClientPool()
+
+    for credentials in CREDENTIALS:
+        pool.add_credentials(credentials)
+
+    pulled = 0
+    running = 0
+    max_running = 0
+
+    def generate_items() -> Iterator[int]:
+        nonlocal pulled
+
+        for item in range(100):
+            pulled += 1
+
+            yield item
+
+    async def double(client: Client, item: int) -> int:
+        nonlocal running, max_running
+
+        running += 1
+        max_running = max(max_running, running)
+
+        assert pulled - item <= len(CREDENTIALS)
+
+        await sleep(0)
+
+        running -= 1
+
+        return item * 2
+
+    assert await pool.map(double, generate_items()) == [item * 2 for item in range(100)]
+
+    assert max_running == len(CREDENTIALS)
+
+
+@pytest.mark.asyncio
+async def test_map_propagates_errors() -> None:
+    pool = ClientPool()
+
+    pool.add_credentials(CREDENTIALS[0])
+
+    async def fail(client: Client, item: int) -> int:
+        if item == 3:
+            raise RuntimeError
+
+        return item
+
+    with pytest.raises(RuntimeError):
+        await pool.map(fail, range(10), concurrency=2)
+
+    with pytest.raises(ValueError):
+        await pool.map(fail, range(10), concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_map_empty_pool() -> None:
+    pool = ClientPool()
+
+    async def identity(client: Client, item: int) -> int:
+        return item
+
+    assert await pool.map(identity, []) == []
+
+    with pytest.raises(ValueError):
+        await pool.map(identity, [1])
@@ -0,0 +1,79 @@
+import pytest
+
+from gd.columns import LeaderboardUserColumns, LevelColumns
+from gd.enums import Difficulty
+from gd.models import LeaderboardResponseModel, LeaderboardUserModel, LevelModel
+
+USERS = [
+    LeaderboardUserModel(name=f"user {id}", id=id, place=id, stars=id * 100, demons=id % 3)
+    for id in range(1, 11)
+]
+
+RESPONSE = LeaderboardResponseModel(users=USERS)
+
+
+def test_from_response() -> None:
+    columns = LeaderboardUserColumns.from_response(RESPONSE)
+
+    assert len(columns) == len(USERS)
+
+    assert columns["id"].tolist() == [user.id for user in USERS]
+    assert columns["stars"].typecode == "q"
+
+
+def test_aggregations() -> None:
+    columns = LeaderboardUserColumns.from_response(RESPONSE)
+
+    assert columns.sum("stars") == 5500
+    assert columns.mean("stars") == 550.0
+    assert columns.min("place") == 1
+    assert columns.max("place") == 10
+
+    assert columns.counts("demons") == {0: 3, 1: 4, 2: 3}
+    assert columns.group_sum("demons", "stars") == {0: 1800, 1: 2200, 2: 1500}
+
+
+def test_where() -> None:
+    columns = LeaderboardUserColumns.from_response(RESPONSE).where("stars", lambda s: s > 500)
+
+    assert columns["id"].tolist() == [6, 7, 8, 9, 10]
+
+
+def test_select_mismatched_length() -> None:
+    with pytest.raises(ValueError):
+        LeaderboardUserColumns.from_response(RESPONSE).select([True])
+
+
+def test_sort_by() -> None:
+    columns = LeaderboardUserColumns.from_response(RESPONSE).sort_by("place", reverse=True)
+
+    assert columns["place"].tolist() == list(range(10, 0, -1))
+
+
+def test_extend() -> None:
+    columns = LeaderboardUserColumns.from_response(RESPONSE)
+
+    columns.extend(LeaderboardUserColumns.from_response(RESPONSE))
+
+    assert len(columns) == 2 * len(USERS)
+
+
+def test_levels() -> None:
+    levels = [
+        LevelModel(id=1, downloads=10, difficulty=Difficulty.HARD),
+        LevelModel(id=2, downloads=20, difficulty=Difficulty.EASY),
+    ]
+
+    columns = LevelColumns.from_models(levels)
+
+    assert columns["difficulty"].tolist() == [Difficulty.HARD.value, Difficulty.EASY.value]
+    assert columns.sum("downloads") == 30
+
+
+def test_to_numpy() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    arrays = LeaderboardUserColumns.from_response(RESPONSE).to_numpy()
+
+    assert arrays["stars"].dtype == numpy.int64
+    assert arrays["stars"].sum() == 5500
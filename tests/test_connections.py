@@ -0,0 +1,55 @@
+import pytest
+from aiohttp import ClientSession
+
+from gd.connections import ConnectionSettings, acquire_session, release_session
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_shared() -> None:
+    settings = ConnectionSettings()
+    key = ("http://www.boomlings.com", settings)
+
+    async def create_session() -> ClientSession:
+        return ClientSession(connector=settings.create_connector())
+
+    session = await acquire_session(key, create_session)
+    other = await acquire_session(key, create_session)
+
+    assert session is other
+
+    await release_session(key, session)
+
+    assert not session.closed
+
+    await release_session(key, other)
+
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_replaced_sessions_are_kept() -> None:
+    settings = ConnectionSettings()
+    key = ("http://www.robtopgames.com", settings)
+
+    async def create_session() -> ClientSession:
+        return ClientSession(connector=settings.create_connector())
+
+    session = await acquire_session(key, create_session)
+
+    await session.close()
+
+    replaced = await acquire_session(key, create_session)
+
+    assert replaced is not session
+
+    await release_session(key, session)
+
+    assert await acquire_session(key, create_session) is replaced
+
+    await release_session(key, replaced)
+
+    assert not replaced.closed
+
+    await release_session(key, replaced)
+
+    assert replaced.closed
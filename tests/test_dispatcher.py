@@ -0,0 +1,106 @@
+from asyncio import gather, sleep
+from typing import List
+
+import pytest
+
+from gd.enums import OverflowPolicy
+from gd.events.controller import Controller
+from gd.events.dispatcher import DispatchQueue
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded() -> None:
+    queue = DispatchQueue(concurrency=2)
+
+    running = 0
+    peak = 0
+
+    async def handler() -> None:
+        nonlocal running, peak
+
+        running += 1
+        peak = max(peak, running)
+
+        await sleep(0.01)
+
+        running -= 1
+
+    for _ in range(10):
+        await queue.put(handler())
+
+    await queue.join()
+
+    assert peak == 2
+    assert queue.metrics.handled == 10
+    assert queue.metrics.max_depth >= 8
+
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_priorities() -> None:
+    queue = DispatchQueue(concurrency=1, priorities={"daily": -1})
+
+    order: List[str] = []
+
+    async def handler(name: str) -> None:
+        order.append(name)
+
+    await queue.put(handler("first"), "level")
+
+    await sleep(0)  # let the worker pick the first event up
+
+    await queue.put(handler("level"), "level")
+    await queue.put(handler("daily"), "daily")
+
+    await queue.join()
+
+    assert order == ["first", "daily", "level"]
+
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_drop_newest() -> None:
+    queue = DispatchQueue(concurrency=1, max_size=1, overflow=OverflowPolicy.DROP_NEWEST)
+
+    async def handler() -> None:
+        await sleep(0.01)
+
+    assert await queue.put(handler())
+
+    await sleep(0)  # let the worker pick the first event up
+
+    results = [await queue.put(handler()) for _ in range(2)]
+
+    assert results == [True, False]
+    assert queue.metrics.dropped == 1
+
+    await queue.join()
+
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_block_applies_backpressure() -> None:
+    queue = DispatchQueue(concurrency=1, max_size=1)
+
+    async def handler() -> None:
+        await sleep(0.01)
+
+    await gather(*(queue.put(handler()) for _ in range(5)))
+
+    await queue.join()
+
+    assert queue.metrics.handled == 5
+    assert queue.metrics.max_depth == 1
+
+    queue.close()
+
+
+def test_controller_dispatcher_is_opt_in() -> None:
+    controller = Controller()
+
+    assert controller.dispatcher is None
+
+    controller.loop.close()
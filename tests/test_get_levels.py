@@ -0,0 +1,108 @@
+from typing import List, Optional
+
+import pytest
+
+from gd.cache import Cache, CacheSettings
+from gd.client import Client
+from gd.constants import DEFAULT_PAGE, SEARCH_MANY_PAGE_SIZE
+from gd.errors import NothingFound
+from gd.filters import Filters
+from gd.levels import Level
+from gd.models import PageModel
+from gd.queries import Query
+from gd.run_iterables import Page
+
+SERVER_PAGE_SIZE = 5
+"""The page size of the fake server, which is smaller than the one assumed by the client."""
+
+EXISTING = set(range(1, 51))
+
+CACHE_SIZE = 10
+
+
+class FakeServer:
+    def __init__(self) -> None:
+        self.queries: List[List[int]] = []
+
+    def search(self, query: Query, page: int, filters: Optional[Filters]) -> Page[Level]:
+        assert filters == Filters.search_many()
+
+        level_ids = [int(part) for part in query.parts]
+
+        assert len(level_ids) <= SEARCH_MANY_PAGE_SIZE
+
+        self.queries.append(level_ids)
+
+        found = [level_id for level_id in level_ids if level_id in EXISTING]
+
+        if not found:
+            raise NothingFound("levels")
+
+        start = page * SERVER_PAGE_SIZE
+        stop = start + SERVER_PAGE_SIZE
+
+        levels = [Level.default(level_id) for level_id in found[start:stop]]
+
+        return Page(levels, PageModel(total=len(found), start=start, stop=stop))
+
+
+@pytest.fixture()
+def server(monkeypatch: pytest.MonkeyPatch) -> FakeServer:
+    server = FakeServer()
+
+    async def search_levels_with_page(
+        client: Client,
+        query: Query,
+        page: int = DEFAULT_PAGE,
+        filters: Optional[Filters] = None,
+        **ignored: object,
+    ) -> Page[Level]:
+        return server.search(query, page, filters)
+
+    monkeypatch.setattr(Client, "search_levels_with_page", search_levels_with_page)
+
+    return server
+
+
+@pytest.mark.asyncio
+async def test_get_levels_chunks(server: FakeServer) -> None:
+    level_ids = list(range(1, 36))
+
+    levels = await Client().get_levels(level_ids, get_data=False)
+
+    assert [level.id for level in levels] == level_ids
+
+    chunks = {tuple(query) for query in server.queries}
+
+    assert len(chunks) == 4  # 35 IDs in chunks of 10
+
+    assert len(server.queries) == 7  # full chunks span two pages of the fake server
+
+
+@pytest.mark.asyncio
+async def test_get_levels_partial(server: FakeServer) -> None:
+    level_ids = [1000, 3, 2000, 2, 1, 3000]
+
+    levels = await Client().get_levels(level_ids, get_data=False)
+
+    assert [level.id for level in levels] == [3, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_levels_cache_hits(server: FakeServer) -> None:
+    client = Client(cache=Cache(CacheSettings(level_size=CACHE_SIZE)))
+
+    client.cache.levels.put(7, Level.default(7, "cached"))
+
+    levels = await client.get_levels([7, 8], get_data=False)
+
+    assert [level.id for level in levels] == [7, 8]
+    assert levels[0].name == "cached"
+
+    assert server.queries == [[8]]
+
+    levels = await client.get_levels([7], get_data=False)
+
+    assert [level.name for level in levels] == ["cached"]
+
+    assert server.queries == [[8]]
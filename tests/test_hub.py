@@ -0,0 +1,60 @@
+from asyncio import gather, sleep
+
+import pytest
+
+from gd.events.hub import SubscriptionHub
+
+
+@pytest.mark.asyncio
+async def test_fetch_is_shared_within_tick() -> None:
+    now = 0.0
+
+    def clock() -> float:
+        return now
+
+    hub = SubscriptionHub(tick=10.0, clock=clock)
+
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+
+        calls += 1
+
+        await sleep(0)
+
+        return calls
+
+    assert await gather(*(hub.fetch("level", fetch) for _ in range(5))) == [1] * 5
+    assert await hub.fetch("level", fetch) == 1
+
+    assert await hub.fetch("other", fetch) == 2
+
+    now = 10.0
+
+    assert await hub.fetch("level", fetch) == 3
+
+    assert hub.fetches == 3
+    assert hub.shared == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached() -> None:
+    hub = SubscriptionHub()
+
+    failures = 0
+
+    async def fetch() -> int:
+        nonlocal failures
+
+        if not failures:
+            failures += 1
+
+            raise ValueError
+
+        return 42
+
+    with pytest.raises(ValueError):
+        await hub.fetch("level", fetch)
+
+    assert await hub.fetch("level", fetch) == 42
@@ -0,0 +1,81 @@
+from builtins import getattr as get_attribute
+from gc import collect
+from tracemalloc import get_traced_memory, start, stop
+from types import SimpleNamespace
+from typing import Any, Callable, List
+
+import pytest
+from attrs import fields
+
+from gd.api.hsv import DEFAULT_HSV, HSV
+from gd.api.objects import Object
+from gd.comments import LevelComment
+from gd.levels import Level
+from gd.models import LevelCommentModel, LevelModel
+from gd.users import User
+
+COUNT = 10_000
+
+HOT = (
+    lambda: HSV(),
+    lambda: Object(id=1),
+    lambda: LevelModel(),
+    lambda: LevelCommentModel(),
+    lambda: Level.default(),
+    lambda: LevelComment.default(),
+    lambda: User.default(),
+)
+
+
+def measure(factory: Callable[[], Any], count: int = COUNT) -> float:
+    """Measures the memory (in bytes) retained per instance created by the `factory`."""
+    collect()
+
+    start()
+
+    try:
+        instances: List[Any] = [factory() for _ in range(count)]
+
+        current, _ = get_traced_memory()
+
+    finally:
+        stop()
+
+    del instances
+
+    return current / count
+
+
+def with_dict(instance: Any) -> SimpleNamespace:
+    """Replicates the `instance` as `__dict__`-based object holding the same values."""
+    return SimpleNamespace(
+        **{field.name: get_attribute(instance, field.name) for field in fields(type(instance))}
+    )
+
+
+@pytest.mark.parametrize("factory", HOT)
+def test_hot_classes_are_slotted(factory: Callable[[], Any]) -> None:
+    assert not hasattr(factory(), "__dict__")
+
+
+def test_default_hsv_is_shared() -> None:
+    object = Object(id=1)
+
+    assert object.base_hsv is DEFAULT_HSV
+    assert object.detail_hsv is DEFAULT_HSV
+
+    assert Object.from_robtop("1,1").base_hsv is DEFAULT_HSV
+
+
+def test_object_memory() -> None:
+    slotted = measure(lambda: Object(id=1))
+    baseline = measure(lambda: with_dict(Object(id=1)))
+
+    assert slotted < baseline
+
+
+def test_level_model_memory() -> None:
+    slotted = measure(LevelModel)
+    baseline = measure(lambda: with_dict(LevelModel()))
+
+    assert slotted < baseline
@@ -0,0 +1,32 @@
+from gd.errors import HTTPStatusError
+from gd.metrics import Metrics
+from gd.transport import TransportRequest, TransportResponse
+
+ROUTE = "getGJLevels21.php"
+URL = f"http://www.boomlings.com/database/{ROUTE}"
+
+
+def test_metrics_collects_and_exports() -> None:
+    metrics = Metrics()
+
+    request = TransportRequest("POST", URL, {"str": "test"})
+
+    metrics.on_request_start(request)
+    metrics.on_error(request, HTTPStatusError(503))
+    metrics.on_retry(request, 1, 0.5)
+
+    metrics.on_request_start(request)
+    metrics.on_response(request, TransportResponse(200, {}, b"-1"), 0.2)
+
+    route_metrics = metrics.to_dict()[ROUTE]
+
+    assert route_metrics["requests"] == 2
+    assert route_metrics["retries"] == 1
+    assert route_metrics["error_codes"] == {-1: 1}
+    assert route_metrics["error_types"] == {"HTTPStatusError": 1}
+    assert route_metrics["latency_buckets"]["0.25"] == 1
+
+    prometheus = metrics.to_prometheus()
+
+    assert f'gd_http_requests_total{{route="{ROUTE}"}} 2' in prometheus
+    assert f'gd_http_request_duration_seconds_count{{route="{ROUTE}"}} 1' in prometheus
@@ -0,0 +1,60 @@
+from gd.enums import Difficulty, LevelLength
+from gd.models import LevelCommentInnerModel, LevelModel, SongModel
+from gd.models_lazy import LazyLevelCommentInnerModel, LazyLevelModel, LazySongModel
+
+LEVEL = LevelModel(
+    id=13,
+    name="nekit",
+    description="lazy",
+    difficulty=Difficulty.HARD,
+    downloads=42,
+    length=LevelLength.LONG,
+    coins=3,
+)
+
+
+def test_lazy_level_decodes_on_access() -> None:
+    lazy = LazyLevelModel.from_robtop(LEVEL.to_robtop())
+
+    assert not lazy.values
+
+    assert lazy.id == LEVEL.id
+    assert lazy.name == LEVEL.name
+
+    assert set(lazy.values) == {"id", "name"}
+
+    assert lazy.difficulty == LEVEL.difficulty
+    assert lazy.downloads == LEVEL.downloads
+    assert lazy.description == LEVEL.description
+
+
+def test_lazy_level_round_trip() -> None:
+    string = LEVEL.to_robtop()
+
+    assert LazyLevelModel.from_robtop(string).to_robtop() == string
+
+
+def test_lazy_level_materialize() -> None:
+    level = LazyLevelModel.from_robtop(LEVEL.to_robtop()).materialize()
+
+    assert isinstance(level, LevelModel)
+
+    assert level.id == LEVEL.id
+    assert level.difficulty == LEVEL.difficulty
+    assert level.reward == LEVEL.reward
+    assert level.coins == LEVEL.coins
+
+
+def test_lazy_song_materialize() -> None:
+    song = SongModel(id=1, name="song", artist_name="artist", size=2.5)
+
+    assert LazySongModel.from_robtop(song.to_robtop()).materialize() == song
+
+
+def test_lazy_comment_inner() -> None:
+    inner = LevelCommentInnerModel(level_id=13, content="comment", id=42)
+
+    lazy = LazyLevelCommentInnerModel.from_robtop(inner.to_robtop())
+
+    assert lazy.content == inner.content
+    assert lazy.id == inner.id
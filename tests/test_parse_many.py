@@ -0,0 +1,36 @@
+import pytest
+
+from gd.converter import CONVERTER
+from gd.models import SongModel, parse_many, parse_many_async
+
+SONGS = [SongModel(id=id, name=f"song {id}", artist_name="artist") for id in range(1, 101)]
+
+STRINGS = [song.to_robtop() for song in SONGS]
+
+
+def test_parse_many_in_process() -> None:
+    assert parse_many(SongModel, STRINGS, workers=1) == SONGS
+
+
+def test_parse_many_workers() -> None:
+    assert parse_many(SongModel, STRINGS, workers=2, chunk_size=7) == SONGS
+
+
+def test_parse_many_unstructure() -> None:
+    expected = [CONVERTER.unstructure(song) for song in SONGS]
+
+    assert parse_many(SongModel, STRINGS, workers=2, chunk_size=7, unstructure=True) == expected
+
+
+def test_parse_many_empty() -> None:
+    assert parse_many(SongModel, []) == []
+
+
+def test_parse_many_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        parse_many(SongModel, STRINGS, chunk_size=0)
+
+
+@pytest.mark.asyncio
+async def test_parse_many_async() -> None:
+    assert await parse_many_async(SongModel, STRINGS, workers=2, chunk_size=7) == SONGS
@@ -0,0 +1,68 @@
+import pytest
+
+from gd.enums import ProxyStrategy
+from gd.proxies import Proxy, ProxyPool
+
+PROXIES = [Proxy("http://a"), Proxy("http://b"), Proxy("http://c")]
+
+
+def test_round_robin() -> None:
+    pool = ProxyPool(PROXIES)
+
+    urls = [pool.select().proxy.url for _ in range(4)]
+
+    assert urls == ["http://a", "http://b", "http://c", "http://a"]
+
+
+def test_least_loaded() -> None:
+    pool = ProxyPool(PROXIES, ProxyStrategy.LEAST_LOADED)
+
+    pool.states[0].in_flight = 2
+    pool.states[1].in_flight = 1
+    pool.states[2].in_flight = 3
+
+    assert pool.select().proxy.url == "http://b"
+
+
+def test_sticky() -> None:
+    pool = ProxyPool(PROXIES, ProxyStrategy.STICKY)
+
+    state = pool.select(71)
+
+    assert all(pool.select(71) is state for _ in range(5))
+
+
+def test_quarantine() -> None:
+    now = 0.0
+
+    def clock() -> float:
+        return now
+
+    pool = ProxyPool(PROXIES[:2], failure_threshold=2, quarantine=10.0, clock=clock)
+
+    state = pool.states[0]
+
+    for _ in range(2):
+        state.in_flight += 1
+        pool.release(state, False)
+
+    assert state.is_quarantined(now)
+    assert all(pool.select() is pool.states[1] for _ in range(3))
+
+    now = 10.0
+
+    assert not state.is_quarantined(now)
+
+
+@pytest.mark.asyncio
+async def test_acquire_release() -> None:
+    pool = ProxyPool(PROXIES)
+
+    state = await pool.acquire()
+
+    assert state.in_flight == 1
+
+    pool.release(state, None)
+
+    assert state.in_flight == 0
+    assert state.failures == 0
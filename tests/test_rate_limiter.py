@@ -0,0 +1,139 @@
+from asyncio import create_task, gather, get_running_loop, sleep, wait_for
+from typing import List
+
+import pytest
+
+from gd.enums import RequestPriority
+from gd.rate_limiter import RateLimit, RateLimiter, TokenBucket
+
+LEVELS = "getGJLevels21.php"
+DOWNLOAD = "downloadGJLevel22.php"
+
+RATE = 20.0
+INTERVAL = 1.0 / RATE
+
+
+def test_token_bucket_refills() -> None:
+    now = 0.0
+
+    def clock() -> float:
+        return now
+
+    bucket = TokenBucket(2.0, 2.0, clock=clock)
+
+    bucket.consume()
+    bucket.consume()
+
+    assert bucket.delay() == 0.5
+
+    now = 0.5
+
+    assert bucket.delay() == 0.0
+
+
+def test_rate_limiter_buckets() -> None:
+    limiter = RateLimiter(
+        global_limit=RateLimit(10.0),
+        route_limits={LEVELS: RateLimit(1.0)},
+        account_limit=RateLimit(2.0),
+    )
+
+    assert len(limiter.buckets_for(LEVELS, 71)) == 3
+    assert len(limiter.buckets_for(DOWNLOAD)) == 1
+
+    levels_account_bucket = limiter.buckets_for(LEVELS, 71)[-1]
+    download_account_bucket = limiter.buckets_for(DOWNLOAD, 71)[-1]
+
+    assert levels_account_bucket is download_account_bucket
+
+
+@pytest.mark.asyncio
+async def test_acquire_delays() -> None:
+    limiter = RateLimiter(global_limit=RateLimit(RATE))
+
+    loop = get_running_loop()
+
+    start = loop.time()
+
+    for _ in range(3):
+        await limiter.acquire(LEVELS)
+
+    assert loop.time() - start >= 2 * INTERVAL * 0.9
+
+    assert not limiter.waiting()
+
+
+@pytest.mark.asyncio
+async def test_acquire_priority_order() -> None:
+    limiter = RateLimiter(global_limit=RateLimit(RATE))
+
+    await limiter.acquire(LEVELS)
+
+    order: List[RequestPriority] = []
+
+    async def acquire(priority: RequestPriority) -> None:
+        await limiter.acquire(LEVELS, priority=priority)
+
+        order.append(priority)
+
+    tasks = []
+
+    for priority in (
+        RequestPriority.BACKGROUND,
+        RequestPriority.NORMAL,
+        RequestPriority.INTERACTIVE,
+        RequestPriority.BACKGROUND,
+        RequestPriority.INTERACTIVE,
+    ):
+        tasks.append(create_task(acquire(priority)))
+
+        await sleep(0)
+
+    assert limiter.waiting() == 5
+
+    await gather(*tasks)
+
+    assert order == [
+        RequestPriority.INTERACTIVE,
+        RequestPriority.INTERACTIVE,
+        RequestPriority.NORMAL,
+        RequestPriority.BACKGROUND,
+        RequestPriority.BACKGROUND,
+    ]
+
+    assert not limiter.waiting()
+
+
+@pytest.mark.asyncio
+async def test_acquire_independent_buckets() -> None:
+    limiter = RateLimiter(route_limits={LEVELS: RateLimit(0.01), DOWNLOAD: RateLimit(RATE)})
+
+    await limiter.acquire(LEVELS)
+
+    blocked = create_task(limiter.acquire(LEVELS))
+
+    await sleep(0)
+
+    await wait_for(limiter.acquire(DOWNLOAD), INTERVAL)
+
+    assert not blocked.done()
+
+    blocked.cancel()
+
+
+@pytest.mark.asyncio
+async def test_acquire_cancelled_wakes_next() -> None:
+    limiter = RateLimiter(global_limit=RateLimit(RATE))
+
+    await limiter.acquire(LEVELS)
+
+    first = create_task(limiter.acquire(LEVELS, priority=RequestPriority.INTERACTIVE))
+    second = create_task(limiter.acquire(LEVELS, priority=RequestPriority.BACKGROUND))
+
+    await sleep(0)
+
+    first.cancel()
+
+    await wait_for(second, 4 * INTERVAL)
+
+    assert not limiter.waiting()
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import pytest
+
+from gd.http import HTTPClient
+from gd.response_cache import ResponseCache
+from gd.transport import TransportRequest, TransportResponse
+
+ROUTE = "getGJGauntlets21.php"
+OTHER_ROUTE = "getGJLevels21.php"
+LOGIN_ROUTE = "loginGJAccount.php"
+
+BASE = "http://www.boomlings.com/database"
+
+
+def test_response_cache_expires_responses(tmp_path: Path) -> None:
+    now = 0.0
+
+    def clock() -> float:
+        return now
+
+    cache = ResponseCache(tmp_path / "cache.db", ttls={ROUTE: 10.0}, clock=clock)
+
+    cache.put("key", ROUTE, "1:1:2:Gauntlet")
+    cache.put("other", OTHER_ROUTE, "1:2:3")
+
+    assert cache.get("key", ROUTE) == "1:1:2:Gauntlet"
+    assert cache.get("other", OTHER_ROUTE) is None
+
+    now = 15.0
+
+    assert cache.get("key", ROUTE) is None
+
+    cache.close()
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    now = 0.0
+
+    def clock() -> float:
+        return now
+
+    cache = ResponseCache(tmp_path / "cache.db", ttls={ROUTE: 60.0}, max_size=8, clock=clock)
+
+    cache.put("first", ROUTE, b"1234")
+
+    now = 1.0
+
+    cache.put("second", ROUTE, b"5678")
+
+    now = 2.0
+
+    assert cache.get("first", ROUTE) == b"1234"
+
+    now = 3.0
+
+    cache.put("third", ROUTE, b"9012")
+
+    assert cache.get("second", ROUTE) is None
+    assert cache.get("first", ROUTE) == b"1234"
+    assert cache.get("third", ROUTE) == b"9012"
+
+    cache.close()
+
+
+class CountingTransport:
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        self.requests += 1
+
+        return TransportResponse(200, {}, b"1:1:2:Gauntlet")
+
+
+@pytest.mark.asyncio
+async def test_http_client_caches_public_responses_only(tmp_path: Path) -> None:
+    transport = CountingTransport()
+
+    cache = ResponseCache(tmp_path / "cache.db", ttls={ROUTE: 60.0, LOGIN_ROUTE: 60.0})
+
+    client = HTTPClient(transport=transport, response_cache=cache)
+
+    url = f"{BASE}/{ROUTE}"
+
+    for _ in range(2):
+        await client.request("POST", url, data={"secret": "Wmfd2893gb7"})
+
+    assert transport.requests == 1
+
+    for _ in range(2):
+        await client.request("POST", url, data={"secret": "Wmfd2893gb7", "gjp2": "hash"})
+
+    assert transport.requests == 3
+
+    for _ in range(2):
+        await client.request("POST", f"{BASE}/accounts/{LOGIN_ROUTE}", data={"userName": "name"})
+
+    assert transport.requests == 5
+
+    cache.close()
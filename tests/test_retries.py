@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from gd.retries import DEFAULT_RETRY_STATUSES, INFINITE, RetryPolicy, parse_retry_after
+
+GET = "GET"
+POST = "POST"
+
+READ = "getGJLevels21.php"
+WRITE = "uploadGJComment21.php"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_compute_attempts() -> None:
+    policy = RetryPolicy(idempotent=frozenset((READ,)))
+
+    assert policy.compute_attempts(POST, READ, 0) == 1
+    assert policy.compute_attempts(POST, READ, 3) == 4
+    assert policy.compute_attempts(POST, READ, -1) == INFINITE
+
+    assert policy.compute_attempts(GET, WRITE, 2) == 3
+
+
+def test_compute_attempts_non_idempotent() -> None:
+    policy = RetryPolicy(budgets={WRITE: 5}, idempotent=frozenset((READ,)))
+
+    assert not policy.is_idempotent(POST, WRITE)
+
+    assert policy.compute_attempts(POST, WRITE, 3) == 1
+    assert policy.compute_attempts(POST, WRITE, -1) == 1
+
+
+def test_compute_attempts_budgets() -> None:
+    policy = RetryPolicy(budgets={READ: 1}, idempotent=frozenset((READ,)))
+
+    assert policy.compute_attempts(POST, READ, 10) == 2
+    assert policy.compute_attempts(POST, READ, -1) == 2
+
+
+def test_should_retry_status() -> None:
+    policy = RetryPolicy()
+
+    for status in DEFAULT_RETRY_STATUSES:
+        assert policy.should_retry_status(status)
+
+    assert not policy.should_retry_status(200)
+    assert not policy.should_retry_status(403)
+    assert not policy.should_retry_status(404)
+
+    custom = RetryPolicy(statuses=frozenset((418,)))
+
+    assert custom.should_retry_status(418)
+    assert not custom.should_retry_status(503)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [("0", 0.0), ("5", 5.0), (" 2.5 ", 2.5), ("-3", 0.0)]
+)
+def test_parse_retry_after_seconds(value: str, expected: float) -> None:
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_date() -> None:
+    date_time = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    delay = parse_retry_after(format_datetime(date_time, usegmt=True))
+
+    assert delay is not None
+    assert 28.0 <= delay <= 30.0
+
+
+def test_parse_retry_after_past_date() -> None:
+    date_time = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    assert parse_retry_after(format_datetime(date_time, usegmt=True)) == 0.0
+
+
+@pytest.mark.parametrize("value", ["", "soon", "Tue, 99 Foo 2024"])
+def test_parse_retry_after_invalid(value: str) -> None:
+    assert parse_retry_after(value) is None
+
+
+def test_compute_delay_retry_after() -> None:
+    policy = RetryPolicy(multiply=0.01, base=1.0)
+
+    backoff = policy.create_backoff()
+
+    assert policy.compute_delay(backoff, "10") == 10.0
+    assert policy.compute_delay(backoff, "invalid") <= 0.01
+    assert policy.compute_delay(backoff) <= 0.01
+
+
+def test_compute_delay_ignore_retry_after() -> None:
+    policy = RetryPolicy(multiply=0.01, base=1.0, honor_retry_after=False)
+
+    assert policy.compute_delay(policy.create_backoff(), "10") <= 0.01
+
+
+def test_can_wait() -> None:
+    clock = FakeClock()
+
+    policy = RetryPolicy(max_time=10.0, clock=clock)
+
+    started_at = clock()
+
+    assert policy.can_wait(started_at, 10.0)
+    assert not policy.can_wait(started_at, 10.5)
+
+    clock.now = 8.0
+
+    assert policy.can_wait(started_at, 2.0)
+    assert not policy.can_wait(started_at, 3.0)
+
+
+def test_can_wait_unbounded() -> None:
+    clock = FakeClock()
+
+    policy = RetryPolicy(max_time=None, clock=clock)
+
+    clock.now = 1_000_000.0
+
+    assert policy.can_wait(0.0, 1_000_000.0)
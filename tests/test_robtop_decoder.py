@@ -0,0 +1,68 @@
+from enum import Enum
+
+from wraps import wrap_option
+
+from gd.robtop_decoder import Decoder, DecoderField, int_into
+
+
+class Kind(Enum):
+    DEFAULT = 0
+    OTHER = 1
+
+
+DEFAULT_ID = 0
+EMPTY = ""
+
+option_int = wrap_option(int)
+
+DECODER = Decoder(
+    ":",
+    (
+        DecoderField(1, "id", int, DEFAULT_ID),
+        DecoderField(2, "name", default=EMPTY),
+        DecoderField(3, "kind", int_into(Kind), Kind.DEFAULT),
+        DecoderField(4, "rank", int, DEFAULT_ID, skip_empty=True),
+        DecoderField(5, "steps", option_int, DEFAULT_ID, optional=True),
+        DecoderField(6, "tags", str.split, factory=list),
+    ),
+)
+
+
+def test_decode() -> None:
+    values = DECODER.decode("1:13:2:nekit:3:1:4:42:5:7:6:a b")
+
+    assert values == dict(id=13, name="nekit", kind=Kind.OTHER, rank=42, steps=7, tags=["a", "b"])
+
+
+def test_decode_defaults() -> None:
+    values = DECODER.decode("")
+
+    assert values == dict(
+        id=DEFAULT_ID, name=EMPTY, kind=Kind.DEFAULT, rank=DEFAULT_ID, steps=0, tags=[]
+    )
+
+
+def test_decode_factories_are_fresh() -> None:
+    assert DECODER.decode("")["tags"] is not DECODER.decode("")["tags"]
+
+
+def test_decode_skips_empty_and_null() -> None:
+    values = DECODER.decode("4::5:invalid")
+
+    assert values["rank"] == DEFAULT_ID
+    assert values["steps"] == DEFAULT_ID
+
+
+def test_decode_ignores_unknown_keys() -> None:
+    values = DECODER.decode("1:13:42:unknown:2:nekit")
+
+    assert values["id"] == 13
+    assert values["name"] == "nekit"
+
+
+def test_decode_last_value_wins() -> None:
+    assert DECODER.decode("1:13:1:42")["id"] == 42
+
+
+def test_decode_ignores_trailing_key() -> None:
+    assert DECODER.decode("1:13:2")["name"] == EMPTY
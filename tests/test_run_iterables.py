@@ -0,0 +1,110 @@
+from asyncio import sleep
+from typing import AsyncIterator, List
+
+import pytest
+
+from gd.client import Client
+from gd.errors import NothingFound
+from gd.levels import Level
+from gd.models import PageModel
+from gd.run_iterables import Page, crawl_pages, stream_iterables
+
+PAGE_SIZE = 3
+LAST_PAGE = 7
+CONCURRENCY = 4
+
+
+@pytest.mark.asyncio
+async def test_stream_iterables_stops_on_nothing_found() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def page(index: int) -> AsyncIterator[int]:
+        nonlocal in_flight, peak
+
+        in_flight += 1
+
+        peak = max(peak, in_flight)
+
+        try:
+            await sleep(0)
+
+            if index > LAST_PAGE:
+                raise NothingFound("levels")
+
+            for item in range(PAGE_SIZE):
+                yield index * PAGE_SIZE + item
+
+        finally:
+            in_flight -= 1
+
+    items = [
+        item
+        async for item in stream_iterables(
+            (page(index) for index in range(1000)), concurrency=CONCURRENCY
+        )
+    ]
+
+    assert items == list(range((LAST_PAGE + 1) * PAGE_SIZE))
+    assert peak <= CONCURRENCY
+
+
+TOTAL = 25
+
+
+@pytest.mark.asyncio
+async def test_crawl_pages_stops_at_total() -> None:
+    fetched = []
+
+    async def fetch_page(page: int) -> Page[int]:
+        fetched.append(page)
+
+        start = page * 10
+
+        items = list(range(start, min(start + 10, TOTAL)))
+
+        return Page(items, PageModel(TOTAL, start, 10))
+
+    items = [item async for item in crawl_pages(fetch_page)]
+
+    assert items == list(range(TOTAL))
+    assert fetched == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_client_pages_are_streamed(monkeypatch: pytest.MonkeyPatch) -> None:
+    requested: List[int] = []
+
+    in_flight = 0
+    peak = 0
+
+    async def search_levels_with_page(client: Client, page: int, **ignored: object) -> Page[Level]:
+        nonlocal in_flight, peak
+
+        requested.append(page)
+
+        in_flight += 1
+
+        peak = max(peak, in_flight)
+
+        try:
+            await sleep(0)
+
+            if page > LAST_PAGE:
+                raise NothingFound("levels")
+
+            levels = [Level.default(page * PAGE_SIZE + item) for item in range(PAGE_SIZE)]
+
+            return Page(levels, PageModel(start=page * PAGE_SIZE, stop=(page + 1) * PAGE_SIZE))
+
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(Client, "search_levels_with_page", search_levels_with_page)
+
+    levels = await Client().search_levels(pages=range(1000), concurrency=CONCURRENCY).list()
+
+    assert [level.id for level in levels] == list(range((LAST_PAGE + 1) * PAGE_SIZE))
+
+    assert peak <= CONCURRENCY
+    assert len(requested) <= LAST_PAGE + 1 + CONCURRENCY
@@ -0,0 +1,34 @@
+from random import Random
+
+from gd.events.scheduler import PollScheduler
+
+
+def test_backoff_and_speedup() -> None:
+    scheduler = PollScheduler(min_delay=10.0, max_delay=40.0, backoff=2.0, speedup=0.5, jitter=0.0)
+
+    assert [scheduler.observe(False) for _ in range(3)] == [20.0, 40.0, 40.0]
+
+    assert scheduler.observe(True) == 20.0
+    assert scheduler.observe(True) == 10.0
+    assert scheduler.observe(True) == 10.0
+
+
+def test_jitter() -> None:
+    scheduler = PollScheduler(min_delay=10.0, jitter=0.1, random=Random(42))
+
+    delays = [scheduler.spread(100.0) for _ in range(100)]
+
+    assert all(90.0 <= delay <= 110.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_align_never_early() -> None:
+    scheduler = PollScheduler(jitter=0.1, random=Random(42))
+
+    assert all(100.0 <= scheduler.align(100.0) <= 110.0 for _ in range(100))
+
+
+def test_initial_delay() -> None:
+    scheduler = PollScheduler(min_delay=10.0, random=Random(42))
+
+    assert all(0.0 <= scheduler.initial_delay() <= 10.0 for _ in range(100))
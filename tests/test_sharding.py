@@ -0,0 +1,167 @@
+from queue import Queue
+from time import monotonic, sleep
+from typing import Any, List
+
+import pytest
+from attrs import define, field
+
+from gd.client import Client
+from gd.comments import LevelComment
+from gd.events.listeners import Listener
+from gd.events.sharding import ShardedController, forward_events, load_entities
+from gd.levels import Level
+from gd.users import UserReference
+
+
+@define()
+class FakeListener:
+    client: Any = field()
+
+
+@define(slots=False)
+class FakeClient:
+    pass
+
+
+def test_partition() -> None:
+    listeners = [FakeListener(FakeClient()) for _ in range(5)]
+
+    controller = ShardedController(listeners, shards=2)  # type: ignore
+
+    shards = controller.partition()
+
+    assert [[index for index, _ in shard] for shard in shards] == [[0, 2, 4], [1, 3]]
+
+
+def test_partition_omits_empty_shards() -> None:
+    controller = ShardedController([FakeListener(FakeClient())], shards=4)  # type: ignore
+
+    assert len(controller.partition()) == 1
+
+
+def test_invalid_shards() -> None:
+    with pytest.raises(ValueError):
+        ShardedController(shards=0)
+
+
+def create_level() -> Level:
+    level = Level.default(42, "level")
+
+    level.creator = UserReference(id=13, name="nekit", account_id=71)
+
+    return level
+
+
+@pytest.mark.asyncio
+async def test_forward_events() -> None:
+    client = FakeClient()
+
+    queue: Queue[Any] = Queue()
+
+    forward_events(queue, [(3, FakeListener(client)), (4, FakeListener(client))])  # type: ignore
+
+    level = create_level().attach_client(client)  # type: ignore
+
+    await client.on_daily(level)  # type: ignore
+
+    index, name, data = queue.get_nowait()
+
+    assert (index, name) == (3, "daily")
+
+    other = FakeClient()
+
+    (forwarded,) = load_entities(data, other)  # type: ignore
+
+    assert forwarded == level
+    assert forwarded.client is other
+    assert forwarded.creator.name == "nekit"
+    assert forwarded.creator.account_id == 71
+
+
+@define()
+class DispatchingClient:
+    dispatched: List[Any] = field(factory=list)
+
+    async def dispatch_level_comment(self, level: Level, comment: LevelComment) -> None:
+        self.dispatched.append((level, comment))
+
+
+@pytest.mark.asyncio
+async def test_dispatch() -> None:
+    shard_client = FakeClient()
+    client = DispatchingClient()
+
+    level = create_level().attach_client(shard_client)  # type: ignore
+
+    comment = LevelComment.default(7)
+
+    comment.author = UserReference(id=13, name="nekit", account_id=71)
+    comment.level = level
+
+    comment.attach_client(shard_client)  # type: ignore
+
+    queue: Queue[Any] = Queue()
+
+    forward_events(queue, [(0, FakeListener(shard_client))])  # type: ignore
+
+    await shard_client.on_level_comment(level, comment)  # type: ignore
+
+    controller = ShardedController([FakeListener(client)], shards=1)  # type: ignore
+
+    await controller.dispatch(queue.get_nowait())
+
+    ((dispatched_level, dispatched_comment),) = client.dispatched
+
+    assert dispatched_level == level
+    assert dispatched_level.creator.name == "nekit"
+    assert dispatched_level.client is client
+
+    assert dispatched_comment == comment
+    assert dispatched_comment.author.name == "nekit"
+    assert dispatched_comment.client is client
+    assert dispatched_comment.author.client is client
+
+
+SPAWN_TIMEOUT = 30.0
+SPAWN_POLL = 0.1
+
+
+@define(slots=False)
+class RecordingClient(Client):
+    received: List[Level] = field(factory=list, init=False)
+
+    async def on_daily(self, daily: Level) -> None:
+        self.received.append(daily)
+
+
+@define()
+class DailyProducer(Listener):
+    async def step(self) -> None:
+        await self.client.dispatch_daily(create_level())
+
+
+def test_spawn_shard() -> None:
+    client = RecordingClient()
+
+    client.add_listener(DailyProducer(client, delay=SPAWN_POLL))
+
+    controller = client.create_sharded_controller(shards=1)
+
+    controller.start()
+
+    try:
+        deadline = monotonic() + SPAWN_TIMEOUT
+
+        while not client.received and monotonic() < deadline:
+            sleep(SPAWN_POLL)
+
+    finally:
+        controller.stop()
+
+    assert client.received
+
+    level = client.received[0]
+
+    assert level == create_level()
+    assert level.creator.name == "nekit"
+    assert level.client is client
@@ -0,0 +1,32 @@
+from asyncio import gather, sleep
+
+import pytest
+
+from gd.single_flight import SingleFlight, canonicalize
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_calls() -> None:
+    single_flight: SingleFlight[str, int] = SingleFlight()
+
+    calls = 0
+
+    async def function() -> int:
+        nonlocal calls
+
+        calls += 1
+
+        await sleep(0)
+
+        return calls
+
+    results = await gather(*(single_flight.run("key", function) for _ in range(10)))
+
+    assert results == [1] * 10
+    assert not single_flight.in_flight()
+
+    assert await single_flight.run("key", function) == 2
+
+
+def test_canonicalize_ignores_random_keys() -> None:
+    assert canonicalize({"levelID": 1, "rs": "random", "chk": "check"}) == (("levelID", "1"),)
@@ -0,0 +1,33 @@
+from gd.streaming import SectionSplitter, Splitter
+
+
+def test_splitter_joins_chunks() -> None:
+    splitter = Splitter(":")
+
+    assert splitter.feed("1:a") == ["1"]
+    assert splitter.feed("bc") == []
+    assert splitter.feed("d:2:") == ["abcd", "2"]
+    assert splitter.finish() == ""
+
+
+def test_section_splitter() -> None:
+    string = "1:1|1:2#2:user#~1~|~2~#9999:0:10#hash"
+
+    splitter = SectionSplitter()
+
+    items = []
+
+    for index in range(0, len(string), 3):
+        items.extend(splitter.feed(string[index : index + 3]))
+
+    items.extend(splitter.finish())
+
+    assert items == [
+        (0, "1:1"),
+        (0, "1:2"),
+        (1, "2:user"),
+        (2, "~1~"),
+        (2, "~2~"),
+        (3, "9999:0:10"),
+        (4, "hash"),
+    ]
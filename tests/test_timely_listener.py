@@ -0,0 +1,85 @@
+from asyncio import sleep
+from typing import Any, List
+
+import pytest
+from attrs import define, field
+from pendulum import duration
+
+from gd.enums import TimelyType
+from gd.events.listeners import DailyListener, WeeklyListener
+from gd.models import TimelyInfoModel
+
+
+@define()
+class FakeClient:
+    timely_infos: List[TimelyInfoModel] = field()
+
+    probes: int = field(default=0)
+    downloads: int = field(default=0)
+    dispatched: List[Any] = field(factory=list)
+
+    async def get_timely_info(self, type: TimelyType) -> TimelyInfoModel:
+        timely_info = self.timely_infos[self.probes]
+
+        self.probes += 1
+
+        return timely_info
+
+    async def get_timely_level(self, timely_info: TimelyInfoModel) -> Any:
+        self.downloads += 1
+
+        return timely_info.id
+
+    async def dispatch_daily(self, level: Any) -> None:
+        self.dispatched.append(level)
+
+
+def daily(id: int, seconds: float) -> TimelyInfoModel:
+    return TimelyInfoModel(id=id, type=TimelyType.DAILY, cooldown=duration(seconds=seconds))
+
+
+@pytest.mark.asyncio
+async def test_daily_listener_downloads_only_on_change() -> None:
+    client = FakeClient([daily(1, 100.0), daily(1, 90.0), daily(2, 86400.0)])
+
+    listener = DailyListener(client)  # type: ignore
+
+    for _ in range(3):
+        await listener.step()
+
+    assert client.probes == 3
+    assert client.downloads == 1
+    assert listener.level_cache == 2
+
+    await sleep(0)
+
+    assert client.dispatched == [2]
+
+
+def test_compute_delay() -> None:
+    listener = DailyListener(None, delay=10.0, margin=5.0, max_delay=3600.0)  # type: ignore
+
+    assert listener.compute_delay(daily(1, 100.0)) == 105.0
+    assert listener.compute_delay(daily(1, 0.0)) == 10.0
+    assert listener.compute_delay(daily(1, 86400.0)) == 3600.0
+
+
+def test_deprecated_caches() -> None:
+    listener = DailyListener(None)  # type: ignore
+
+    listener.level_cache = 13  # type: ignore
+
+    with pytest.deprecated_call():
+        assert listener.daily_cache == 13
+
+    with pytest.deprecated_call():
+        listener.daily_cache = 42  # type: ignore
+
+    assert listener.level_cache == 42
+
+    weekly_listener = WeeklyListener(None)  # type: ignore
+
+    weekly_listener.level_cache = 7  # type: ignore
+
+    with pytest.deprecated_call():
+        assert weekly_listener.weekly_cache == 7
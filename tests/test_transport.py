@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+
+from gd.errors import ReplayMissing
+from gd.transport import (
+    RecordingTransport,
+    ReplayTransport,
+    TransportRequest,
+    TransportResponse,
+)
+
+URL = "http://www.boomlings.com/database/downloadGJLevel22.php"
+
+
+class StaticTransport:
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        return TransportResponse(200, {}, b"1:1:2:Level")
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay(tmp_path: Path) -> None:
+    recording = RecordingTransport(StaticTransport(), tmp_path)
+
+    request = TransportRequest("POST", URL, {"levelID": 1, "rs": "abc"})
+
+    await recording.send(request)
+
+    replay = ReplayTransport(tmp_path)
+
+    replayed_request = TransportRequest("POST", URL, {"levelID": 1, "rs": "xyz"})
+
+    response = await replay.send(replayed_request)
+
+    assert response.status == 200
+    assert response.body == b"1:1:2:Level"
+
+    with pytest.raises(ReplayMissing):
+        await replay.send(TransportRequest("POST", URL, {"levelID": 2}))
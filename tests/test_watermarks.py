@@ -0,0 +1,94 @@
+from pathlib import Path
+from typing import Any, Callable, List
+
+import pytest
+from attrs import frozen
+
+from gd.events import watermarks
+from gd.events.listeners import LevelListener, MessageListener
+from gd.events.watermarks import SeenRing, Watermark, WatermarkStore
+
+
+@frozen()
+class Item:
+    id: int
+
+
+def items(*ids: int) -> list:
+    return [Item(id) for id in ids]
+
+
+def test_seen_ring_is_bounded() -> None:
+    ring = SeenRing(3)
+
+    for id in range(5):
+        ring.add(id)
+
+    assert len(ring) == 3
+    assert 1 not in ring
+    assert 4 in ring
+
+
+def test_ordered_watermark() -> None:
+    watermark = Watermark()
+
+    assert watermark.observe(items(3, 2, 1)) == items(3, 2, 1)
+    assert watermark.observe(items(5, 4, 3, 2)) == items(5, 4)
+    assert watermark.high == 5
+
+
+def test_unordered_watermark() -> None:
+    watermark = Watermark()
+
+    watermark.observe(items(10, 20), ordered=False)
+
+    assert watermark.observe(items(5, 10, 20), ordered=False) == items(5)
+
+
+@pytest.mark.asyncio
+async def test_store_persists(tmp_path: Path) -> None:
+    path = tmp_path / "watermarks.json"
+
+    store = WatermarkStore(path)
+
+    assert await store.observe("messages:1", items(2, 1)) is None
+    assert await store.observe("messages:1", items(3, 2)) == items(3)
+
+    restored = WatermarkStore(path)
+
+    assert await restored.observe("messages:1", items(4, 3)) == items(4)
+
+
+@pytest.mark.asyncio
+async def test_store_loads_in_executor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "watermarks.json"
+
+    await WatermarkStore(path).observe("messages:1", items(2, 1))
+
+    called: List[str] = []
+
+    async def run_blocking(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        called.append(function.__name__)
+
+        return function(*args, **kwargs)
+
+    monkeypatch.setattr(watermarks, "run_blocking", run_blocking)
+
+    restored = WatermarkStore(path)
+
+    assert await restored.observe("messages:1", items(3, 2)) == items(3)
+
+    assert called == ["read", "save"]
+
+
+@pytest.mark.asyncio
+async def test_deprecated_caches() -> None:
+    listener = MessageListener(None)  # type: ignore
+
+    await listener.observe("messages:1", items(2, 1))
+
+    with pytest.deprecated_call():
+        assert listener.messages_cache == items(2, 1)
+
+    with pytest.deprecated_call():
+        assert LevelListener(None).levels_cache == []  # type: ignore